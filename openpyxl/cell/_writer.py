@@ -6,7 +6,11 @@ from openpyxl import LXML
 from openpyxl.utils.datetime import to_excel, to_ISO8601
 from datetime import timedelta
 
-from openpyxl.worksheet.formula import DataTableFormula, ArrayFormula
+from openpyxl.worksheet.formula import (
+    DataTableFormula,
+    ArrayFormula,
+    SharedFormula,
+)
 from openpyxl.cell.rich_text import CellRichText
 
 def _set_attributes(cell, styled=None):
@@ -42,9 +46,31 @@ def _set_attributes(cell, styled=None):
     return value, attrs
 
 
-def etree_write_cell(xf, worksheet, cell, styled=None):
+def _cached_value(cell, attrs):
+    """
+    Value calculated for a formula by the workbook's evaluator, if any.
+    The type of the value is added to the attributes.
+    """
+    evaluator = getattr(getattr(cell.parent, "parent", None), "_evaluator", None)
+    if evaluator is None:
+        return
+    from openpyxl.formula.functions import Error # uses NumPy
+    value = evaluator.cached(cell)
+    if isinstance(value, bool):
+        attrs['t'] = "b"
+        return int(value)
+    if isinstance(value, Error):
+        attrs['t'] = "e"
+    elif isinstance(value, str):
+        attrs['t'] = "str"
+    return value
+
+
+def etree_write_cell(xf, worksheet, cell, styled=None, shared=None):
 
     value, attributes = _set_attributes(cell, styled)
+    if cell.data_type == 'f':
+        cached = _cached_value(cell, attributes)
 
     el = Element("c", attributes)
     if value is None or value == "":
@@ -54,7 +80,10 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
     if cell.data_type == 'f':
         attrib = {}
 
-        if isinstance(value, ArrayFormula):
+        if shared and (cell.row, cell.column) in shared:
+            attrib, value = shared[cell.row, cell.column]
+
+        elif isinstance(value, ArrayFormula):
             attrib = dict(value)
             value = value.text
 
@@ -62,10 +91,13 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
             attrib = dict(value)
             value = None
 
+        elif isinstance(value, SharedFormula):
+            value = value.formula(cell.row, cell.column)
+
         formula = SubElement(el, 'f', attrib)
         if value is not None and not attrib.get('t') == "dataTable":
             formula.text = value[1:]
-            value = None
+        value = cached
 
     if cell.data_type == 's':
         if isinstance(value, CellRichText):
@@ -86,8 +118,10 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
     xf.write(el)
 
 
-def lxml_write_cell(xf, worksheet, cell, styled=False):
+def lxml_write_cell(xf, worksheet, cell, styled=False, shared=None):
     value, attributes = _set_attributes(cell, styled)
+    if cell.data_type == 'f':
+        cached = _cached_value(cell, attributes)
 
     if value == '' or value is None:
         with xf.element("c", attributes):
@@ -97,7 +131,10 @@ def lxml_write_cell(xf, worksheet, cell, styled=False):
         if cell.data_type == 'f':
             attrib = {}
 
-            if isinstance(value, ArrayFormula):
+            if shared and (cell.row, cell.column) in shared:
+                attrib, value = shared[cell.row, cell.column]
+
+            elif isinstance(value, ArrayFormula):
                 attrib = dict(value)
                 value = value.text
 
@@ -105,10 +142,13 @@ def lxml_write_cell(xf, worksheet, cell, styled=False):
                 attrib = dict(value)
                 value = None
 
+            elif isinstance(value, SharedFormula):
+                value = value.formula(cell.row, cell.column)
+
             with xf.element('f', attrib):
                 if value is not None and not attrib.get('t') == "dataTable":
                     xf.write(value[1:])
-                    value = None
+            value = cached
 
         if cell.data_type == 's':
             if isinstance(value, CellRichText):
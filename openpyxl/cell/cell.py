@@ -17,16 +17,22 @@ import re
 
 
 from openpyxl.compat import (
-    NUMERIC_TYPES,
+    PYTHON_NUMERIC_TYPES,
+    numpy_types,
 )
 
 from openpyxl.utils.exceptions import IllegalCharacterError
 
 from openpyxl.utils import get_column_letter
+from openpyxl.utils.indexed_list import shard_lock
 from openpyxl.styles import numbers, is_date_format
 from openpyxl.styles.styleable import StyleableObject
 from openpyxl.worksheet.hyperlink import Hyperlink
-from openpyxl.worksheet.formula import DataTableFormula, ArrayFormula
+from openpyxl.worksheet.formula import (
+    DataTableFormula,
+    ArrayFormula,
+    SharedFormula,
+)
 from openpyxl.cell.rich_text import CellRichText
 
 # constants
@@ -40,7 +46,6 @@ TIME_FORMATS = {
                 }
 
 STRING_TYPES = (str, bytes, CellRichText)
-KNOWN_TYPES = NUMERIC_TYPES + TIME_TYPES + STRING_TYPES + (bool, type(None))
 
 ILLEGAL_CHARACTERS_RE = re.compile(r'[\000-\010]|[\013-\014]|[\016-\037]')
 ERROR_CODES = ('#NULL!', '#DIV/0!', '#VALUE!', '#REF!', '#NAME?', '#NUM!',
@@ -63,7 +68,7 @@ _TYPES = {int:'n', float:'n', str:'s', bool:'b'}
 
 
 def get_type(t, value):
-    if isinstance(value, NUMERIC_TYPES):
+    if isinstance(value, PYTHON_NUMERIC_TYPES) or isinstance(value, numpy_types()):
         dt = 'n'
     elif isinstance(value, STRING_TYPES):
         dt = 's'
@@ -103,6 +108,7 @@ class Cell(StyleableObject):
         'parent',
         '_hyperlink',
         '_comment',
+        '_cached_value',
                  )
 
     def __init__(self, worksheet, row=None, column=None, value=None, style_array=None):
@@ -114,6 +120,7 @@ class Cell(StyleableObject):
         # _value is the stored value, while value is the displayed value
         self._value = None
         self._hyperlink = None
+        self._cached_value = None
         self.data_type = 'n'
         if value is not None:
             self.value = value
@@ -201,6 +208,21 @@ class Cell(StyleableObject):
                 self.data_type = 'e'
 
         self._value = value
+        self._cached_value = None
+        if getattr(getattr(self.parent, "parent", None), "_references", None) is not None:
+            self._track_value()
+
+
+    def _track_value(self):
+        """
+        Keep the workbook's index of formula references up to date. The index
+        is shared by all worksheets so it is changed under a lock.
+        """
+        wb = getattr(self.parent, "parent", None)
+        references = getattr(wb, "_references", None)
+        if references is not None and (self.data_type == "f" or references.tracks_cells):
+            with shard_lock(references):
+                references.changed(self)
 
 
     @property
@@ -210,7 +232,10 @@ class Cell(StyleableObject):
         :type: depends on the value (string, float, int or
             :class:`datetime.datetime`)
         """
-        return self._value
+        value = self._value
+        if value.__class__ is SharedFormula:
+            return value.formula(self.row, self.column)
+        return value
 
     @value.setter
     def value(self, value):
@@ -220,7 +245,16 @@ class Cell(StyleableObject):
     @property
     def internal_value(self):
         """Always returns the value for excel."""
-        return self._value
+        return self.value
+
+    @property
+    def cached_value(self):
+        """The value of the formula when the workbook was last calculated.
+
+        Only available if the workbook was loaded with ``cached_values=True``
+        and the cell has not been assigned since.
+        """
+        return self._cached_value
 
     @property
     def hyperlink(self):
@@ -309,6 +343,7 @@ class MergedCell(StyleableObject):
     __slots__ = ('row', 'column')
 
     _value = None
+    _cached_value = None
     data_type = "n"
     comment = None
     hyperlink = None
@@ -326,7 +361,20 @@ class MergedCell(StyleableObject):
     coordinate = Cell.coordinate
     _comment = comment
     value = _value
+    cached_value = _cached_value
 
 
 def WriteOnlyCell(ws=None, value=None):
     return Cell(worksheet=ws, column=1, row=1, value=value)
+
+
+def __getattr__(name):
+    # NUMERIC_TYPES and KNOWN_TYPES include NumPy types and so import it on
+    # first use
+    if name in ("NUMERIC_TYPES", "KNOWN_TYPES"):
+        from openpyxl import compat
+        types = compat.NUMERIC_TYPES
+        if name == "KNOWN_TYPES":
+            types += TIME_TYPES + STRING_TYPES + (bool, type(None))
+        return types
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,13 +5,16 @@ from openpyxl.utils import get_column_letter
 from openpyxl.utils.datetime import from_excel
 from openpyxl.styles import is_date_format
 from openpyxl.styles.numbers import BUILTIN_FORMATS, BUILTIN_FORMATS_MAX_SIZE
+from openpyxl.worksheet.formula import SharedFormula
 
 
 class ReadOnlyCell(object):
 
-    __slots__ =  ('parent', 'row', 'column', '_value', 'data_type', '_style_id')
+    __slots__ =  ('parent', 'row', 'column', '_value', 'data_type', '_style_id',
+                  'cached_value')
 
-    def __init__(self, sheet, row, column, value, data_type='n', style_id=0):
+    def __init__(self, sheet, row, column, value, data_type='n', style_id=0,
+                 cached_value=None):
         self.parent = sheet
         self._value = None
         self.row = row
@@ -19,10 +22,13 @@ class ReadOnlyCell(object):
         self.data_type = data_type
         self.value = value
         self._style_id = style_id
+        self.cached_value = cached_value
 
 
     def __eq__(self, other):
         for a in self.__slots__:
+            if a == "_value":
+                a = "value"
             if getattr(self, a) != getattr(other, a):
                 return
         return True
@@ -103,11 +109,14 @@ class ReadOnlyCell(object):
 
     @property
     def internal_value(self):
-        return self._value
+        return self.value
 
     @property
     def value(self):
-        return self._value
+        value = self._value
+        if value.__class__ is SharedFormula:
+            return value.formula(self.row, self.column)
+        return value
 
     @value.setter
     def value(self, value):
@@ -121,6 +130,7 @@ class EmptyCell(object):
     __slots__ = ()
 
     value = None
+    cached_value = None
     is_date = False
     font = None
     border = None
@@ -4,7 +4,7 @@
 RichText definition
 """
 from copy import copy
-from openpyxl.compat import NUMERIC_TYPES
+from openpyxl.compat import PYTHON_NUMERIC_TYPES, numpy_types
 from openpyxl.cell.text import InlineFont, Text
 from openpyxl.descriptors import (
     Strict,
@@ -85,7 +85,9 @@ class CellRichText(list):
 
     @classmethod
     def _check_element(cls, value):
-        if not isinstance(value, (str, TextBlock, NUMERIC_TYPES)):
+        if isinstance(value, (str, TextBlock)) or isinstance(value, PYTHON_NUMERIC_TYPES):
+            return
+        if not isinstance(value, numpy_types()):
             raise TypeError(f"Illegal CellRichText element {value}")
 
 
@@ -72,6 +72,15 @@ def test_ctor(dummy_cell):
     assert cell.comment is None
 
 
+def test_cached_value(dummy_cell):
+    cell = dummy_cell
+    assert cell.cached_value is None
+    cell._cached_value = 3
+    assert cell.cached_value == 3
+    cell.value = "=1+1"
+    assert cell.cached_value is None
+
+
 @pytest.mark.parametrize("datatype", ['n', 'd', 's', 'b', 'f', 'e'])
 def test_null(dummy_cell, datatype):
     cell = dummy_cell
@@ -95,6 +104,16 @@ def test_formula(dummy_cell, value):
     assert cell.data_type == 'f'
 
 
+def test_shared_formula(DummyWorksheet, Cell):
+    from openpyxl.worksheet.formula import SharedFormula
+    shared = SharedFormula("C1:C10", "=A1*$B$1", "C1")
+    cell = Cell(DummyWorksheet, column=3, row=5)
+    cell._value = shared
+    cell.data_type = "f"
+    assert cell.value == "=A5*$B$1"
+    assert cell.internal_value == "=A5*$B$1"
+
+
 def test_not_formula(dummy_cell):
     dummy_cell.value = "="
     assert dummy_cell.data_type == 's'
@@ -433,3 +452,12 @@ def test_write_numpy_to_cell(dummy_cell):
     data = numpy.array([1.0])
     cell = dummy_cell
     cell.value = data[0]
+
+
+@pytest.mark.numpy_required
+def test_known_types():
+    import numpy
+    from .. import cell
+    assert numpy.float64 in cell.KNOWN_TYPES
+    assert numpy.float64 in cell.NUMERIC_TYPES
+    assert str in cell.KNOWN_TYPES
@@ -90,6 +90,20 @@ def test_equality():
     assert c3 != c1
 
 
+def test_shared_formula():
+    from openpyxl.worksheet.formula import SharedFormula
+    shared = SharedFormula("B1:B3", "=A1*2", "B1")
+    cell = ReadOnlyCell(None, 3, 2, shared, 'f')
+    assert cell.value == "=A3*2"
+    assert cell.internal_value == "=A3*2"
+    assert cell == ReadOnlyCell(None, 3, 2, SharedFormula("B1:B3", "=A1*2", "B1"), 'f')
+
+
+def test_cached_value():
+    cell = ReadOnlyCell(None, 1, 1, "=1+2", 'f', cached_value=3)
+    assert cell.cached_value == 3
+
+
 def test_is_date():
     c1 = ReadOnlyCell(None, None, None, None, 'd')
     assert c1.is_date is True
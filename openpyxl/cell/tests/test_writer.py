@@ -240,3 +240,29 @@ def test_array_formula(worksheet, write_cell_implementation):
     xml = out.getvalue()
     diff = compare_xml(xml, expected)
     assert diff is None, diff
+
+
+@pytest.mark.parametrize("coordinate, expected",
+                         [
+                             ("C2", """<c r="C2"><f t="shared" ref="C2:D4" si="0">$A2*B2</f><v/></c>"""),
+                             ("D4", """<c r="D4"><f t="shared" si="0"/><v/></c>"""),
+                             ("B4", """<c r="B4"><f>$A4*A4</f><v/></c>"""),
+                         ])
+def test_shared_formula(worksheet, write_cell_implementation, coordinate, expected):
+    from openpyxl.worksheet.formula import SharedFormula
+    write_cell = write_cell_implementation
+    ws = worksheet
+    shared = {(2, 3): ({"t": "shared", "ref": "C2:D4", "si": "0"}, "=$A2*B2"),
+              (4, 4): ({"t": "shared", "si": "0"}, None)}
+
+    cell = ws[coordinate]
+    cell._value = SharedFormula(ref="C1:D4", text="=$A1*B1", origin="C1")
+    cell.data_type = "f"
+
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        write_cell(xf, ws, cell, shared=shared)
+
+    xml = out.getvalue()
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
@@ -1,19 +1,54 @@
 # Copyright (c) 2010-2024 openpyxl
 
-from .area_chart import AreaChart, AreaChart3D
-from .bar_chart import BarChart, BarChart3D
-from .bubble_chart import BubbleChart
-from .line_chart import LineChart, LineChart3D
-from .pie_chart import (
-    PieChart,
-    PieChart3D,
-    DoughnutChart,
-    ProjectedPieChart
-)
-from .radar_chart import RadarChart
-from .scatter_chart import ScatterChart
-from .stock_chart import StockChart
-from .surface_chart import SurfaceChart, SurfaceChart3D
-
-from .series_factory import SeriesFactory as Series
-from .reference import Reference
+"""
+Charts are only imported when they are used
+"""
+
+from importlib import import_module
+
+_LAZY = {
+    "AreaChart": "area_chart",
+    "AreaChart3D": "area_chart",
+    "BarChart": "bar_chart",
+    "BarChart3D": "bar_chart",
+    "BubbleChart": "bubble_chart",
+    "LineChart": "line_chart",
+    "LineChart3D": "line_chart",
+    "PieChart": "pie_chart",
+    "PieChart3D": "pie_chart",
+    "DoughnutChart": "pie_chart",
+    "ProjectedPieChart": "pie_chart",
+    "RadarChart": "radar_chart",
+    "ScatterChart": "scatter_chart",
+    "StockChart": "stock_chart",
+    "SurfaceChart": "surface_chart",
+    "SurfaceChart3D": "surface_chart",
+    "Series": "series_factory",
+    "Reference": "reference",
+}
+
+_ALIASES = {
+    "Series": "SeriesFactory",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = import_module(f".{_LAZY[name]}", __name__)
+        value = getattr(module, _ALIASES.get(name, name))
+    else:
+        try:
+            value = import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            # only a missing submodule is a missing attribute
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
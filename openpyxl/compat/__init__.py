@@ -1,6 +1,6 @@
 # Copyright (c) 2010-2024 openpyxl
 
-from .numbers import NUMERIC_TYPES
+from .numbers import PYTHON_NUMERIC_TYPES, numpy_types
 from .strings import safe_string
 
 import warnings
@@ -52,3 +52,10 @@ def deprecated(reason):
 
     else:
         raise TypeError(repr(type(reason)))
+
+
+def __getattr__(name):
+    if name == "NUMERIC_TYPES":
+        from . import numbers
+        return numbers.NUMERIC_TYPES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,43 +1,69 @@
 # Copyright (c) 2010-2024 openpyxl
 
 from decimal import Decimal
+from importlib.util import find_spec
+import sys
 
-NUMERIC_TYPES = (int, float, Decimal)
-
-
-try:
-    import numpy
-    NUMPY = True
-except ImportError:
-    NUMPY = False
-
-
-if NUMPY:
-    NUMERIC_TYPES = NUMERIC_TYPES + (numpy.short,
-                                     numpy.ushort,
-                                     numpy.intc,
-                                     numpy.uintc,
-                                     numpy.int_,
-                                     numpy.uint,
-                                     numpy.longlong,
-                                     numpy.ulonglong,
-                                     numpy.half,
-                                     numpy.float16,
-                                     numpy.single,
-                                     numpy.double,
-                                     numpy.longdouble,
-                                     numpy.int8,
-                                     numpy.int16,
-                                     numpy.int32,
-                                     numpy.int64,
-                                     numpy.uint8,
-                                     numpy.uint16,
-                                     numpy.uint32,
-                                     numpy.uint64,
-                                     numpy.intp,
-                                     numpy.uintp,
-                                     numpy.float32,
-                                     numpy.float64,
-                                     numpy.bool_,
-                                     numpy.floating,
-                                     numpy.integer)
+# NumPy is only imported when values from it are actually used
+NUMPY = find_spec("numpy") is not None
+
+_NUMPY_TYPES = None
+
+
+def numpy_types():
+    """
+    NumPy scalar types, once NumPy has been imported by client code.
+    NumPy values cannot exist before that so there is no need to import it.
+    """
+    global _NUMPY_TYPES
+    if _NUMPY_TYPES is None:
+        numpy = sys.modules.get("numpy")
+        if numpy is None:
+            return ()
+        _NUMPY_TYPES = (numpy.short,
+                        numpy.ushort,
+                        numpy.intc,
+                        numpy.uintc,
+                        numpy.int_,
+                        numpy.uint,
+                        numpy.longlong,
+                        numpy.ulonglong,
+                        numpy.half,
+                        numpy.float16,
+                        numpy.single,
+                        numpy.double,
+                        numpy.longdouble,
+                        numpy.int8,
+                        numpy.int16,
+                        numpy.int32,
+                        numpy.int64,
+                        numpy.uint8,
+                        numpy.uint16,
+                        numpy.uint32,
+                        numpy.uint64,
+                        numpy.intp,
+                        numpy.uintp,
+                        numpy.float32,
+                        numpy.float64,
+                        numpy.bool_,
+                        numpy.floating,
+                        numpy.integer)
+    return _NUMPY_TYPES
+
+
+# Python types, checked before any NumPy types
+PYTHON_NUMERIC_TYPES = (int, float, Decimal)
+
+
+def __getattr__(name):
+    # NUMERIC_TYPES includes NumPy types and so imports it on first use
+    if name == "numpy":
+        if not NUMPY:
+            raise AttributeError(name)
+        import numpy
+        return numpy
+    if name == "NUMERIC_TYPES":
+        if NUMPY:
+            import numpy
+        return PYTHON_NUMERIC_TYPES + numpy_types()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,12 +6,12 @@ import sys
 
 VER = sys.version_info
 
-from .numbers import NUMERIC_TYPES
+from .numbers import PYTHON_NUMERIC_TYPES, numpy_types
 
 
 def safe_string(value):
     """Safely and consistently format numeric values"""
-    if isinstance(value, NUMERIC_TYPES):
+    if isinstance(value, PYTHON_NUMERIC_TYPES) or isinstance(value, numpy_types()):
         if isnan(value) or isinf(value):
             value = ""
         else:
@@ -65,6 +65,14 @@ def test_numpy_tostring():
     assert safe_string(bool_(True)) == "1"
 
 
+@pytest.mark.numpy_required
+def test_numpy_types():
+    import numpy
+    from ..numbers import numpy_types
+    assert numpy.float64 in numpy_types()
+    assert numpy.integer in numpy_types()
+
+
 @pytest.mark.skipif("sys.version_info[0]>=3")
 def test_safe_repr():
     from ..strings import safe_repr
@@ -55,4 +55,25 @@ class MetaSerialisable(type):
             methods['__nested__'] = tuple(sorted(nested))
         if methods.get('__elements__') is None:
             methods['__elements__'] = tuple(sorted(elements))
-        return MetaStrict.__new__(cls, clsname, bases, methods)
+        # specialised serialiser, generated on first use
+        methods['__serialiser__'] = None
+        # dispatch tables for parsing, generated on first use
+        methods['__parser__'] = None
+
+        # classes with __slots__ store descriptor values in slots
+        fields = {}
+        if '__slots__' in methods:
+            slots = methods['__slots__']
+            if isinstance(slots, str):
+                slots = (slots,)
+            for k, v in methods.items():
+                if isinstance(v, Descriptor) and not isinstance(v, Alias):
+                    fields[k] = f"_{clsname.lstrip('_')}__{k}"
+            methods['__slots__'] = tuple(slots) + tuple(fields.values())
+        inherited = (k for b in bases for k in getattr(b, '__slotted__', ()))
+        methods['__slotted__'] = tuple(dict.fromkeys(inherited)) + tuple(fields)
+
+        new = MetaStrict.__new__(cls, clsname, bases, methods)
+        for k, slot in fields.items():
+            slotted(methods[k], new.__dict__[slot])
+        return new
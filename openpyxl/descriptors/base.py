@@ -6,6 +6,8 @@ Based on Python Cookbook 3rd Edition, 8.13
 http://chimera.labs.oreilly.com/books/1230000000393/ch08.html#_discussiuncion_130
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 import datetime
 import re
 
@@ -14,6 +16,25 @@ from openpyxl.utils.datetime import from_ISO8601
 
 from .namespace import namespaced
 
+
+_validating = ContextVar("validating", default=True)
+
+
+@contextmanager
+def trusted():
+    """
+    Within this context values are converted but not validated by
+    descriptors. Only use this for values from trusted sources, such as
+    files written by Excel. Values set outside the context are validated
+    as usual.
+    """
+    token = _validating.set(False)
+    try:
+        yield
+    finally:
+        _validating.reset(token)
+
+
 class Descriptor(object):
 
     def __init__(self, name=None, **kw):
@@ -24,6 +45,53 @@ class Descriptor(object):
     def __set__(self, instance, value):
         instance.__dict__[self.name] = value
 
+    _store = __set__
+
+    def convert(self, value):
+        """
+        Convert a value without validating it
+        """
+        return value
+
+
+class Slot(Descriptor):
+    """
+    Store values in a slot of the instance instead of its __dict__.
+    Mixed into descriptors of classes with __slots__ by the metaclass.
+    """
+
+    slot = None
+
+    def __get__(self, instance, cls):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, cls)
+        except AttributeError:
+            return self
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+    _store = __set__
+
+
+_slotted_types = {}
+
+
+def slotted(desc, slot):
+    """
+    Make a descriptor store its values in the given slot
+    """
+    base = type(desc)
+    cls = _slotted_types.get(base)
+    if cls is None:
+        bases = (base, Slot) if base is not Descriptor else (Slot,)
+        cls = type(base.__name__, bases, {"__module__": base.__module__})
+        _slotted_types[base] = cls
+    desc.__class__ = cls
+    desc.slot = slot
+
 
 class Typed(Descriptor):
     """Values must of a particular type"""
@@ -37,6 +105,9 @@ class Typed(Descriptor):
         self.__doc__ = f"Values must be of type {self.expected_type}"
 
     def __set__(self, instance, value):
+        if not _validating.get():
+            self._store(instance, self.convert(value))
+            return
         if not isinstance(value, self.expected_type):
             if (not self.allow_none
                 or (self.allow_none and value is not None)):
@@ -66,11 +137,20 @@ class Convertible(Typed):
     """Values must be convertible to a particular type"""
 
     def __set__(self, instance, value):
+        if not _validating.get():
+            self._store(instance, self.convert(value))
+            return
         if ((self.allow_none and value is not None)
             or not self.allow_none):
             value = _convert(self.expected_type, value)
         super(Convertible, self).__set__(instance, value)
 
+    def convert(self, value):
+        if ((value is None and self.allow_none)
+            or isinstance(value, self.expected_type)):
+            return value
+        return self.expected_type(value)
+
 
 class Max(Convertible):
     """Values must be less than a `max` value"""
@@ -84,6 +164,9 @@ class Max(Convertible):
         super(Max, self).__init__(**kw)
 
     def __set__(self, instance, value):
+        if not _validating.get():
+            self._store(instance, self.convert(value))
+            return
         if ((self.allow_none and value is not None)
             or not self.allow_none):
             value = _convert(self.expected_type, value)
@@ -104,6 +187,9 @@ class Min(Convertible):
         super(Min, self).__init__(**kw)
 
     def __set__(self, instance, value):
+        if not _validating.get():
+            self._store(instance, self.convert(value))
+            return
         if ((self.allow_none and value is not None)
             or not self.allow_none):
             value = _convert(self.expected_type, value)
@@ -128,6 +214,9 @@ class Set(Descriptor):
         self.__doc__ = "Value must be one of {0}".format(self.values)
 
     def __set__(self, instance, value):
+        if not _validating.get():
+            self._store(instance, self.convert(value))
+            return
         if value not in self.values:
             raise ValueError(self.__doc__)
         super(Set, self).__set__(instance, value)
@@ -146,6 +235,11 @@ class NoneSet(Set):
             value = None
         super(NoneSet, self).__set__(instance, value)
 
+    def convert(self, value):
+        if value == 'none':
+            return None
+        return value
+
 
 class Integer(Convertible):
 
@@ -167,6 +261,11 @@ class Bool(Convertible):
                 value = False
         super(Bool, self).__set__(instance, value)
 
+    def convert(self, value):
+        if isinstance(value, str) and value in ('false', 'f', '0'):
+            return False
+        return super(Bool, self).convert(value)
+
 
 class String(Typed):
 
@@ -197,6 +296,9 @@ class Length(Descriptor):
 
 
     def __set__(self, instance, value):
+        if not _validating.get():
+            self._store(instance, self.convert(value))
+            return
         if len(value) != self.length:
             raise ValueError("Value must be length {0}".format(self.length))
         super(Length, self).__set__(instance, value)
@@ -247,6 +349,9 @@ class MatchPattern(Descriptor):
 
 
     def __set__(self, instance, value):
+        if not _validating.get():
+            self._store(instance, self.convert(value))
+            return
 
         if value is None and not self.allow_none:
             raise ValueError("Value must not be none")
@@ -270,3 +375,8 @@ class DateTime(Typed):
             except ValueError:
                 raise ValueError("Value must be ISO datetime format")
         super(DateTime, self).__set__(instance, value)
+
+    def convert(self, value):
+        if isinstance(value, str):
+            return from_ISO8601(value)
+        return value
@@ -13,6 +13,7 @@ from .base import (
     Float,
     Integer,
     String,
+    _validating,
     )
 from openpyxl.compat import safe_string
 from openpyxl.xml.functions import Element, localname, whitespace
@@ -24,6 +25,9 @@ class Nested(Descriptor):
     attribute = "val"
 
     def __set__(self, instance, value):
+        if not _validating.get():
+            self._store(instance, self.convert(value))
+            return
         if hasattr(value, "tag"):
             tag = localname(value)
             if tag != self.name:
@@ -33,6 +37,12 @@ class Nested(Descriptor):
         super(Nested, self).__set__(instance, value)
 
 
+    def convert(self, value):
+        if hasattr(value, "tag"):
+            value = self.from_tree(value)
+        return super(Nested, self).convert(value)
+
+
     def from_tree(self, node):
         return node.get(self.attribute)
 
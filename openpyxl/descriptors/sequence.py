@@ -103,7 +103,7 @@ class MultiSequence(Sequence):
         if not isinstance(seq, (tuple, list)):
             raise ValueError("Value must be a sequence")
         seq = list(seq)
-        Descriptor.__set__(self, instance, seq)
+        super(Sequence, self).__set__(instance, seq)
 
 
     def to_tree(self, tagname, obj, namespace=None):
@@ -129,7 +129,7 @@ class MultiSequencePart(Alias):
 
     def __set__(self, instance, value):
         value = _convert(self.expected_type, value)
-        instance.__dict__[self.store].append(value)
+        getattr(instance, self.store).append(value)
 
 
     def __get__(self, instance, cls):
@@ -1,7 +1,9 @@
 # Copyright (c) 2010-2024 openpyxl
 
-from copy import copy
-from keyword import kwlist
+from copy import copy, deepcopy
+import datetime
+from itertools import chain
+from keyword import kwlist, iskeyword
 KEYWORDS = frozenset(kwlist)
 
 from . import Descriptor
@@ -12,14 +14,214 @@ from .sequence import (
     MultiSequencePart,
 )
 from .namespace import namespaced
+from .nested import Nested
 
 from openpyxl.compat import safe_string
+from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.xml.functions import (
     Element,
     localname,
 )
 
 seq_types = (list, tuple)
+IMMUTABLE = frozenset([str, int, float, bool, bytes, datetime.datetime,
+                       datetime.date, datetime.time, datetime.timedelta])
+
+
+def _getter(name):
+    """
+    Source for reading an attribute in generated code
+    """
+    if name.isidentifier() and not iskeyword(name):
+        return f"self.{name}"
+    return f"getattr(self, {name!r})"
+
+
+_SERIALISERS = {}
+
+
+def _compile_serialiser(cls, attributes, elements):
+    """
+    Generate and cache a function that serialises instances of `cls`.
+
+    Attributes and child elements are unrolled and all descriptor lookups
+    happen once per class. The resulting XML is identical to that of
+    looping over `__attrs__` and `__elements__` for each object.
+
+    Some objects, such as chart series, override the class layout so
+    functions are cached for each layout.
+    """
+    key = (cls, attributes, elements)
+    fn = _SERIALISERS.get(key)
+    if fn is not None:
+        return fn
+
+    env = {
+        "Element": Element,
+        "safe_string": safe_string,
+        "seq_types": seq_types,
+        "NAMESPACED": cls.__namespaced__,
+    }
+    src = ["def to_tree(self, tagname, namespace):"]
+
+    if cls.__iter__ is Serialisable.__iter__:
+        attrs = []
+        for attr in attributes:
+            if attr == "attr_text":
+                continue
+            name = attr
+            if attr.startswith("_"):
+                name = attr[1:]
+            elif "_" in attr:
+                desc = getattr(cls, attr, None)
+                if getattr(desc, "hyphenated", False):
+                    name = attr.replace("_", "-")
+            attrs.append((attr, name))
+
+        # attributes with namespaces always come last
+        namespaced_names = dict(cls.__namespaced__)
+        ordered = [(attr, name) for attr, name in attrs if name not in namespaced_names]
+        for name, ns in cls.__namespaced__:
+            ordered.extend((attr, ns) for attr, n in attrs if n == name)
+
+        src.append("    attrs = {}")
+        for attr, name in ordered:
+            src.append(f"    value = {_getter(attr)}")
+            src.append("    if value is not None:")
+            src.append(f"        attrs[{name!r}] = safe_string(value)")
+    else:
+        # attributes are managed by the class
+        src.append("    attrs = dict(self)")
+        src.append("    for key, ns in NAMESPACED:")
+        src.append("        if key in attrs:")
+        src.append("            attrs[ns] = attrs[key]")
+        src.append("            del attrs[key]")
+
+    src.append("    el = Element(tagname, attrs)")
+    if "attr_text" in attributes:
+        src.append("    el.text = safe_string(self.attr_text)")
+
+    for idx, child_tag in enumerate(elements):
+        desc = getattr(cls, child_tag, None)
+        d = f"desc{idx}"
+        env[d] = desc
+        tag = repr(child_tag)
+
+        src.append(f"    obj = {_getter(child_tag)}")
+        if hasattr(desc, "namespace"):
+            src.append("    if hasattr(obj, 'namespace'):")
+            src.append(f"        obj.namespace = {d}.namespace")
+
+        src.append("    if isinstance(obj, seq_types):")
+        if isinstance(desc, NestedSequence):
+            # wrap sequence in container
+            src.append("        if obj:")
+            src.append(f"            el.append({d}.to_tree({tag}, obj, namespace))")
+        elif isinstance(desc, Sequence):
+            src.append(f"        {d}.idx_base = self.idx_base")
+            src.append(f"        for node in {d}.to_tree({tag}, obj, namespace):")
+            src.append("            el.append(node)")
+        else: # property
+            src.append("        for v in obj:")
+            src.append(f"            el.append(v.to_tree({tag}, namespace))")
+
+        src.append("    else:")
+        if (child_tag in cls.__nested__
+            and type(desc).to_tree is Nested.to_tree
+            and "to_tree" not in vars(desc)):
+            # inline the most common nested value
+            src.append("        if obj is not None:")
+            ns = getattr(desc, "namespace", None)
+            if ns is not None:
+                src.append(f"            tag = {'{%s}%s' % (ns, child_tag)!r}")
+            else:
+                src.append("            if namespace is not None:")
+                src.append(f"                tag = '{{%s}}%s' % (namespace, {tag})")
+                src.append("            else:")
+                src.append(f"                tag = {tag}")
+            src.append(f"            el.append(Element(tag, {{{desc.attribute!r}: safe_string(obj)}}))")
+        elif child_tag in cls.__nested__:
+            src.append(f"        node = {d}.to_tree({tag}, obj, namespace)")
+            src.append("        if node is not None:")
+            src.append("            el.append(node)")
+        else:
+            src.append("        if obj is not None:")
+            src.append(f"            node = obj.to_tree({tag})")
+            src.append("            if node is not None:")
+            src.append("                el.append(node)")
+
+    src.append("    return el")
+
+    code = compile("\n".join(src), f"<serialiser {cls.__qualname__}>", "exec")
+    exec(code, env)
+    fn = env["to_tree"]
+    fn.attributes = attributes
+    fn.elements = elements
+    _SERIALISERS[key] = fn
+    if attributes is cls.__attrs__ and elements is cls.__elements__:
+        cls.__serialiser__ = staticmethod(fn)
+    return fn
+
+def _attribute_name(key):
+    """
+    Keyword argument for an attribute without a namespace
+    """
+    if key in KEYWORDS:
+        return "_" + key
+    return key.replace("-", "_")
+
+
+def _child_handler(cls, el):
+    """
+    Resolve the handler for a child element of `cls`: the keyword argument
+    to store the value in, a function to convert the element and whether
+    the value should be appended to a list.
+    Returns None for elements which are ignored.
+    """
+    tag = localname(el)
+    if tag in KEYWORDS:
+        tag = "_" + tag
+    desc = getattr(cls, tag, None)
+    if desc is None or isinstance(desc, property):
+        return
+
+    if hasattr(desc, 'from_tree'):
+        #descriptor manages conversion
+        convert = desc.from_tree
+    elif hasattr(desc.expected_type, "from_tree"):
+        #complex type
+        convert = desc.expected_type.from_tree
+    else:
+        #primitive
+        convert = _text
+
+    if isinstance(desc, NestedSequence):
+        return tag, convert, False
+    elif isinstance(desc, Sequence):
+        return tag, convert, True
+    elif isinstance(desc, MultiSequencePart):
+        return desc.store, convert, True
+    return tag, convert, False
+
+
+def _text(node):
+    return node.text
+
+
+def _compile_parser(cls):
+    """
+    Create the dispatch tables used to parse XML for `cls`.
+
+    Attributes and child elements map from their tags, including any
+    namespace, to keyword arguments and handlers. The tables are filled as
+    tags are first seen so that tags are resolved only once per class.
+    """
+    namespaced = tuple((ns, _attribute_name(key)) for key, ns in cls.__namespaced__)
+    attributes = dict.fromkeys((ns for ns, key in namespaced))
+    parser = attributes, namespaced, "attr_text" in cls.__attrs__, {}
+    cls.__parser__ = parser
+    return parser
+
 
 class Serialisable(metaclass=MetaSerialisable):
     """
@@ -28,8 +230,13 @@ class Serialisable(metaclass=MetaSerialisable):
     __attrs__ = attributes
     __nested__ = single-valued child treated as an attribute
     __elements__ = child elements
+
+    Subclasses which declare __slots__ store the values of their descriptors
+    in slots rather than in a __dict__ to reduce memory use.
     """
 
+    __slots__ = ()
+
     __attrs__ = None
     __nested__ = None
     __elements__ = None
@@ -48,57 +255,46 @@ class Serialisable(metaclass=MetaSerialisable):
         """
         Create object from XML
         """
-        # strip known namespaces from attributes
-        attrib = dict(node.attrib)
-        for key, ns in cls.__namespaced__:
-            if ns in attrib:
-                attrib[key] = attrib[ns]
-                del attrib[ns]
-
-        # strip attributes with unknown namespaces
-        for key in list(attrib):
-            if key.startswith('{'):
-                del attrib[key]
-            elif key in KEYWORDS:
-                attrib["_" + key] = attrib[key]
-                del attrib[key]
-            elif "-" in key:
-                n = key.replace("-", "_")
-                attrib[n] = attrib[key]
-                del attrib[key]
-
-        if node.text and "attr_text" in cls.__attrs__:
+        attributes, namespaced, text, children = cls.__parser__ or _compile_parser(cls)
+
+        attrib = {}
+        values = node.attrib
+        for key, value in values.items():
+            try:
+                name = attributes[key]
+            except KeyError:
+                # strip attributes with unknown namespaces
+                if key.startswith('{'):
+                    name = None
+                else:
+                    name = _attribute_name(key)
+                attributes[key] = name
+            if name is not None:
+                attrib[name] = value
+
+        # known namespaces take precedence
+        for ns, key in namespaced:
+            if ns in values:
+                attrib[key] = values[ns]
+
+        if text and node.text:
             attrib["attr_text"] = node.text
 
         for el in node:
-            tag = localname(el)
-            if tag in KEYWORDS:
-                tag = "_" + tag
-            desc = getattr(cls, tag, None)
-            if desc is None or isinstance(desc, property):
+            tag = el.tag
+            try:
+                handler = children[tag]
+            except KeyError:
+                handler = children[tag] = _child_handler(cls, el)
+            if handler is None:
                 continue
 
-            if hasattr(desc, 'from_tree'):
-                #descriptor manages conversion
-                obj = desc.from_tree(el)
-            else:
-                if hasattr(desc.expected_type, "from_tree"):
-                    #complex type
-                    obj = desc.expected_type.from_tree(el)
-                else:
-                    #primitive
-                    obj = el.text
-
-            if isinstance(desc, NestedSequence):
-                attrib[tag] = obj
-            elif isinstance(desc, Sequence):
-                attrib.setdefault(tag, [])
-                attrib[tag].append(obj)
-            elif isinstance(desc, MultiSequencePart):
-                attrib.setdefault(desc.store, [])
-                attrib[desc.store].append(obj)
+            name, convert, append = handler
+            obj = convert(el)
+            if append:
+                attrib.setdefault(name, []).append(obj)
             else:
-                attrib[tag] = obj
+                attrib[name] = obj
 
         return cls(**attrib)
 
@@ -115,46 +311,13 @@ class Serialisable(metaclass=MetaSerialisable):
         tagname = namespaced(self, tagname, namespace)
         namespace = getattr(self, "namespace", namespace)
 
-        attrs = dict(self)
-        for key, ns in self.__namespaced__:
-            if key in attrs:
-                attrs[ns] = attrs[key]
-                del attrs[key]
-
-        el = Element(tagname, attrs)
-        if "attr_text" in self.__attrs__:
-            el.text = safe_string(getattr(self, "attr_text"))
-
-        for child_tag in self.__elements__:
-            desc = getattr(self.__class__, child_tag, None)
-            obj = getattr(self, child_tag)
-            if hasattr(desc, "namespace") and hasattr(obj, 'namespace'):
-                obj.namespace = desc.namespace
-
-            if isinstance(obj, seq_types):
-                if isinstance(desc, NestedSequence):
-                    # wrap sequence in container
-                    if not obj:
-                        continue
-                    nodes = [desc.to_tree(child_tag, obj, namespace)]
-                elif isinstance(desc, Sequence):
-                    # sequence
-                    desc.idx_base = self.idx_base
-                    nodes = (desc.to_tree(child_tag, obj, namespace))
-                else: # property
-                    nodes = (v.to_tree(child_tag, namespace) for v in obj)
-                for node in nodes:
-                    el.append(node)
-            else:
-                if child_tag in self.__nested__:
-                    node = desc.to_tree(child_tag, obj, namespace)
-                elif obj is None:
-                    continue
-                else:
-                    node = obj.to_tree(child_tag)
-                if node is not None:
-                    el.append(node)
-        return el
+        serialiser = self.__serialiser__
+        if (serialiser is None
+            or serialiser.attributes is not self.__attrs__
+            or serialiser.elements is not self.__elements__):
+            serialiser = _compile_serialiser(self.__class__, self.__attrs__,
+                                             self.__elements__)
+        return serialiser(self, tagname, namespace)
 
 
     def __iter__(self):
@@ -228,13 +391,56 @@ class Serialisable(metaclass=MetaSerialisable):
         return self.__class__(**vals)
 
 
+    def _state(self):
+        """
+        Values of the instance attributes including those held in slots
+        """
+        state = dict(getattr(self, "__dict__", ()))
+        cls = self.__class__
+        for k in self.__slotted__:
+            slot = getattr(cls, k).slot
+            try:
+                state[k] = slot.__get__(self, cls)
+            except AttributeError:
+                continue
+        return state
+
+
+    def _restore(self, state):
+        cls = self.__class__
+        for k in self.__slotted__:
+            if k in state:
+                getattr(cls, k).slot.__set__(self, state.pop(k))
+        if state:
+            self.__dict__.update(state)
+
+
     def __copy__(self):
-        # serialise to xml and back to avoid shallow copies
-        xml = self.to_tree(tagname="dummy")
-        cp = self.__class__.from_tree(xml)
-        # copy any non-persisted attributed
-        for k in self.__dict__:
-            if k not in self.__attrs__ + self.__elements__:
-                v = copy(getattr(self, k))
-                setattr(cp, k, v)
+        # copy child objects to avoid shallow copies
+        persisted = self.__attrs__ + self.__elements__
+        state = self._state()
+        for k, v in state.items():
+            if v is None or v.__class__ in IMMUTABLE:
+                continue
+            if k in persisted and v.__class__ in seq_types + (IndexedList, set):
+                v = v.__class__(copy(el) for el in v)
+            else:
+                v = copy(v)
+            state[k] = v
+        cls = self.__class__
+        cp = cls.__new__(cls)
+        cp._restore(state)
+        return cp
+
+
+    def __deepcopy__(self, memo):
+        cls = self.__class__
+        cp = cls.__new__(cls)
+        memo[id(self)] = cp
+        state = self._state()
+        for k, v in state.items():
+            if v is None or v.__class__ in IMMUTABLE:
+                continue
+            state[k] = deepcopy(v, memo)
+        cp._restore(state)
         return cp
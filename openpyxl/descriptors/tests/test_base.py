@@ -394,3 +394,56 @@ class TestLength:
     def test_invalid(self, Length):
         with pytest.raises(ValueError):
             Length.value = "2"
+
+
+@pytest.fixture
+def Trusted():
+    from ..base import Integer, Bool, MinMax, Set, String
+    from ..nested import NestedInteger
+
+    class Dummy(Strict):
+
+        size = Integer(allow_none=True)
+        flag = Bool()
+        value = MinMax(min=0, max=1)
+        colour = Set(values=["red", "blue"])
+        name = String()
+        val = NestedInteger()
+
+    return Dummy()
+
+
+class TestTrusted:
+
+    def test_convert(self, Trusted):
+        from ..base import trusted
+        from openpyxl.xml.functions import Element
+
+        with trusted():
+            Trusted.size = "3"
+            Trusted.flag = "false"
+            Trusted.val = Element("val", val="4")
+        assert Trusted.size == 3
+        assert Trusted.flag is False
+        assert Trusted.val == 4
+
+
+    def test_not_validated(self, Trusted):
+        from ..base import trusted
+
+        with trusted():
+            Trusted.value = "5"
+            Trusted.colour = "green"
+            Trusted.name = 1
+        assert Trusted.value == 5.0
+        assert Trusted.colour == "green"
+        assert Trusted.name == 1
+
+
+    def test_validated_afterwards(self, Trusted):
+        from ..base import trusted
+
+        with trusted():
+            pass
+        with pytest.raises(ValueError):
+            Trusted.colour = "green"
@@ -291,3 +291,219 @@ class TestExpectedTypes:
         node = fromstring(xml)
         obj = ExpectedTypes.from_tree(node)
         assert obj.value == "1"
+
+
+@pytest.fixture
+def Compiled(Serialisable):
+    from ..base import String, Integer
+    from ..excel import Relation
+    from ..nested import NestedInteger
+    from ..sequence import Sequence
+
+    class Child(Serialisable):
+
+        tagname = "child"
+
+        value = Integer()
+
+        def __init__(self, value=0):
+            self.value = value
+
+
+    class Dummy(Serialisable):
+
+        tagname = "dummy"
+
+        id = Relation()
+        name = String(allow_none=True)
+        size = NestedInteger(allow_none=True)
+        child = Sequence(expected_type=Child)
+
+        __attrs__ = ("id", "name")
+        __elements__ = ("size", "child")
+
+        def __init__(self, id=None, name=None, size=None, child=()):
+            self.id = id
+            self.name = name
+            self.size = size
+            self.child = child
+
+    return Dummy
+
+
+class TestCompiledSerialiser:
+
+
+    def test_cached(self, Compiled):
+        obj = Compiled(name="a")
+        assert Compiled.__serialiser__ is None
+        obj.to_tree()
+        fn = Compiled.__serialiser__
+        assert fn.attributes is Compiled.__attrs__
+        obj.to_tree()
+        assert Compiled.__serialiser__ is fn
+
+
+    def test_to_tree(self, Compiled):
+        obj = Compiled(id="rId1", name="a", size=3, child=[1, 2])
+        xml = tostring(obj.to_tree())
+        expected = b"""<dummy xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" name="a" r:id="rId1"><size val="3"/><child value="1"/><child value="2"/></dummy>"""
+        assert xml == expected
+
+
+    def test_instance_layout(self, Compiled):
+        obj = Compiled(name="a", size=3, child=[1])
+        obj.__elements__ = ("child",)
+        xml = tostring(obj.to_tree())
+        assert xml == b"""<dummy name="a"><child value="1"/></dummy>"""
+        assert Compiled.__serialiser__ is None
+
+
+    def test_instance_layout_cached(self, Compiled, monkeypatch):
+        from .. import serialisable
+        obj = Compiled(id="rId1", name="a", size=3, child=[1])
+        obj.__elements__ = ("child",)
+        obj.to_tree()
+        Compiled(name="b").to_tree()
+        fn = serialisable._SERIALISERS[Compiled, Compiled.__attrs__, obj.__elements__]
+        compiled = []
+        monkeypatch.setattr(serialisable, "compile",
+                            lambda *args: compiled.append(args) or compile(*args),
+                            raising=False)
+        obj.to_tree()
+        Compiled(name="b").to_tree()
+        assert compiled == []
+        assert serialisable._SERIALISERS[Compiled, Compiled.__attrs__, obj.__elements__] is fn
+
+
+class TestStructuralCopy:
+
+
+    def test_copy(self, Compiled):
+        from copy import copy
+        obj = Compiled(id="rId1", name="a", size=3, child=[1, 2])
+        obj.extra = [1]
+        cp = copy(obj)
+        assert cp == obj
+        assert cp.child is not obj.child
+        assert cp.child[0] is not obj.child[0]
+        cp.child[0].value = 5
+        assert obj.child[0].value == 1
+        # non-persisted values are copied shallowly
+        assert cp.extra == [1] and cp.extra is not obj.extra
+
+
+    def test_deepcopy(self, Compiled):
+        from copy import deepcopy
+        obj = Compiled(name="a", child=[1])
+        obj.extra = [obj.child[0]]
+        cp = deepcopy(obj)
+        assert cp == obj
+        assert cp.extra[0] is cp.child[0]
+
+
+class TestCompiledParser:
+
+
+    def test_from_tree(self, Compiled):
+        src = """
+        <dummy xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+            xmlns:x="urn:unknown" name="a" r:id="rId1" x:extra="1">
+          <size val="3"/>
+          <child value="1"/>
+          <unknown />
+          <child value="2"/>
+        </dummy>
+        """
+        node = fromstring(src)
+        obj = Compiled.from_tree(node)
+        assert obj.id == "rId1"
+        assert obj.name == "a"
+        assert obj.size == 3
+        assert [c.value for c in obj.child] == [1, 2]
+
+
+    def test_cached(self, Compiled):
+        assert Compiled.__parser__ is None
+        node = fromstring("""<dummy name="a"><size val="3"/><unknown /></dummy>""")
+        Compiled.from_tree(node)
+        attributes, namespaced, text, children = Compiled.__parser__
+        assert attributes["name"] == "name"
+        assert children["unknown"] is None
+        assert children["size"][0] == "size"
+
+
+@pytest.fixture
+def Slotted(Serialisable):
+    from ..base import Integer, String, Alias
+
+    class Dummy(Serialisable):
+
+        tagname = "dummy"
+        __slots__ = ()
+
+        name = String(allow_none=True)
+        size = Integer()
+        length = Alias("size")
+
+        def __init__(self, name=None, size=0):
+            self.name = name
+            self.size = size
+
+    return Dummy
+
+
+class TestSlotted:
+
+
+    def test_no_dict(self, Slotted):
+        obj = Slotted(name="a", size=3)
+        assert not hasattr(obj, "__dict__")
+        assert Slotted.__slotted__ == ("name", "size")
+        assert (obj.name, obj.size, obj.length) == ("a", 3, 3)
+
+
+    def test_validate(self, Slotted):
+        obj = Slotted()
+        obj.size = "4"
+        assert obj.size == 4
+        with pytest.raises(TypeError):
+            obj.size = "a"
+
+
+    def test_trusted(self, Slotted):
+        from ..base import trusted
+        with trusted():
+            obj = Slotted(size="5")
+        assert obj.size == 5
+
+
+    def test_serialise(self, Slotted):
+        node = fromstring("""<dummy name="a" size="3" />""")
+        obj = Slotted.from_tree(node)
+        xml = tostring(obj.to_tree())
+        assert xml == b"""<dummy name="a" size="3"/>"""
+
+
+    def test_copy(self, Slotted):
+        from copy import copy, deepcopy
+        obj = Slotted(name="a", size=3)
+        assert deepcopy(obj) == obj
+        assert copy(obj) == obj
+
+
+    def test_subclass(self, Slotted):
+        from ..base import Bool
+
+        class Sub(Slotted):
+
+            flag = Bool()
+
+            def __init__(self, flag=False, **kw):
+                super().__init__(**kw)
+                self.flag = flag
+
+        obj = Sub(flag=True, size=2)
+        assert obj.__dict__ == {"flag": True}
+        assert obj.size == 2
+        assert Sub.__slotted__ == ("name", "size")
@@ -2,10 +2,6 @@
 
 from io import BytesIO
 
-try:
-    from PIL import Image as PILImage
-except ImportError:
-    PILImage = False
 
 from openpyxl.xml.constants import IMAGE_NS
 from openpyxl.descriptors import (
@@ -19,7 +15,25 @@ from openpyxl.descriptors import (
 from openpyxl.packaging.relationship import Relationship
 
 
+def _pil_image():
+    """
+    Pillow is only imported when images are used
+    """
+    try:
+        from PIL import Image as PILImage
+    except ImportError:
+        PILImage = False
+    return PILImage
+
+
+def __getattr__(name):
+    if name == "PILImage":
+        return _pil_image()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _import_image(img):
+    PILImage = _pil_image()
     if not PILImage:
         raise ImportError('You must install Pillow to fetch image objects')
 
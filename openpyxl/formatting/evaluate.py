@@ -0,0 +1,664 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Work out which cells the conditional formats of a worksheet apply to.
+
+The rules of a conditional format are evaluated for all the cells of its
+ranges at once, using NumPy if it is installed. Formulae in rules and in
+cells are calculated with the workbook's
+:class:`~openpyxl.formula.evaluate.Evaluator`, which is created if it is
+needed.
+"""
+
+from collections import Counter
+import math
+
+from openpyxl.formula.evaluate import Evaluator, _constant, _result
+from openpyxl.formula.functions import (
+    Error,
+    FormulaError,
+    REF,
+    numpy,
+    compare,
+    to_bool,
+    to_number,
+    to_text,
+    _key,
+)
+from openpyxl.formula.translate import Translator, TranslatorError
+from openpyxl.styles.differential import DifferentialStyle
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import range_boundaries
+
+
+CELL_IS = {
+    "lessThan": "<",
+    "lessThanOrEqual": "<=",
+    "equal": "=",
+    "notEqual": "<>",
+    "greaterThanOrEqual": ">=",
+    "greaterThan": ">",
+}
+
+
+class CellFormat:
+
+    """
+    How conditional formats change the appearance of a cell.
+
+    `dxf` combines the differential styles of the rules which apply, those
+    of rules with a higher priority taking precedence. `color` is the ARGB
+    colour of a colour scale, `bar` the length of a data bar as a fraction
+    of the width of the cell and `bar_color` its colour, and `icon` the
+    position of the icon in the icon set `icon_set`.
+    """
+
+    __slots__ = ("dxf", "color", "bar", "bar_color", "icon_set", "icon")
+
+    def __init__(self, dxf=None, color=None, bar=None, bar_color=None,
+                 icon_set=None, icon=None):
+        self.dxf = dxf
+        self.color = color
+        self.bar = bar
+        self.bar_color = bar_color
+        self.icon_set = icon_set
+        self.icon = icon
+
+
+    def __eq__(self, other):
+        if not isinstance(other, CellFormat):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name)
+                   for name in self.__slots__)
+
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}"
+                           for name in self.__slots__
+                           if getattr(self, name) is not None)
+        return f"<CellFormat {values}>"
+
+
+class _Cells:
+
+    """
+    The cells of a conditional format in the used part of a worksheet, their
+    values and the values which are numbers, NaN standing for anything else
+    """
+
+    def __init__(self, positions, values):
+        self.positions = positions
+        self.values = values
+        self.origin = (min(row for row, col in positions),
+                       min(col for row, col in positions))
+        numbers = [v if v.__class__ in (int, float) else math.nan for v in values]
+        # empty cells are also treated as numbers by comparisons
+        self.numeric = all(v is None or v.__class__ in (int, float) for v in values)
+        if numpy is not None:
+            numbers = numpy.array(numbers, dtype=float)
+        self.numbers = numbers
+
+
+    def valid(self):
+        """
+        The numbers without NaN, in order
+        """
+        numbers = self.numbers
+        if numpy is not None:
+            return numpy.sort(numbers[~numpy.isnan(numbers)])
+        return sorted(v for v in numbers if v == v)
+
+
+class ConditionalFormatEvaluator:
+
+    """
+    Evaluate the conditional formats of a worksheet.
+
+    Rules of the types cellIs, expression, top10, aboveAverage,
+    duplicateValues, uniqueValues, containsText, notContainsText,
+    beginsWith, endsWith, containsBlanks, notContainsBlanks, containsErrors
+    and notContainsErrors apply differential styles; colorScale, dataBar and
+    iconSet rules are evaluated as well. timePeriod rules are ignored. Cells
+    outside the part of the worksheet in use are not formatted.
+    """
+
+    def __init__(self, ws):
+        self.ws = ws
+        self._evaluator = None
+
+
+    def style_map(self, cell_range=None):
+        """
+        Formats of the cells with conditional formats, or only those in a
+        range such as "A1:D20", as :class:`CellFormat` objects by (row,
+        column)
+        """
+        formatting = self.ws.conditional_formatting
+        if cell_range is None:
+            formats = list(formatting._cf_rules.items())
+        else:
+            formats = formatting._rule_index().search(cell_range)
+
+        results = []
+        for cf, rules in formats:
+            cells = self._cells(cf.sqref)
+            if cells is None:
+                continue
+            for rule in rules:
+                found = self._evaluate(rule, cells)
+                if found is not None:
+                    results.append((rule.priority or 0, rule, cells, found))
+        results.sort(key=lambda result: result[0])
+
+        styles = {}
+        dxfs = {}
+        stopped = set()
+        for _, rule, cells, (attr, found) in results:
+            positions = cells.positions
+            for idx, value in found:
+                pos = positions[idx]
+                if pos in stopped:
+                    continue
+                if rule.stopIfTrue:
+                    stopped.add(pos)
+                if value is None:
+                    continue
+                fmt = styles.get(pos)
+                if fmt is None:
+                    fmt = styles[pos] = CellFormat()
+                if attr == "dxf":
+                    dxfs.setdefault(pos, []).append(value)
+                elif attr == "bar":
+                    if fmt.bar is None:
+                        fmt.bar, fmt.bar_color = value
+                elif attr == "icon":
+                    if fmt.icon is None:
+                        fmt.icon_set, fmt.icon = value
+                elif fmt.color is None:
+                    fmt.color = value
+
+        merged = {}
+        for pos, cell_dxfs in dxfs.items():
+            key = tuple(id(dxf) for dxf in cell_dxfs)
+            dxf = merged.get(key)
+            if dxf is None:
+                dxf = merged[key] = _merge(cell_dxfs)
+            styles[pos].dxf = dxf
+
+        if cell_range is not None:
+            min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+            min_col, min_row = min_col or 1, min_row or 1
+            max_col, max_row = max_col or math.inf, max_row or math.inf
+            styles = {(row, col): fmt for (row, col), fmt in styles.items()
+                      if min_row <= row <= max_row and min_col <= col <= max_col}
+        return styles
+
+
+    def _cells(self, sqref):
+        """
+        Cells of the ranges of a format which are in the part of the worksheet
+        in use and their values
+        """
+        ws = self.ws
+        max_row, max_col = ws.max_row, ws.max_column
+        positions = []
+        for cr in sorted(sqref.ranges, key=lambda cr: (cr.min_row, cr.min_col)):
+            cols = range(cr.min_col, min(cr.max_col, max_col) + 1)
+            for row in range(cr.min_row, min(cr.max_row, max_row) + 1):
+                positions.extend((row, col) for col in cols)
+        if len(sqref.ranges) > 1:
+            positions = list(dict.fromkeys(positions))
+        if not positions:
+            return
+
+        get = ws._cells.get
+        epoch = ws.parent.epoch
+        values = []
+        for pos in positions:
+            cell = get(pos)
+            if cell is None:
+                values.append(None)
+            elif cell.data_type == "f":
+                values.append(self._calculator().value(cell))
+            else:
+                values.append(_constant(cell, epoch))
+        return _Cells(positions, values)
+
+
+    def _calculator(self):
+        if self._evaluator is None:
+            wb = self.ws.parent
+            self._evaluator = wb._evaluator or Evaluator(wb)
+        return self._evaluator
+
+
+    def _calculate(self, formula):
+        calculator = self._calculator()
+        tree = calculator.index._parse(formula)
+        return _result(calculator._evaluate(tree, self.ws))
+
+
+    def _formula(self, text, cells):
+        """
+        Value of a formula of a rule, or a list of its values for each cell
+        when it has relative references. These are relative to the top left
+        cell of the format.
+        """
+        formula = text if text.startswith("=") else "=" + text
+        row, col = cells.origin
+        translator = Translator(formula, get_column_letter(col) + str(row))
+        try:
+            rows = translator.translate_formula(row_delta=1) != formula
+            cols = translator.translate_formula(col_delta=1) != formula
+        except TranslatorError:
+            rows = cols = True
+        if not (rows or cols):
+            return self._calculate(formula)
+
+        found = {}
+        values = []
+        for r, c in cells.positions:
+            key = (r - row if rows else 0, c - col if cols else 0)
+            if key not in found:
+                try:
+                    moved = translator.translate_formula(row_delta=key[0],
+                                                         col_delta=key[1])
+                    found[key] = self._calculate(moved)
+                except TranslatorError:
+                    found[key] = REF
+            values.append(found[key])
+        return values
+
+
+    def _number(self, value, cells):
+        """
+        Number for the value of a threshold, which may be a formula
+        """
+        if isinstance(value, str):
+            value = self._formula(value, cells)
+            if value.__class__ is list:
+                value = value[0]
+        try:
+            return to_number(value)
+        except FormulaError:
+            return
+
+
+    def _evaluate(self, rule, cells):
+        """
+        The attribute of the cell formats a rule sets and (index, value)
+        pairs for the cells it applies to
+        """
+        kind = rule.type
+        if kind == "colorScale":
+            return "color", self._color_scale(rule.colorScale, cells)
+        if kind == "dataBar":
+            return "bar", self._data_bar(rule.dataBar, cells)
+        if kind == "iconSet":
+            return "icon", self._icon_set(rule.iconSet, cells)
+
+        if kind == "cellIs":
+            mask = self._cell_is(rule, cells)
+        elif kind == "expression":
+            mask = self._expression(rule, cells)
+        elif kind == "top10":
+            mask = _top10(rule, cells)
+        elif kind == "aboveAverage":
+            mask = _above_average(rule, cells)
+        elif kind in ("duplicateValues", "uniqueValues"):
+            mask = _duplicates(cells, kind == "duplicateValues")
+        elif kind in TEXT_RULES:
+            text = (rule.text or "").lower()
+            test = TEXT_RULES[kind]
+            mask = [v.__class__ is not Error and test(to_text(v).lower(), text)
+                    for v in cells.values]
+        elif kind in ("containsBlanks", "notContainsBlanks"):
+            blank = kind == "containsBlanks"
+            mask = [(v is None or (v.__class__ is str and not v.strip())) is blank
+                    for v in cells.values]
+        elif kind in ("containsErrors", "notContainsErrors"):
+            error = kind == "containsErrors"
+            mask = [(v.__class__ is Error) is error for v in cells.values]
+        else:
+            return
+
+        dxf = rule.dxf
+        if dxf is None and rule.dxfId is not None:
+            styles = self.ws.parent._differential_styles.styles
+            if rule.dxfId < len(styles):
+                dxf = styles[rule.dxfId]
+        return "dxf", ((idx, dxf) for idx in _indices(mask))
+
+
+    def _cell_is(self, rule, cells):
+        operator = rule.operator
+        formulae = [self._formula(f, cells) for f in rule.formula[:2]]
+        if not formulae or (operator in ("between", "notBetween") and len(formulae) < 2):
+            return []
+
+        if (numpy is not None and cells.numeric
+            and all(f.__class__ in (int, float) for f in formulae)):
+            x = numpy.nan_to_num(cells.numbers, nan=0.0)
+            if operator in ("between", "notBetween"):
+                low, high = sorted(formulae)
+                inside = (x >= low) & (x <= high)
+                return inside if operator == "between" else ~inside
+            value = formulae[0]
+            op = CELL_IS[operator]
+            if op == "<":
+                return x < value
+            if op == "<=":
+                return x <= value
+            if op == "=":
+                return x == value
+            if op == "<>":
+                return x != value
+            if op == ">=":
+                return x >= value
+            return x > value
+
+        columns = [f if f.__class__ is list else [f] * len(cells.values)
+                   for f in formulae]
+        mask = []
+        for idx, value in enumerate(cells.values):
+            operands = [column[idx] for column in columns]
+            if value.__class__ is Error or any(o.__class__ is Error for o in operands):
+                mask.append(False)
+                continue
+            try:
+                if operator in ("between", "notBetween"):
+                    low, high = operands
+                    if compare(">", low, high):
+                        low, high = high, low
+                    inside = compare(">=", value, low) and compare("<=", value, high)
+                    mask.append(inside is (operator == "between"))
+                else:
+                    mask.append(compare(CELL_IS[operator], value, operands[0]))
+            except TypeError:
+                mask.append(False)
+        return mask
+
+
+    def _expression(self, rule, cells):
+        if not rule.formula:
+            return []
+        values = self._formula(rule.formula[0], cells)
+        if values.__class__ is not list:
+            return [_true(values)] * len(cells.values)
+        return [_true(value) for value in values]
+
+
+    def _thresholds(self, cfvo, cells):
+        """
+        Values of the thresholds of a colour scale, data bar or icon set
+        """
+        valid = cells.valid()
+        if not len(valid):
+            return
+        low, high = float(valid[0]), float(valid[-1])
+        thresholds = []
+        for fmt in cfvo:
+            kind = fmt.type
+            if kind == "min":
+                value = low
+            elif kind == "max":
+                value = high
+            elif kind == "percent":
+                value = self._number(fmt.val, cells)
+                if value is not None:
+                    value = low + (high - low) * value / 100
+            elif kind == "percentile":
+                value = self._number(fmt.val, cells)
+                if value is not None:
+                    value = _percentile(valid, value)
+            else:
+                value = self._number(fmt.val, cells)
+            if value is None:
+                return
+            thresholds.append(float(value))
+        return thresholds
+
+
+    def _color_scale(self, scale, cells):
+        if scale is None:
+            return ()
+        colors = [_rgb(color) for color in scale.color]
+        if len(colors) < 2 or None in colors:
+            return ()
+        thresholds = self._thresholds(scale.cfvo[:len(colors)], cells)
+        if thresholds is None or len(thresholds) != len(colors):
+            return ()
+
+        numbers = cells.numbers
+        if numpy is not None:
+            indices = numpy.flatnonzero(~numpy.isnan(numbers))
+            x = numbers[indices]
+            channels = [numpy.interp(x, thresholds, [c[i] for c in colors])
+                        for i in range(3)]
+            red, green, blue = (numpy.rint(c).astype(int).tolist() for c in channels)
+            return [(idx, "FF%02X%02X%02X" % rgb)
+                    for idx, rgb in zip(indices.tolist(), zip(red, green, blue))]
+
+        found = []
+        for idx, value in enumerate(numbers):
+            if value != value:
+                continue
+            rgb = tuple(round(_interpolate(value, thresholds, [c[i] for c in colors]))
+                        for i in range(3))
+            found.append((idx, "FF%02X%02X%02X" % rgb))
+        return found
+
+
+    def _data_bar(self, bar, cells):
+        if bar is None:
+            return ()
+        cfvo = bar.cfvo
+        if len(cfvo) < 2:
+            return ()
+        thresholds = self._thresholds(cfvo[:2], cells)
+        if thresholds is None:
+            return ()
+        low, high = thresholds
+        shortest = 10 if bar.minLength is None else bar.minLength
+        longest = 90 if bar.maxLength is None else bar.maxLength
+        color = _rgb(bar.color)
+        if color is not None:
+            color = "FF%02X%02X%02X" % color
+
+        numbers = cells.numbers
+        if numpy is not None:
+            indices = numpy.flatnonzero(~numpy.isnan(numbers))
+            x = numbers[indices]
+            if high > low:
+                fraction = numpy.clip((x - low) / (high - low), 0, 1)
+            else:
+                fraction = (x >= high).astype(float)
+            lengths = (shortest + fraction * (longest - shortest)) / 100
+            return [(idx, (length, color))
+                    for idx, length in zip(indices.tolist(), lengths.tolist())]
+
+        found = []
+        for idx, value in enumerate(numbers):
+            if value != value:
+                continue
+            if high > low:
+                fraction = min(max((value - low) / (high - low), 0), 1)
+            else:
+                fraction = float(value >= high)
+            found.append((idx, ((shortest + fraction * (longest - shortest)) / 100, color)))
+        return found
+
+
+    def _icon_set(self, icons, cells):
+        if icons is None:
+            return ()
+        name = icons.iconSet or "3TrafficLights1"
+        cfvo = icons.cfvo[1:int(name[0])]
+        thresholds = self._thresholds(cfvo, cells)
+        if thresholds is None:
+            return ()
+
+        numbers = cells.numbers
+        if numpy is not None:
+            indices = numpy.flatnonzero(~numpy.isnan(numbers))
+            x = numbers[indices]
+            position = numpy.zeros(len(x), dtype=int)
+            for fmt, threshold in zip(cfvo, thresholds):
+                position += (x > threshold) if fmt.gte is False else (x >= threshold)
+            positions = position.tolist()
+            indices = indices.tolist()
+        else:
+            indices = []
+            positions = []
+            for idx, value in enumerate(numbers):
+                if value != value:
+                    continue
+                indices.append(idx)
+                positions.append(sum(
+                    (value > threshold) if fmt.gte is False else (value >= threshold)
+                    for fmt, threshold in zip(cfvo, thresholds)))
+        if icons.reverse:
+            positions = [len(cfvo) - p for p in positions]
+        return [(idx, (name, p)) for idx, p in zip(indices, positions)]
+
+
+TEXT_RULES = {
+    "containsText": lambda value, text: text in value,
+    "notContainsText": lambda value, text: text not in value,
+    "beginsWith": lambda value, text: value.startswith(text),
+    "endsWith": lambda value, text: value.endswith(text),
+}
+
+
+def _top10(rule, cells):
+    valid = cells.valid()
+    count = len(valid)
+    if not count:
+        return []
+    rank = 10 if rule.rank is None else rule.rank
+    if rule.percent:
+        rank = max(1, int(count * rank / 100))
+    rank = min(rank, count)
+    if rank < 1:
+        return []
+    threshold = valid[rank - 1] if rule.bottom else valid[count - rank]
+
+    numbers = cells.numbers
+    if numpy is not None:
+        with numpy.errstate(invalid="ignore"):
+            return numbers <= threshold if rule.bottom else numbers >= threshold
+    if rule.bottom:
+        return [v <= threshold for v in numbers]
+    return [v >= threshold for v in numbers]
+
+
+def _above_average(rule, cells):
+    valid = cells.valid()
+    count = len(valid)
+    if not count:
+        return []
+    if numpy is not None:
+        mean = float(valid.mean())
+    else:
+        mean = sum(valid) / count
+    above = rule.aboveAverage is not False
+    threshold = mean
+    if rule.stdDev:
+        if numpy is not None:
+            deviation = float(valid.std())
+        else:
+            deviation = math.sqrt(sum((v - mean) ** 2 for v in valid) / count)
+        threshold += rule.stdDev * deviation if above else -rule.stdDev * deviation
+
+    numbers = cells.numbers
+    if numpy is not None:
+        with numpy.errstate(invalid="ignore"):
+            if above:
+                return numbers >= threshold if rule.equalAverage else numbers > threshold
+            return numbers <= threshold if rule.equalAverage else numbers < threshold
+    if above:
+        return [v >= threshold if rule.equalAverage else v > threshold for v in numbers]
+    return [v <= threshold if rule.equalAverage else v < threshold for v in numbers]
+
+
+def _duplicates(cells, duplicate):
+    """
+    Cells whose values appear more than once, or only once
+    """
+    if numpy is not None and cells.numeric:
+        numbers = cells.numbers
+        valid = ~numpy.isnan(numbers)
+        _, inverse, counts = numpy.unique(numbers[valid], return_inverse=True,
+                                          return_counts=True)
+        mask = numpy.zeros(len(numbers), dtype=bool)
+        mask[valid] = (counts[inverse] > 1) == duplicate
+        return mask
+
+    keys = [None if v is None else _key(v) for v in cells.values]
+    counts = Counter(k for k in keys if k is not None)
+    return [k is not None and (counts[k] > 1) == duplicate for k in keys]
+
+
+def _indices(mask):
+    if numpy is not None and isinstance(mask, numpy.ndarray):
+        return numpy.flatnonzero(mask).tolist()
+    return [idx for idx, value in enumerate(mask) if value]
+
+
+def _true(value):
+    try:
+        return to_bool(value)
+    except FormulaError:
+        return False
+
+
+def _rgb(color):
+    """
+    Red, green and blue of a colour, or None unless it is an RGB colour
+    """
+    if color is None or color.type != "rgb":
+        return
+    value = color.rgb[-6:]
+    return int(value[:2], 16), int(value[2:4], 16), int(value[4:], 16)
+
+
+def _interpolate(value, thresholds, values):
+    if value <= thresholds[0]:
+        return values[0]
+    for idx in range(1, len(thresholds)):
+        low, high = thresholds[idx - 1], thresholds[idx]
+        if value <= high:
+            if high == low:
+                return values[idx]
+            fraction = (value - low) / (high - low)
+            return values[idx - 1] + fraction * (values[idx] - values[idx - 1])
+    return values[-1]
+
+
+def _percentile(values, percent):
+    """
+    Percentile of sorted numbers, interpolating between them like PERCENTILE.INC
+    """
+    if numpy is not None:
+        return float(numpy.percentile(values, min(max(percent, 0), 100)))
+    k = (len(values) - 1) * min(max(percent, 0), 100) / 100
+    low = math.floor(k)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (k - low)
+
+
+def _merge(dxfs):
+    """
+    Differential style combining those of several rules, the first ones
+    taking precedence
+    """
+    if len(dxfs) == 1:
+        return dxfs[0]
+    parts = {}
+    for name in DifferentialStyle.__elements__:
+        for dxf in dxfs:
+            value = getattr(dxf, name)
+            if value is not None:
+                parts[name] = value
+                break
+    return DifferentialStyle(**parts)
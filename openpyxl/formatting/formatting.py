@@ -12,7 +12,12 @@ from openpyxl.descriptors.serialisable import Serialisable
 
 from .rule import Rule
 
-from openpyxl.worksheet.cell_range import MultiCellRange
+from openpyxl.worksheet.cell_range import (
+    MultiCellRange,
+    RangeIndex,
+    _sqref_state,
+    _unchanged,
+)
 
 class ConditionalFormatting(Serialisable):
 
@@ -59,6 +64,8 @@ class ConditionalFormattingList(object):
     def __init__(self):
         self._cf_rules = OrderedDict()
         self.max_priority = 0
+        self._index = None
+        self._indexed = None
 
 
     def add(self, range_string, cfRule):
@@ -77,6 +84,7 @@ class ConditionalFormattingList(object):
             rule.priority = self.max_priority
 
         self._cf_rules.setdefault(cf, []).append(rule)
+        self._index = None
 
 
     def __bool__(self):
@@ -105,6 +113,7 @@ class ConditionalFormattingList(object):
     def __delitem__(self, key):
         key = ConditionalFormatting(sqref=key)
         del self._cf_rules[key]
+        self._index = None
 
 
     def __setitem__(self, key, rule):
@@ -112,3 +121,33 @@ class ConditionalFormattingList(object):
         Add a rule for a cell range
         """
         self.add(key, rule)
+
+
+    def rules_for(self, coord):
+        """
+        Rules which apply to a cell, given as a coordinate such as "B2", a
+        (row, column) tuple or a cell, or to any cell of a range such as
+        "A1:Z1", in order of priority
+        """
+        rules = []
+        for cf, cf_rules in self._rule_index().search(coord):
+            rules.extend(cf_rules)
+        return sorted(rules, key=lambda rule: rule.priority or 0)
+
+
+    def _rule_index(self):
+        """
+        Formats by the cells they apply to. The index is built again when
+        formats have been added or removed or their ranges have changed.
+        """
+        index = self._index
+        # changing the ranges of a format in place changes its hash, which
+        # only the plain dict methods ignore
+        formats = list(dict.keys(self._cf_rules))
+        if index is None or not _unchanged(self._indexed, formats):
+            # one item per format, whichever of its ranges are found
+            entries = [(cr, item) for item in dict.items(self._cf_rules)
+                       for cr in item[0].sqref]
+            index = self._index = RangeIndex(entries)
+            self._indexed = _sqref_state(formats)
+        return index
@@ -0,0 +1,262 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+from openpyxl.workbook import Workbook
+from openpyxl.formatting.rule import (
+    CellIsRule,
+    ColorScaleRule,
+    DataBarRule,
+    FormulaRule,
+    IconSetRule,
+    Rule,
+)
+from openpyxl.styles import Font, PatternFill
+from openpyxl.styles.differential import DifferentialStyle
+
+
+RED = DifferentialStyle(fill=PatternFill(bgColor="FFC7CE"))
+BOLD = DifferentialStyle(font=Font(b=True))
+
+
+@pytest.fixture(params=["numpy", "python"])
+def ConditionalFormatEvaluator(request, monkeypatch):
+    from .. import evaluate
+    if request.param == "python":
+        monkeypatch.setattr(evaluate, "numpy", None)
+    elif evaluate.numpy is None:
+        pytest.skip("NumPy is not installed")
+    return evaluate.ConditionalFormatEvaluator
+
+
+@pytest.fixture
+def ws():
+    wb = Workbook()
+    ws = wb.active
+    for row in range(1, 11):
+        ws.cell(row, 1, row)
+        ws.cell(row, 2, "odd" if row % 2 else "even")
+        ws.cell(row, 3, f"=A{row}*2")
+    return ws
+
+
+def formatted(styles, attr="dxf"):
+    """
+    Coordinates of the cells with a format and their values of an attribute
+    """
+    from openpyxl.utils import get_column_letter
+    return {f"{get_column_letter(col)}{row}": getattr(fmt, attr)
+            for (row, col), fmt in sorted(styles.items())
+            if getattr(fmt, attr) is not None}
+
+
+class TestDifferentialStyles:
+
+    @pytest.mark.parametrize("operator, formula, expected",
+                             [
+                                 (">", ["7"], ["A8", "A9", "A10"]),
+                                 ("<=", ["2"], ["A1", "A2"]),
+                                 ("=", ["$A$5"], ["A5"]),
+                                 ("between", ["4", "2"], ["A2", "A3", "A4"]),
+                                 ("notBetween", ["2", "9"], ["A1", "A10"]),
+                             ]
+                             )
+    def test_cell_is(self, ConditionalFormatEvaluator, ws, operator, formula, expected):
+        ws.conditional_formatting.add("A1:A10", CellIsRule(operator=operator, formula=formula,
+                                                            fill=RED.fill))
+        styles = ConditionalFormatEvaluator(ws).style_map()
+        assert list(formatted(styles)) == expected
+
+
+    def test_cell_is_text(self, ConditionalFormatEvaluator, ws):
+        ws.conditional_formatting.add("B1:B10", CellIsRule(operator="=", formula=['"ODD"'],
+                                                            fill=RED.fill))
+        styles = ConditionalFormatEvaluator(ws).style_map()
+        assert list(formatted(styles)) == ["B1", "B3", "B5", "B7", "B9"]
+
+
+    def test_cell_is_relative(self, ConditionalFormatEvaluator, ws):
+        ws.conditional_formatting.add("C1:C10", CellIsRule(operator=">", formula=["A1+8"],
+                                                            fill=RED.fill))
+        styles = ConditionalFormatEvaluator(ws).style_map()
+        assert list(formatted(styles)) == ["C9", "C10"]
+
+
+    def test_expression(self, ConditionalFormatEvaluator, ws):
+        ws.conditional_formatting.add("A1:C10", FormulaRule(formula=['$B1="even"'],
+                                                             font=BOLD.font))
+        styles = ConditionalFormatEvaluator(ws).style_map()
+        assert list(formatted(styles)) == [f"{col}{row}" for row in range(2, 11, 2)
+                                           for col in "ABC"]
+        assert styles[(2, 1)].dxf is styles[(4, 3)].dxf
+
+
+    @pytest.mark.parametrize("kwargs, expected",
+                             [
+                                 ({"rank": 2}, ["C9", "C10"]),
+                                 ({"rank": 3, "bottom": True}, ["C1", "C2", "C3"]),
+                                 ({"rank": 20, "percent": True}, ["C9", "C10"]),
+                             ]
+                             )
+    def test_top10(self, ConditionalFormatEvaluator, ws, kwargs, expected):
+        ws.conditional_formatting.add("C1:C10", Rule(type="top10", dxf=BOLD, **kwargs))
+        styles = ConditionalFormatEvaluator(ws).style_map()
+        assert list(formatted(styles)) == expected
+
+
+    @pytest.mark.parametrize("kwargs, expected",
+                             [
+                                 ({}, ["A6", "A7", "A8", "A9", "A10"]),
+                                 ({"aboveAverage": False}, ["A1", "A2", "A3", "A4", "A5"]),
+                                 ({"stdDev": 1}, ["A9", "A10"]),
+                             ]
+                             )
+    def test_above_average(self, ConditionalFormatEvaluator, ws, kwargs, expected):
+        ws.conditional_formatting.add("A1:A10", Rule(type="aboveAverage", dxf=BOLD, **kwargs))
+        styles = ConditionalFormatEvaluator(ws).style_map()
+        assert list(formatted(styles)) == expected
+
+
+    def test_duplicates(self, ConditionalFormatEvaluator, ws):
+        ws["D1"] = 1
+        ws["D2"] = 2
+        ws["D3"] = 1.0
+        ws["E1"] = "a"
+        ws["E2"] = "A"
+        ws["E3"] = "b"
+        ws.conditional_formatting.add("D1:D3 E1:E3", Rule(type="duplicateValues", dxf=BOLD))
+        ws.conditional_formatting.add("D1:D3", Rule(type="uniqueValues", dxf=RED))
+        styles = ConditionalFormatEvaluator(ws).style_map("D1:E10")
+        assert formatted(styles) == {"D1": BOLD, "D2": RED, "D3": BOLD, "E1": BOLD,
+                                     "E2": BOLD}
+
+
+    @pytest.mark.parametrize("rule, expected",
+                             [
+                                 (Rule(type="containsText", text="DD"), ["B1"]),
+                                 (Rule(type="notContainsText", text="d"), ["B2", "B3"]),
+                                 (Rule(type="beginsWith", text="e"), ["B2"]),
+                                 (Rule(type="endsWith", text="d"), ["B1"]),
+                                 (Rule(type="containsBlanks"), ["B3"]),
+                                 (Rule(type="notContainsBlanks"), ["B1", "B2"]),
+                             ]
+                             )
+    def test_text(self, ConditionalFormatEvaluator, ws, rule, expected):
+        ws["B3"] = " "
+        rule.dxf = BOLD
+        ws.conditional_formatting.add("B1:B3", rule)
+        styles = ConditionalFormatEvaluator(ws).style_map()
+        assert list(formatted(styles)) == expected
+
+
+    def test_errors(self, ConditionalFormatEvaluator, ws):
+        ws["D1"] = "=1/0"
+        ws["D2"] = 1
+        ws.conditional_formatting.add("D1:D2", Rule(type="containsErrors", dxf=RED))
+        ws.conditional_formatting.add("D1:D2", Rule(type="notContainsErrors", dxf=BOLD))
+        styles = ConditionalFormatEvaluator(ws).style_map()
+        assert formatted(styles) == {"D1": RED, "D2": BOLD}
+
+
+    def test_priority(self, ConditionalFormatEvaluator, ws):
+        red_bold = DifferentialStyle(font=Font(b=True, color="FF0000"), fill=RED.fill)
+        ws.conditional_formatting.add("A1:A10", CellIsRule(operator=">", formula=["5"],
+                                                            fill=RED.fill))
+        ws.conditional_formatting.add("A1:A10", Rule(type="cellIs", operator="greaterThan",
+                                                     formula=["8"], dxf=red_bold))
+        ws.conditional_formatting.add("A1:A10", Rule(type="cellIs", operator="lessThan",
+                                                     formula=["3"], dxf=BOLD,
+                                                     stopIfTrue=True))
+        ws.conditional_formatting.add("A1:A10", Rule(type="cellIs", operator="lessThan",
+                                                     formula=["5"], dxf=RED))
+        rules = ws.conditional_formatting.rules_for("A1")
+        rules[2].priority = 1
+        rules[0].priority = 3
+        styles = ConditionalFormatEvaluator(ws).style_map()
+        dxfs = formatted(styles)
+        assert dxfs["A1"] == BOLD
+        assert dxfs["A3"] == RED
+        assert dxfs["A6"] == DifferentialStyle(fill=RED.fill)
+        assert dxfs["A9"] == red_bold
+
+
+    def test_cell_range(self, ConditionalFormatEvaluator, ws):
+        ws.conditional_formatting.add("A1:A10", Rule(type="top10", rank=1, dxf=BOLD))
+        ws.conditional_formatting.add("B1:B10", Rule(type="containsText", text="o",
+                                                     dxf=RED))
+        evaluator = ConditionalFormatEvaluator(ws)
+        assert formatted(evaluator.style_map("A8:A10")) == {"A10": BOLD}
+        assert formatted(evaluator.style_map("C1:D10")) == {}
+
+
+    def test_cell_range_across_ranges(self, ConditionalFormatEvaluator, ws):
+        ws.conditional_formatting.add("A1:A10 C1:C10", Rule(type="expression",
+                                                            formula=["TRUE"], dxf=BOLD))
+        styles = ConditionalFormatEvaluator(ws).style_map("A1:C2")
+        assert formatted(styles) == {"A1": BOLD, "A2": BOLD, "C1": BOLD, "C2": BOLD}
+        assert styles[(1, 1)].dxf is BOLD
+
+
+class TestScales:
+
+    def test_color_scale(self, ConditionalFormatEvaluator, ws):
+        rule = ColorScaleRule(start_type="min", start_color="F8696B",
+                              mid_type="percentile", mid_value=50, mid_color="FFFFFF",
+                              end_type="num", end_value=9, end_color="63BE7B")
+        ws.conditional_formatting.add("A1:B10", rule)
+        styles = ConditionalFormatEvaluator(ws).style_map()
+        colors = formatted(styles, "color")
+        assert list(colors) == [f"A{row}" for row in range(1, 11)]
+        assert colors["A1"] == "FFF8696B"
+        assert colors["A3"] == "FFFBACAD"
+        assert colors["A9"] == colors["A10"] == "FF63BE7B"
+
+
+    def test_theme_colors(self, ConditionalFormatEvaluator, ws):
+        from openpyxl.styles.colors import Color
+        rule = ColorScaleRule(start_type="min", start_color=Color(theme=4),
+                              end_type="max", end_color="FFFFFF")
+        ws.conditional_formatting.add("A1:A10", rule)
+        assert ConditionalFormatEvaluator(ws).style_map() == {}
+
+
+    def test_data_bar(self, ConditionalFormatEvaluator, ws):
+        rule = DataBarRule(start_type="num", start_value=2, end_type="max",
+                           color="638EC6")
+        ws.conditional_formatting.add("C1:C10", rule)
+        styles = ConditionalFormatEvaluator(ws).style_map()
+        bars = formatted(styles, "bar")
+        assert bars["C1"] == 0.1
+        assert bars["C6"] == pytest.approx(0.5444444)
+        assert bars["C10"] == 0.9
+        assert styles[(1, 3)].bar_color == "FF638EC6"
+
+
+    def test_icon_set(self, ConditionalFormatEvaluator, ws):
+        rule = IconSetRule("3Arrows", "num", [0, 4, 8])
+        ws.conditional_formatting.add("A1:A10", rule)
+        styles = ConditionalFormatEvaluator(ws).style_map()
+        assert [fmt.icon for pos, fmt in sorted(styles.items())] == [0, 0, 0, 1, 1, 1,
+                                                                    1, 2, 2, 2]
+        assert styles[(1, 1)].icon_set == "3Arrows"
+        rule.iconSet.reverse = True
+        styles = ConditionalFormatEvaluator(ws).style_map()
+        assert styles[(1, 1)].icon == 2
+
+
+def test_cell_format():
+    from ..evaluate import CellFormat
+    fmt = CellFormat(color="FFFFFFFF", icon_set="3Arrows", icon=1)
+    assert fmt == CellFormat(color="FFFFFFFF", icon_set="3Arrows", icon=1)
+    assert fmt != CellFormat(color="FFFFFFFF")
+    assert repr(fmt) == "<CellFormat color='FFFFFFFF', icon_set='3Arrows', icon=1>"
+
+
+def test_loaded(datadir):
+    from openpyxl import load_workbook
+    from ..evaluate import ConditionalFormatEvaluator
+    datadir.chdir()
+    wb = load_workbook("conditional-formatting.xlsx")
+    ws = wb.active
+    styles = ConditionalFormatEvaluator(ws).style_map()
+    assert styles
@@ -200,3 +200,44 @@ class TestConditionalFormatting:
     def test_contains(self, ConditionalFormatting):
         c2 = ConditionalFormatting("A1:A5 B1:B5")
         assert "B2" in c2
+
+
+class TestConditionalFormattingList:
+
+    def test_rules_for(self):
+        cf = ConditionalFormattingList()
+        first = Rule(type="expression", formula=["TRUE"])
+        second = Rule(type="expression", formula=["FALSE"])
+        third = Rule(type="expression", formula=["TRUE"])
+        cf.add("A1:A10 C1:C10", first)
+        cf.add("A5:E5", second)
+        cf.add("A1:A10 C1:C10", third)
+        second.priority = 0
+        assert cf.rules_for("A5") == [second, first, third]
+        assert cf.rules_for((2, 3)) == [first, third]
+        assert cf.rules_for("B1:B4") == []
+        assert cf.rules_for("E1:E10") == [second]
+        assert cf.rules_for("A1:C3") == [first, third]
+
+
+    def test_changes(self):
+        from openpyxl import Workbook
+        ws = Workbook().active
+        cf = ws.conditional_formatting
+        rule = Rule(type="expression", formula=["TRUE"])
+        cf.add("A1:B2", rule)
+        assert cf.rules_for("A3") == []
+        ws.insert_rows_many([(1, 2)])
+        assert cf.rules_for("A3") == [rule]
+        del cf["A3:B4"]
+        assert cf.rules_for("A3") == []
+
+
+    def test_changes_in_place(self, ConditionalFormatting):
+        cf = ConditionalFormattingList()
+        rule = Rule(type="expression", formula=["TRUE"])
+        fmt = ConditionalFormatting("A1:B2")
+        cf.add(fmt, rule)
+        assert cf.rules_for("E1") == []
+        fmt.sqref.add("E1")
+        assert cf.rules_for("E1") == [rule]
@@ -0,0 +1,366 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Index the references between the formulae and cells of a workbook.
+
+Every formula is parsed once and the cells and ranges it refers to, directly
+or through defined names, are indexed so that both the cells a formula reads
+(its precedents) and the formulae which read a cell (its dependents) can be
+found without tokenizing any formulae. The same index is used to rewrite
+references when rows or columns are inserted or deleted.
+"""
+
+from openpyxl.worksheet.cell_range import CellRange
+
+from .parser import ParseError, parse, references
+from .references import ReferenceIndex, _formula_text, _parse_range, _sheet_name
+from .translate import Translator
+
+
+MAX_ROW = 1048576
+MAX_COLUMN = 16384
+
+# References to more columns than this are not indexed by column
+WIDE = 64
+
+
+class DependencyIndex(ReferenceIndex):
+
+    """
+    The references between the formulae and cells of a workbook.
+
+    This extends the workbook's index of formulae by the worksheets they
+    refer to, which is used when rows or columns are inserted or deleted,
+    and each formula is only parsed once for both.
+
+    Cells update the index when they are assigned and the index is rebuilt
+    when rows or columns are inserted, deleted or moved. Call
+    :meth:`rebuild` after changing defined names.
+    """
+
+    tracks_cells = True
+
+    def __init__(self, workbook):
+        self._listeners = []
+        self._trees = {}
+        super().__init__(workbook)
+
+
+    def rebuild(self):
+        """
+        Index all the formulae of the workbook again
+        """
+        self._formulae = {}         # (ws, row, col): (tree, refs, names)
+        self._columns = {}          # ws: {col: {row}} of formulae
+        self._cell_dependents = {}  # (ws, row, col): {key}
+        self._column_dependents = {}    # (ws, col): {(min_row, max_row): {key}}
+        self._wide_dependents = {}  # ws: {(min_col, min_row, max_col, max_row): {key}}
+        self._name_dependents = {}  # name: {key}
+        self._sheets = {}
+        super().rebuild()
+        for listener in self._listeners:
+            listener(None)
+
+
+    def _index_cell(self, cell):
+        self._add((cell.parent, cell.row, cell.column), cell)
+        self.add(cell)
+
+
+    def changed(self, cell):
+        """
+        Update the index after the value of a cell has changed
+        """
+        key = (cell.parent, cell.row, cell.column)
+        if key in self._formulae:
+            self._remove(key)
+        if cell.data_type == "f":
+            self._index_cell(cell)
+        else:
+            self.discard(cell)
+        for listener in self._listeners:
+            listener(key)
+
+
+    def _refs(self, text):
+        """
+        References of a formula from its expression tree
+        """
+        tree = self._parse(text)
+        if tree[0] == "error":
+            return super()._refs(text)
+        return [(node[1],) + tuple(node[2:]) for node in references(tree)
+                if node[0] == "ref"]
+
+
+    def precedents(self, cell, recursive=False):
+        """
+        Cells and ranges the formula of a cell refers to, including those of
+        the defined names it uses, as :class:`CellRange` objects with the
+        title of their worksheet. If recursive is True the precedents of
+        formulae in those cells are included as well.
+        """
+        keys = [(cell.parent, cell.row, cell.column)]
+        seen = set(keys)
+        found = {}
+        while keys:
+            entry = self._formulae.get(keys.pop())
+            if entry is None:
+                continue
+            for ref in entry[1]:
+                if ref in found:
+                    continue
+                ws, min_col, min_row, max_col, max_row = ref
+                found[ref] = CellRange(min_col=min_col, min_row=min_row,
+                                       max_col=max_col, max_row=max_row,
+                                       title=ws.title)
+                if recursive:
+                    for key in self._formulae_in(*ref):
+                        if key not in seen:
+                            seen.add(key)
+                            keys.append(key)
+        return list(found.values())
+
+
+    def dependents(self, ref, recursive=False):
+        """
+        Cells whose formulae refer to a cell, a range such as "Sheet1!A1:B5"
+        or a defined name. If recursive is True the dependents of those
+        cells are included as well.
+        """
+        if isinstance(ref, str):
+            keys = self._resolve(ref)
+        else:
+            keys = set(self._dependents(ref.parent, ref.column, ref.row,
+                                        ref.column, ref.row))
+        if recursive:
+            stack = list(keys)
+            while stack:
+                ws, row, col = stack.pop()
+                for key in self._dependents(ws, col, row, col, row):
+                    if key not in keys:
+                        keys.add(key)
+                        stack.append(key)
+        return self._cells(keys)
+
+
+    def _cells(self, keys):
+        """
+        Cells in the order of their worksheets, rows and columns
+        """
+        sheets = {}
+        for ws, row, col in keys:
+            sheets.setdefault(ws, []).append((row, col))
+        cells = []
+        for ws in self.workbook._sheets:
+            positions = sheets.get(ws)
+            if not positions:
+                continue
+            positions.sort()
+            get = ws._cells.get
+            for pos in positions:
+                cell = get(pos)
+                if cell is not None:
+                    cells.append(cell)
+        return cells
+
+
+    def _resolve(self, ref):
+        """
+        Formulae which refer to a range given as text or to a defined name
+        """
+        ws_part, coord = Translator.strip_ws_name(ref)
+        bounds = _parse_range(coord)
+        if bounds is None:
+            name = coord.lower()
+            keys = set(self._name_dependents.get(name, ()))
+            if ws_part:
+                ws = self._sheet(_sheet_name(ws_part) or "")
+                keys = {key for key in keys if key[0] is ws}
+            return keys
+        if not ws_part:
+            raise ValueError(f"{ref!r} does not include a worksheet")
+        ws = self._sheet(_sheet_name(ws_part) or "")
+        if ws is None:
+            raise KeyError(f"Worksheet {ws_part[:-1]} does not exist")
+        min_col, min_row, max_col, max_row = bounds
+        return set(self._dependents(ws, min_col or 1, min_row or 1,
+                                    max_col or MAX_COLUMN, max_row or MAX_ROW))
+
+
+    def _parse(self, text):
+        tree = self._trees.get(text)
+        if tree is None:
+            try:
+                tree = parse(text)
+            except ParseError:
+                tree = ("error", "#NAME?")
+            self._trees[text] = tree
+        return tree
+
+
+    def _sheet(self, title):
+        ws = self._sheets.get(title.lower())
+        if ws is None or ws.title.lower() != title.lower() or ws not in self.workbook._sheets:
+            self._sheets = {ws.title.lower(): ws for ws in self.workbook.worksheets}
+            ws = self._sheets.get(title.lower())
+        return ws
+
+
+    def _definition(self, ws, sheet, name):
+        """
+        Expression tree of a defined name, local names taking precedence over
+        global ones
+        """
+        scopes = []
+        if sheet is not None:
+            scopes.append(self._sheet(sheet))
+        else:
+            scopes.extend([ws, self.workbook])
+        for scope in scopes:
+            names = getattr(scope, "defined_names", None)
+            if not names:
+                continue
+            defn = names.get(name)
+            if defn is None:
+                for key, value in names.items():
+                    if key.lower() == name.lower():
+                        defn = value
+                        break
+            if defn is not None and isinstance(defn.value, str):
+                return self._parse("=" + defn.value)
+
+
+    def _references(self, ws, tree, names, seen=()):
+        """
+        Cells and ranges an expression refers to as (ws, min_col, min_row,
+        max_col, max_row) including those of defined names, which are added
+        to names
+        """
+        refs = []
+        for node in references(tree):
+            if node[0] == "name":
+                name = node[2].lower()
+                names.add(name)
+                if name in seen:
+                    continue
+                definition = self._definition(ws, node[1], node[2])
+                if definition is not None:
+                    refs.extend(self._references(ws, definition, names, seen + (name,)))
+                continue
+            target = ws if node[1] is None else self._sheet(node[1])
+            if target is None:
+                continue
+            min_col, min_row, max_col, max_row = node[2:]
+            refs.append((target, min_col or 1, min_row or 1,
+                         max_col or MAX_COLUMN, max_row or MAX_ROW))
+        return refs
+
+
+    def _add(self, key, cell):
+        text = _formula_text(cell)
+        if text is None:
+            return
+        ws, row, col = key
+        tree = self._parse(text)
+        names = set()
+        refs = list(dict.fromkeys(self._references(ws, tree, names)))
+        self._formulae[key] = tree, refs, names
+        self._columns.setdefault(ws, {}).setdefault(col, set()).add(row)
+
+        for name in names:
+            self._name_dependents.setdefault(name, set()).add(key)
+        for target, min_col, min_row, max_col, max_row in refs:
+            if min_col == max_col and min_row == max_row:
+                self._cell_dependents.setdefault((target, min_row, min_col), set()).add(key)
+            elif max_col - min_col < WIDE:
+                span = min_row, max_row
+                for c in range(min_col, max_col + 1):
+                    spans = self._column_dependents.setdefault((target, c), {})
+                    spans.setdefault(span, set()).add(key)
+            else:
+                bounds = self._wide_dependents.setdefault(target, {})
+                bounds.setdefault((min_col, min_row, max_col, max_row), set()).add(key)
+
+
+    def _remove(self, key):
+        _, refs, names = self._formulae.pop(key)
+        ws, row, col = key
+        rows = self._columns[ws][col]
+        rows.discard(row)
+        if not rows:
+            del self._columns[ws][col]
+
+        for name in names:
+            _discard(self._name_dependents, name, key)
+        for target, min_col, min_row, max_col, max_row in refs:
+            if min_col == max_col and min_row == max_row:
+                _discard(self._cell_dependents, (target, min_row, min_col), key)
+            elif max_col - min_col < WIDE:
+                for c in range(min_col, max_col + 1):
+                    spans = self._column_dependents.get((target, c), {})
+                    _discard(spans, (min_row, max_row), key)
+            else:
+                bounds = self._wide_dependents.get(target, {})
+                _discard(bounds, (min_col, min_row, max_col, max_row), key)
+
+
+    def _dependents(self, ws, min_col, min_row, max_col, max_row):
+        """
+        Formulae which refer to any of the cells of a range. Formulae may be
+        included more than once.
+        """
+        cells = self._cell_dependents
+        if (max_col - min_col + 1) * (max_row - min_row + 1) <= len(cells):
+            for row in range(min_row, max_row + 1):
+                for col in range(min_col, max_col + 1):
+                    yield from cells.get((ws, row, col), ())
+        else:
+            for (target, row, col), keys in cells.items():
+                if (target is ws and min_row <= row <= max_row
+                    and min_col <= col <= max_col):
+                    yield from keys
+
+        for col in range(min_col, min(max_col, MAX_COLUMN) + 1):
+            spans = self._column_dependents.get((ws, col))
+            if not spans:
+                continue
+            for (lo, hi), keys in spans.items():
+                if lo <= max_row and min_row <= hi:
+                    yield from keys
+
+        for (lo_col, lo_row, hi_col, hi_row), keys in self._wide_dependents.get(ws, {}).items():
+            if (lo_col <= max_col and min_col <= hi_col
+                and lo_row <= max_row and min_row <= hi_row):
+                yield from keys
+
+
+    def _formulae_in(self, ws, min_col, min_row, max_col, max_row):
+        """
+        Formulae in a range
+        """
+        columns = self._columns.get(ws)
+        if not columns:
+            return
+        if max_col - min_col + 1 > len(columns):
+            cols = [col for col in columns if min_col <= col <= max_col]
+        else:
+            cols = [col for col in range(min_col, max_col + 1) if col in columns]
+        for col in cols:
+            rows = columns[col]
+            if len(rows) > max_row - min_row + 1:
+                for row in range(min_row, max_row + 1):
+                    if row in rows:
+                        yield ws, row, col
+            else:
+                for row in rows:
+                    if min_row <= row <= max_row:
+                        yield ws, row, col
+
+
+def _discard(index, key, value):
+    values = index.get(key)
+    if values is not None:
+        values.discard(value)
+        if not values:
+            del index[key]
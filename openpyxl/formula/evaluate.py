@@ -0,0 +1,460 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Calculate the values of formulae.
+
+An :class:`Evaluator` uses the workbook's index of the references between
+formulae and cells. Values are only calculated when they are asked for, and
+when a cell is changed only the formulae which depend on it, directly or
+indirectly, have to be calculated again.
+"""
+
+from math import isfinite
+
+from openpyxl.utils.datetime import to_excel
+
+from .functions import (
+    Error,
+    FormulaError,
+    Range,
+    FUNCTIONS,
+    ERROR_FUNCTIONS,
+    NAME,
+    VALUE,
+    REF,
+    DIV0,
+    NUM,
+    numpy,
+    power_,
+    scalar,
+    to_number,
+    to_text,
+    compare,
+)
+from .dependencies import MAX_ROW, MAX_COLUMN
+
+
+COMPARISONS = {"=", "<>", "<", ">", "<=", ">="}
+ARITHMETIC = {"+", "-", "*", "/", "^"}
+
+
+def _error(exc):
+    """
+    Error value for an exception raised by a function
+    """
+    if isinstance(exc, FormulaError):
+        return exc.error
+    if isinstance(exc, ZeroDivisionError):
+        return DIV0
+    if isinstance(exc, OverflowError):
+        return NUM
+    return VALUE
+
+
+def _arithmetic(op, left, right):
+    left = to_number(left)
+    right = to_number(right)
+    if op == "+":
+        result = left + right
+    elif op == "-":
+        result = left - right
+    elif op == "*":
+        result = left * right
+    elif op == "/":
+        result = left / right
+    else:
+        result = power_(left, right)
+    if not isfinite(result):
+        raise OverflowError # Excel has no infinity
+    return result
+
+
+def _operate(op, left, right):
+    """
+    Apply a binary operator to two single values
+    """
+    if left.__class__ is Error:
+        return left
+    if right.__class__ is Error:
+        return right
+    try:
+        if op == "&":
+            return to_text(left) + to_text(right)
+        if op in COMPARISONS:
+            return compare(op, left, right)
+        return _arithmetic(op, left, right)
+    except (FormulaError, ArithmeticError, ValueError, TypeError) as e:
+        return _error(e)
+
+
+def _broadcast(op, left, right):
+    """
+    Apply a binary operator to each value of one or two ranges of the same
+    shape
+    """
+    if numpy is not None and op in ARITHMETIC:
+        operands = []
+        for value in (left, right):
+            if value.__class__ is Range:
+                value = value.operands()
+            elif value is None or value.__class__ in (int, float, bool):
+                value = float(value or 0)
+            else:
+                value = None
+            operands.append(value)
+        a, b = operands
+        if (a is not None and b is not None
+            and (numpy.ndim(a) == 0 or numpy.ndim(b) == 0 or a.shape == b.shape)):
+            with numpy.errstate(all="ignore"):
+                if op == "+":
+                    result = a + b
+                elif op == "-":
+                    result = a - b
+                elif op == "*":
+                    result = a * b
+                elif op == "/":
+                    result = a / b
+                else:
+                    result = a ** b
+            # errors such as division by zero are found value by value
+            if numpy.isfinite(result).all():
+                return Range(array=result)
+
+    shapes = {value.shape for value in (left, right) if value.__class__ is Range}
+    if len(shapes) > 1:
+        return VALUE
+    height, width = shapes.pop()
+    rows = []
+    for i in range(height):
+        row = []
+        for j in range(width):
+            a = left.rows[i][j] if left.__class__ is Range else left
+            b = right.rows[i][j] if right.__class__ is Range else right
+            row.append(_operate(op, a, b))
+        rows.append(row)
+    return Range(rows)
+
+
+def _unary(op, value):
+    if op == "+" or value.__class__ is Error:
+        return value
+    try:
+        number = to_number(value)
+    except FormulaError as e:
+        return e.error
+    if op == "-":
+        return -number
+    if op == "%":
+        return number / 100
+    return number
+
+
+def _result(value):
+    """
+    Value of a formula as it is stored in a cell
+    """
+    if value.__class__ is Range:
+        try:
+            value = scalar(value)
+        except FormulaError as e:
+            return e.error
+    if value is None:
+        return 0
+    if numpy is not None and isinstance(value, numpy.generic):
+        value = value.item()
+    if value.__class__ is float:
+        if not isfinite(value):
+            return NUM
+        if value.is_integer() and abs(value) < 2**53:
+            return int(value)
+    return value
+
+
+def _constant(cell, epoch):
+    """
+    Value of a cell without a formula as it is used in calculations
+    """
+    value = cell._value
+    data_type = cell.data_type
+    if data_type == "s":
+        return value if value.__class__ is str else str(value)
+    if data_type == "e":
+        return Error(value)
+    if data_type == "d":
+        return to_excel(value, epoch)
+    if data_type == "f":
+        return # data table formulae
+    return value
+
+
+class Evaluator:
+
+    """
+    Calculate the formulae of a workbook.
+
+    The evaluator uses the workbook's reference index so that when a cell
+    changes only the formulae which depend on it are calculated again.
+    """
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self.index = workbook.build_reference_index()
+        self._values = {}
+        self._ranges = {}
+        self._pending = set()
+        self._reset()
+        self.index._listeners.append(self._changed)
+        workbook._evaluator = self
+
+
+    def value(self, cell):
+        """
+        Calculated value of a cell
+        """
+        key = (cell.parent, cell.row, cell.column)
+        if key in self.index._formulae:
+            if key in self._dirty:
+                self._compute(key)
+            return self._values.get(key)
+        return self._cell_value(*key)
+
+
+    def cached(self, cell):
+        """
+        Value calculated for a formula, or None if it has not been calculated
+        since the cell or any of the cells it depends on changed
+        """
+        return self._values.get((cell.parent, cell.row, cell.column))
+
+
+    def recalculate(self):
+        """
+        Calculate all formulae whose values are not up to date
+        """
+        for key in list(self._dirty):
+            if key in self._dirty:
+                self._compute(key)
+
+
+    def _reset(self):
+        self._values.clear()
+        self._ranges.clear()
+        self._dirty = set()
+        self._dirty_columns = {}    # ws: {col: {row}}
+        for key in self.index._formulae:
+            self._mark_dirty(key)
+
+
+    def _changed(self, key):
+        """
+        Called by the index after a cell has changed, or with None after it
+        has been rebuilt
+        """
+        if key is None:
+            self._reset()
+            return
+        self._values.pop(key, None)
+        if key in self.index._formulae:
+            self._mark_dirty(key)
+        else:
+            self._mark_clean(key)
+        self._invalidate(key)
+
+
+    def _mark_dirty(self, key):
+        self._dirty.add(key)
+        ws, row, col = key
+        self._dirty_columns.setdefault(ws, {}).setdefault(col, set()).add(row)
+
+
+    def _mark_clean(self, key):
+        if key not in self._dirty:
+            return
+        self._dirty.remove(key)
+        ws, row, col = key
+        columns = self._dirty_columns[ws]
+        rows = columns[col]
+        rows.remove(row)
+        if not rows:
+            del columns[col]
+
+
+    def _invalidate(self, key):
+        """
+        Mark all the formulae which depend on a cell as out of date
+        """
+        dependents = self.index._dependents
+        changed = [key]
+        stack = [key]
+        while stack:
+            ws, row, col = stack.pop()
+            for dependent in dependents(ws, col, row, col, row):
+                if dependent not in self._dirty:
+                    self._values.pop(dependent, None)
+                    self._mark_dirty(dependent)
+                    stack.append(dependent)
+                    changed.append(dependent)
+
+        for bounds in list(self._ranges):
+            ws, min_col, min_row, max_col, max_row = bounds
+            for target, row, col in changed:
+                if (target is ws and min_row <= row <= max_row
+                    and min_col <= col <= max_col):
+                    del self._ranges[bounds]
+                    break
+
+
+    def _dirty_precedents(self, key):
+        """
+        Formulae which a formula refers to and which are out of date
+        """
+        dirty = self._dirty
+        for ws, min_col, min_row, max_col, max_row in self.index._formulae[key][1]:
+            if min_col == max_col and min_row == max_row:
+                precedent = (ws, min_row, min_col)
+                if precedent in dirty:
+                    yield precedent
+                continue
+            columns = self._dirty_columns.get(ws)
+            if not columns:
+                continue
+            if max_col - min_col + 1 > len(columns):
+                cols = [col for col in columns if min_col <= col <= max_col]
+            else:
+                cols = [col for col in range(min_col, max_col + 1) if col in columns]
+            for col in cols:
+                rows = columns[col]
+                if len(rows) > max_row - min_row + 1:
+                    for row in range(min_row, max_row + 1):
+                        if row in rows:
+                            yield ws, row, col
+                else:
+                    for row in rows:
+                        if min_row <= row <= max_row:
+                            yield ws, row, col
+
+
+    def _compute(self, key):
+        """
+        Calculate a formula after any out of date formulae it depends on.
+        A stack is used instead of recursion so that long chains of formulae
+        can be calculated. Formulae in circular references see each other
+        as 0.
+        """
+        pending = self._pending
+        formulae = self.index._formulae
+        visited = []
+        stack = [key]
+        try:
+            while stack:
+                current = stack[-1]
+                if current not in self._dirty:
+                    stack.pop()
+                    continue
+                if current not in pending:
+                    pending.add(current)
+                    visited.append(current)
+                    precedents = [k for k in self._dirty_precedents(current)
+                                  if k not in pending]
+                    if precedents:
+                        stack.extend(precedents)
+                        continue
+                stack.pop()
+                value = self._evaluate(formulae[current][0], current[0])
+                self._values[current] = _result(value)
+                self._mark_clean(current)
+        finally:
+            pending.difference_update(visited)
+
+
+    def _cell_value(self, ws, row, col):
+        key = (ws, row, col)
+        if key in self.index._formulae:
+            if key in self._dirty and key not in self._pending:
+                self._compute(key)
+            return self._values.get(key, 0)
+
+        cell = ws._cells.get((row, col))
+        if cell is None:
+            return
+        return _constant(cell, self.workbook.epoch)
+
+
+    def _range(self, ws, min_col, min_row, max_col, max_row):
+        key = (ws, min_col, min_row, max_col, max_row)
+        rng = self._ranges.get(key)
+        if rng is None:
+            # whole rows and columns are limited to the cells in use
+            max_row = min(max_row, ws.max_row)
+            max_col = min(max_col, ws.max_column)
+            cols = range(min_col, max_col + 1)
+            value = self._cell_value
+            rows = [[value(ws, row, col) for col in cols]
+                    for row in range(min_row, max_row + 1)]
+            rng = self._ranges[key] = Range(rows)
+        return rng
+
+
+    def _evaluate(self, node, ws):
+        kind = node[0]
+        if kind == "value":
+            return node[1]
+
+        if kind == "ref":
+            target = ws if node[1] is None else self.index._sheet(node[1])
+            if target is None:
+                return REF
+            min_col, min_row, max_col, max_row = node[2:]
+            if min_col is not None and min_row is not None and (min_col, min_row) == (max_col, max_row):
+                return self._cell_value(target, min_row, min_col)
+            return self._range(target, min_col or 1, min_row or 1,
+                               max_col or MAX_COLUMN, max_row or MAX_ROW)
+
+        if kind == "func":
+            return self._call(node[1], node[2], ws)
+
+        if kind == "infix":
+            op = node[1]
+            if op == ":":
+                return VALUE
+            left = self._evaluate(node[2], ws)
+            right = self._evaluate(node[3], ws)
+            if left.__class__ is Range or right.__class__ is Range:
+                return _broadcast(op, left, right)
+            return _operate(op, left, right)
+
+        if kind in ("prefix", "postfix"):
+            value = self._evaluate(node[2], ws)
+            if value.__class__ is Range and node[1] != "+":
+                return _broadcast("*", value, -1 if node[1] == "-" else 0.01)
+            return _unary(node[1], value)
+
+        if kind == "name":
+            definition = self.index._definition(ws, node[1], node[2])
+            if definition is None:
+                return NAME
+            return self._evaluate(definition, ws)
+
+        if kind == "error":
+            return Error(node[1])
+
+        if kind == "array":
+            return Range([[Error(v[1]) if v[0] == "error" else v[1] for v in row]
+                          for row in node[1]])
+
+        return # missing argument
+
+
+    def _call(self, name, args, ws):
+        func = FUNCTIONS.get(name)
+        if func is None:
+            return NAME
+        values = [self._evaluate(arg, ws) for arg in args]
+        if name not in ERROR_FUNCTIONS:
+            for value in values:
+                if value.__class__ is Error:
+                    return value
+        try:
+            return func(*values)
+        except (FormulaError, ArithmeticError, ValueError, TypeError, IndexError) as e:
+            return _error(e)
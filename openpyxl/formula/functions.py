@@ -0,0 +1,1037 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Values and functions for evaluating formulae.
+
+Functions are called with their evaluated arguments: numbers, strings,
+booleans, None for empty cells or missing arguments, :class:`Error` values
+and :class:`Range` objects for references to several cells. They return a
+single value or a Range. Calculations over ranges use NumPy if it is
+installed.
+"""
+
+from bisect import bisect_right
+import math
+import re
+
+from openpyxl.compat.numbers import NUMPY
+
+if NUMPY:
+    import numpy
+else:
+    numpy = None
+
+
+class Error(str):
+    """
+    An error value such as #DIV/0!
+    """
+
+    __slots__ = ()
+
+
+NULL = Error("#NULL!")
+DIV0 = Error("#DIV/0!")
+VALUE = Error("#VALUE!")
+REF = Error("#REF!")
+NAME = Error("#NAME?")
+NUM = Error("#NUM!")
+NA = Error("#N/A")
+
+
+class FormulaError(Exception):
+    """
+    Raised by functions which result in an error value
+    """
+
+    def __init__(self, error):
+        super().__init__(error)
+        self.error = error
+
+
+class Range:
+
+    """
+    The values of a rectangular range of cells, row by row.
+
+    Converted and indexed forms of the values are cached as the values of a
+    range do not change once it has been created.
+    """
+
+    __slots__ = ("_rows", "_array", "_cache")
+
+    def __init__(self, rows=None, array=None):
+        self._rows = rows
+        self._array = array
+        self._cache = {}
+
+
+    @property
+    def rows(self):
+        if self._rows is None:
+            self._rows = self._array.tolist()
+        return self._rows
+
+
+    @property
+    def shape(self):
+        if self._rows is None:
+            return self._array.shape
+        return len(self._rows), len(self._rows[0]) if self._rows else 0
+
+
+    def values(self):
+        for row in self.rows:
+            yield from row
+
+
+    def column(self, idx):
+        return [row[idx] for row in self.rows]
+
+
+    def error(self):
+        """
+        The first error in the range or None
+        """
+        if "error" not in self._cache:
+            error = None
+            if self._rows is not None:
+                for value in self.values():
+                    if value.__class__ is Error:
+                        error = value
+                        break
+            self._cache["error"] = error
+        return self._cache["error"]
+
+
+    def numbers(self):
+        """
+        NumPy array of the numbers in the range with NaN for everything else
+        """
+        array = self._cache.get("numbers")
+        if array is None:
+            if self._array is not None:
+                array = self._array
+            else:
+                array = numpy.array(
+                    [[_nan_unless_number(v) for v in row] for row in self.rows],
+                    dtype=float).reshape(self.shape)
+            self._cache["numbers"] = array
+        return array
+
+
+    def operands(self):
+        """
+        NumPy array of the values converted to numbers for arithmetic, empty
+        cells being 0, or None if any of them are not numbers
+        """
+        if "operands" not in self._cache:
+            array = None
+            if self._array is not None:
+                array = self._array
+            elif all(v is None or v.__class__ in (int, float, bool)
+                     for v in self.values()):
+                array = numpy.array(
+                    [[v or 0 for v in row] for row in self.rows],
+                    dtype=float).reshape(self.shape)
+            self._cache["operands"] = array
+        return self._cache["operands"]
+
+
+    def text(self):
+        """
+        NumPy array of codes for the text in the range, ignoring case, and a
+        dictionary of the code for each text. Other values are -1.
+        """
+        codes = self._cache.get("text")
+        if codes is None:
+            lookup = {}
+            array = numpy.array(
+                [[lookup.setdefault(v.lower(), len(lookup)) if v.__class__ is str else -1
+                  for v in row] for row in self.rows],
+                dtype=numpy.int64).reshape(self.shape)
+            codes = self._cache["text"] = array, lookup
+        return codes
+
+
+    def index(self, values):
+        """
+        Dictionary of the position where each value first appears in a row
+        or column of the range
+        """
+        key = ("index", id(values))
+        index = self._cache.get(key)
+        if index is None:
+            index = {}
+            for idx, value in enumerate(values):
+                index.setdefault(_key(value), idx)
+            self._cache[key] = index
+        return index
+
+
+def _nan_unless_number(value):
+    if value.__class__ in (int, float):
+        return value
+    return math.nan
+
+
+def _key(value):
+    """
+    Normalise values for comparisons: text is compared case-insensitively
+    and numbers regardless of type
+    """
+    if value.__class__ is str:
+        return value.lower()
+    if value.__class__ is int:
+        return float(value)
+    return value
+
+
+def scalar(value):
+    """
+    Single value of a range: the only cell or the first one
+    """
+    if value.__class__ is Range:
+        rows = value.rows
+        if not rows or not rows[0]:
+            raise FormulaError(VALUE)
+        return rows[0][0]
+    return value
+
+
+def to_number(value):
+    value = scalar(value)
+    cls = value.__class__
+    if cls is int or cls is float:
+        return value
+    if value is None:
+        return 0
+    if cls is bool:
+        return int(value)
+    if cls is Error:
+        raise FormulaError(value)
+    if isinstance(value, str):
+        try:
+            return _number(value.strip())
+        except ValueError:
+            raise FormulaError(VALUE)
+    if isinstance(value, (int, float)):
+        return value
+    raise FormulaError(VALUE)
+
+
+NUMBER_RE = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+
+
+def _number(text):
+    if NUMBER_RE.match(text) is None:
+        raise ValueError(f"Not a number: {text!r}")
+    number = float(text)
+    if number.is_integer() and abs(number) < 2**53:
+        return int(number)
+    return number
+
+
+def to_text(value):
+    value = scalar(value)
+    if value is None:
+        return ""
+    cls = value.__class__
+    if cls is Error:
+        raise FormulaError(value)
+    if cls is bool:
+        return "TRUE" if value else "FALSE"
+    if cls is float:
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+        return "%.15g" % value
+    return str(value)
+
+
+def to_bool(value):
+    value = scalar(value)
+    cls = value.__class__
+    if value is None:
+        return False
+    if cls is Error:
+        raise FormulaError(value)
+    if cls is str:
+        upper = value.upper()
+        if upper in ("TRUE", "FALSE"):
+            return upper == "TRUE"
+        raise FormulaError(VALUE)
+    return bool(value)
+
+
+def _order(value):
+    """
+    Excel sorts numbers before text before booleans, errors are not sorted
+    """
+    if value is None:
+        return 0, 0
+    cls = value.__class__
+    if cls is bool:
+        return 2, value
+    if cls is Error:
+        return 3, value
+    if cls is str:
+        return 1, value.lower()
+    return 0, value
+
+
+def compare(op, left, right):
+    if left is None:
+        left = "" if isinstance(right, str) else 0
+    if right is None:
+        right = "" if isinstance(left, str) else 0
+    left, right = _order(left), _order(right)
+    if op == "=":
+        return left == right
+    if op == "<>":
+        return left != right
+    if op == "<":
+        return left < right
+    if op == ">":
+        return left > right
+    if op == "<=":
+        return left <= right
+    return left >= right
+
+
+# Aggregates
+
+def _arguments(args):
+    """
+    Numbers in the arguments of functions such as SUM. Values in ranges are
+    only counted if they are numbers, other values are converted.
+    """
+    numbers = []
+    arrays = []
+    for arg in args:
+        if arg.__class__ is Range:
+            error = arg.error()
+            if error is not None:
+                raise FormulaError(error)
+            if numpy is not None:
+                arrays.append(arg.numbers())
+            else:
+                numbers.extend(v for v in arg.values()
+                               if v.__class__ in (int, float))
+        elif arg is not None:
+            numbers.append(to_number(arg))
+    return numbers, arrays
+
+
+def SUM(*args):
+    numbers, arrays = _arguments(args)
+    total = sum(numbers)
+    for array in arrays:
+        total += float(numpy.nansum(array))
+    return total
+
+
+def _count(numbers, arrays):
+    return len(numbers) + sum(int(numpy.count_nonzero(~numpy.isnan(a))) for a in arrays)
+
+
+def COUNT(*args):
+    count = 0
+    for arg in args:
+        if arg.__class__ is Range:
+            if numpy is not None:
+                count += int(numpy.count_nonzero(~numpy.isnan(arg.numbers())))
+            else:
+                count += sum(1 for v in arg.values() if v.__class__ in (int, float))
+        else:
+            try:
+                to_number(arg)
+            except FormulaError:
+                continue
+            if arg is not None:
+                count += 1
+    return count
+
+
+def COUNTA(*args):
+    count = 0
+    for arg in args:
+        if arg.__class__ is Range:
+            count += sum(1 for v in arg.values() if v is not None)
+        elif arg is not None:
+            count += 1
+    return count
+
+
+def COUNTBLANK(rng):
+    return sum(1 for v in _range(rng).values() if v is None or v == "")
+
+
+def AVERAGE(*args):
+    numbers, arrays = _arguments(args)
+    count = _count(numbers, arrays)
+    if not count:
+        raise FormulaError(DIV0)
+    return SUM(*args) / count
+
+
+def _extreme(args, func, array_func):
+    numbers, arrays = _arguments(args)
+    for array in arrays:
+        if array.size and not numpy.isnan(array).all():
+            numbers.append(float(array_func(array)))
+    if not numbers:
+        return 0
+    return func(numbers)
+
+
+def MIN(*args):
+    return _extreme(args, min, lambda a: numpy.nanmin(a))
+
+
+def MAX(*args):
+    return _extreme(args, max, lambda a: numpy.nanmax(a))
+
+
+def PRODUCT(*args):
+    numbers, arrays = _arguments(args)
+    product = math.prod(numbers) if numbers else 1
+    for array in arrays:
+        product *= float(numpy.nanprod(array))
+    if not numbers and not any(a.size for a in arrays):
+        return 0
+    return product
+
+
+def SUMPRODUCT(*args):
+    ranges = [_range(arg) for arg in args]
+    shape = ranges[0].shape
+    if any(r.shape != shape for r in ranges):
+        raise FormulaError(VALUE)
+    for r in ranges:
+        error = r.error()
+        if error is not None:
+            raise FormulaError(error)
+    if numpy is not None:
+        product = numpy.ones(shape)
+        for r in ranges:
+            product *= numpy.nan_to_num(r.numbers(), nan=0.0)
+        return float(product.sum())
+    total = 0
+    for values in zip(*(r.values() for r in ranges)):
+        term = 1
+        for v in values:
+            term *= v if v.__class__ in (int, float) else 0
+        total += term
+    return total
+
+
+# Criteria for SUMIF, COUNTIF and the like
+
+CRITERION_RE = re.compile(r"(<=|>=|<>|<|>|=)?(.*)$", re.DOTALL)
+
+
+def _wildcard(pattern):
+    """
+    Regular expression for a pattern with Excel wildcards, or None
+    """
+    if not re.search(r"[*?]", pattern):
+        return
+    out = []
+    chars = iter(pattern)
+    for c in chars:
+        if c == "~":
+            out.append(re.escape(next(chars, "~")))
+        elif c == "*":
+            out.append(".*")
+        elif c == "?":
+            out.append(".")
+        else:
+            out.append(re.escape(c))
+    return re.compile("".join(out) + r"\Z", re.IGNORECASE | re.DOTALL)
+
+
+class Criterion:
+
+    """
+    A condition such as ">5", "apple" or "a*" which values are tested against
+    """
+
+    def __init__(self, criterion):
+        criterion = scalar(criterion)
+        if criterion.__class__ is Error:
+            raise FormulaError(criterion)
+        op = "="
+        operand = criterion
+        self.pattern = None
+        if criterion is None:
+            operand = 0
+        elif isinstance(criterion, str):
+            op, operand = CRITERION_RE.match(criterion).groups()
+            op = op or "="
+            try:
+                operand = _number(operand.strip())
+            except ValueError:
+                if operand.upper() in ("TRUE", "FALSE"):
+                    operand = operand.upper() == "TRUE"
+                elif op in ("=", "<>"):
+                    self.pattern = _wildcard(operand)
+        self.op = op
+        self.operand = operand
+        self.key = _key(operand)
+
+
+    def _match(self, value):
+        op = self.op
+        operand = self.operand
+        if operand == "" and self.pattern is None and op in ("=", "<>"):
+            blank = value is None or value == ""
+            return blank if op == "=" else not blank
+        if self.pattern is not None:
+            found = isinstance(value, str) and self.pattern.match(value) is not None
+            return found if op == "=" else not found
+        if value is None:
+            return op == "<>"
+        if _order(value)[0] != _order(operand)[0]:
+            return op == "<>"
+        return compare(op, value, operand)
+
+
+    def mask(self, rng):
+        """
+        Boolean array, or list, of the values in a range which match
+        """
+        if numpy is None:
+            return [self._match(v) for v in rng.values()]
+
+        op = self.op
+        operand = self.operand
+        cls = operand.__class__
+        if self.pattern is None and cls in (int, float) and op != "<>":
+            numbers = rng.numbers()
+            with numpy.errstate(invalid="ignore"):
+                if op == "=":
+                    return numbers == operand
+                if op == "<":
+                    return numbers < operand
+                if op == ">":
+                    return numbers > operand
+                if op == "<=":
+                    return numbers <= operand
+                return numbers >= operand
+        if self.pattern is None and cls is str and operand and op in ("=", "<>"):
+            array, lookup = rng.text()
+            found = array == lookup.get(self.key, -2)
+            return found if op == "=" else ~found
+        match = self._match
+        return numpy.array([match(v) for v in rng.values()],
+                           dtype=bool).reshape(rng.shape)
+
+
+def _range(value):
+    if value.__class__ is Range:
+        return value
+    return Range([[value]])
+
+
+def _conditions(args):
+    """
+    Combined mask of (range, criterion) pairs of arguments
+    """
+    if len(args) % 2:
+        raise FormulaError(VALUE)
+    mask = None
+    shape = None
+    for rng, criterion in zip(args[::2], args[1::2]):
+        rng = _range(rng)
+        if shape is None:
+            shape = rng.shape
+        elif rng.shape != shape:
+            raise FormulaError(VALUE)
+        found = Criterion(criterion).mask(rng)
+        if mask is None:
+            mask = found
+        elif numpy is not None:
+            mask = mask & found
+        else:
+            mask = [a and b for a, b in zip(mask, found)]
+    return mask, shape
+
+
+def _masked(rng, mask):
+    """
+    Numbers in a range where the mask is true
+    """
+    error = rng.error()
+    if error is not None:
+        raise FormulaError(error)
+    if numpy is not None:
+        numbers = rng.numbers()[mask]
+        return numbers[~numpy.isnan(numbers)]
+    return [v for v, m in zip(rng.values(), mask)
+            if m and v.__class__ in (int, float)]
+
+
+def _total(numbers):
+    if numpy is not None:
+        return float(numbers.sum())
+    return sum(numbers)
+
+
+def SUMIFS(sum_range, *args):
+    sum_range = _range(sum_range)
+    mask, shape = _conditions(args)
+    if sum_range.shape != shape:
+        raise FormulaError(VALUE)
+    return _total(_masked(sum_range, mask))
+
+
+def SUMIF(rng, criterion, sum_range=None):
+    if sum_range is None:
+        sum_range = rng
+    sum_range = _range(sum_range)
+    rng = _range(rng)
+    if sum_range.shape != rng.shape:
+        # Excel uses a range of the same size from the top left cell
+        raise FormulaError(VALUE)
+    return SUMIFS(sum_range, rng, criterion)
+
+
+def COUNTIFS(*args):
+    mask, shape = _conditions(args)
+    if numpy is not None:
+        return int(numpy.count_nonzero(mask))
+    return sum(mask)
+
+
+def COUNTIF(rng, criterion):
+    return COUNTIFS(rng, criterion)
+
+
+def AVERAGEIFS(average_range, *args):
+    average_range = _range(average_range)
+    mask, shape = _conditions(args)
+    if average_range.shape != shape:
+        raise FormulaError(VALUE)
+    numbers = _masked(average_range, mask)
+    if not len(numbers):
+        raise FormulaError(DIV0)
+    return _total(numbers) / len(numbers)
+
+
+def AVERAGEIF(rng, criterion, average_range=None):
+    if average_range is None:
+        average_range = rng
+    return AVERAGEIFS(average_range, rng, criterion)
+
+
+# Lookups
+
+def _position(value, values, rng, match_type):
+    """
+    0-based position of a value in a row or column of a range
+    """
+    value = scalar(value)
+    if value.__class__ is Error:
+        raise FormulaError(value)
+    if match_type == 0:
+        if isinstance(value, str):
+            pattern = _wildcard(value)
+            if pattern is not None:
+                for idx, v in enumerate(values):
+                    if isinstance(v, str) and pattern.match(v):
+                        return idx
+                raise FormulaError(NA)
+        idx = rng.index(values).get(_key(value))
+        if idx is None:
+            raise FormulaError(NA)
+        return idx
+
+    kind, key = _order(value)
+    if match_type > 0:
+        # values are sorted in ascending order: the last one not greater
+        cache = rng._cache
+        sorted_key = ("sorted", id(values), kind)
+        positions = cache.get(sorted_key)
+        if positions is None:
+            positions = [(k, idx) for idx, (c, k) in
+                         enumerate(_order(v) for v in values)
+                         if c == kind and values[idx] is not None]
+            cache[sorted_key] = positions
+        idx = bisect_right(positions, (key, math.inf)) - 1
+        if idx < 0:
+            raise FormulaError(NA)
+        return positions[idx][1]
+
+    found = None
+    for idx, v in enumerate(values):
+        c, k = _order(v)
+        if v is None or c != kind:
+            continue
+        if k < key:
+            break
+        found = idx
+    if found is None:
+        raise FormulaError(NA)
+    return found
+
+
+def _lookup_vector(rng, by_column, idx):
+    cache = rng._cache
+    key = ("vector", by_column, idx)
+    values = cache.get(key)
+    if values is None:
+        if by_column:
+            values = rng.column(idx)
+        else:
+            values = rng.rows[idx]
+        cache[key] = values
+    return values
+
+
+def VLOOKUP(value, table, col_index, range_lookup=True):
+    table = _range(table)
+    col_index = int(to_number(col_index))
+    rows, cols = table.shape
+    if col_index < 1:
+        raise FormulaError(VALUE)
+    if col_index > cols:
+        raise FormulaError(REF)
+    exact = range_lookup is not None and not to_bool(range_lookup)
+    keys = _lookup_vector(table, True, 0)
+    row = _position(value, keys, table, 0 if exact else 1)
+    return table.rows[row][col_index - 1]
+
+
+def HLOOKUP(value, table, row_index, range_lookup=True):
+    table = _range(table)
+    row_index = int(to_number(row_index))
+    rows, cols = table.shape
+    if row_index < 1:
+        raise FormulaError(VALUE)
+    if row_index > rows:
+        raise FormulaError(REF)
+    exact = range_lookup is not None and not to_bool(range_lookup)
+    keys = _lookup_vector(table, False, 0)
+    col = _position(value, keys, table, 0 if exact else 1)
+    return table.rows[row_index - 1][col]
+
+
+def MATCH(value, rng, match_type=1):
+    rng = _range(rng)
+    rows, cols = rng.shape
+    if rows != 1 and cols != 1:
+        raise FormulaError(NA)
+    if match_type is None:
+        match_type = 1
+    match_type = to_number(match_type)
+    values = _lookup_vector(rng, cols == 1, 0)
+    return _position(value, values, rng, match_type) + 1
+
+
+def INDEX(rng, row=None, column=None):
+    rng = _range(rng)
+    rows, cols = rng.shape
+    row = int(to_number(row)) if row is not None else 0
+    column = int(to_number(column)) if column is not None else 0
+    # a single row or column can be indexed by one number
+    if rows == 1 and column == 0 and row > 1:
+        row, column = 1, row
+    elif cols == 1 and column == 0:
+        column = 1
+    if row < 0 or column < 0 or row > rows or column > cols:
+        raise FormulaError(REF)
+    if row and column:
+        return rng.rows[row - 1][column - 1]
+    if row:
+        return Range([rng.rows[row - 1]])
+    if column:
+        return Range([[r[column - 1]] for r in rng.rows])
+    return rng
+
+
+# Logical and information
+
+def IF(condition, value_if_true=True, value_if_false=False):
+    if to_bool(condition):
+        return 0 if value_if_true is None else value_if_true
+    return 0 if value_if_false is None else value_if_false
+
+
+def IFERROR(value, value_if_error):
+    if scalar(value).__class__ is Error:
+        return value_if_error
+    return value
+
+
+def IFNA(value, value_if_na):
+    if ISNA(value):
+        return value_if_na
+    return value
+
+
+def _booleans(args):
+    for arg in args:
+        if arg.__class__ is Range:
+            error = arg.error()
+            if error is not None:
+                raise FormulaError(error)
+            for v in arg.values():
+                if v.__class__ in (bool, int, float):
+                    yield bool(v)
+        elif arg is not None:
+            yield to_bool(arg)
+
+
+def AND(*args):
+    values = list(_booleans(args))
+    if not values:
+        raise FormulaError(VALUE)
+    return all(values)
+
+
+def OR(*args):
+    values = list(_booleans(args))
+    if not values:
+        raise FormulaError(VALUE)
+    return any(values)
+
+
+def NOT(value):
+    return not to_bool(value)
+
+
+def TRUE():
+    return True
+
+
+def FALSE():
+    return False
+
+
+def ISERROR(value):
+    return scalar(value).__class__ is Error
+
+
+def ISNA(value):
+    value = scalar(value)
+    return value.__class__ is Error and value == NA
+
+
+def ISBLANK(value):
+    return scalar(value) is None
+
+
+def ISNUMBER(value):
+    return scalar(value).__class__ in (int, float)
+
+
+def ISTEXT(value):
+    value = scalar(value)
+    return isinstance(value, str) and value.__class__ is not Error
+
+
+def NA_():
+    raise FormulaError(NA)
+
+
+# Maths
+
+def ABS(number):
+    return abs(to_number(number))
+
+
+def _digits(digits):
+    return int(to_number(digits)) if digits is not None else 0
+
+
+def ROUND(number, digits=0):
+    number = to_number(number)
+    digits = _digits(digits)
+    factor = 10 ** digits
+    # Excel rounds halves away from zero
+    result = math.floor(abs(number) * factor + 0.5 + 1e-9) / factor
+    return math.copysign(result, number) if result else 0
+
+
+def ROUNDUP(number, digits=0):
+    number = to_number(number)
+    factor = 10 ** _digits(digits)
+    result = math.ceil(abs(number) * factor - 1e-9) / factor
+    return math.copysign(result, number) if result else 0
+
+
+def ROUNDDOWN(number, digits=0):
+    number = to_number(number)
+    factor = 10 ** _digits(digits)
+    result = math.floor(abs(number) * factor + 1e-9) / factor
+    return math.copysign(result, number) if result else 0
+
+
+def INT(number):
+    return math.floor(to_number(number))
+
+
+def MOD(number, divisor):
+    number = to_number(number)
+    divisor = to_number(divisor)
+    if not divisor:
+        raise FormulaError(DIV0)
+    return number - divisor * math.floor(number / divisor)
+
+
+def SQRT(number):
+    number = to_number(number)
+    if number < 0:
+        raise FormulaError(NUM)
+    return math.sqrt(number)
+
+
+def POWER(number, power):
+    return power_(to_number(number), to_number(power))
+
+
+def power_(number, power):
+    if number == 0 and power < 0:
+        raise FormulaError(DIV0)
+    try:
+        result = number ** power
+    except OverflowError:
+        raise FormulaError(NUM)
+    if isinstance(result, complex):
+        raise FormulaError(NUM)
+    return result
+
+
+def EXP(number):
+    return math.exp(to_number(number))
+
+
+def LN(number):
+    number = to_number(number)
+    if number <= 0:
+        raise FormulaError(NUM)
+    return math.log(number)
+
+
+def LOG10(number):
+    number = to_number(number)
+    if number <= 0:
+        raise FormulaError(NUM)
+    return math.log10(number)
+
+
+def SIGN(number):
+    number = to_number(number)
+    return (number > 0) - (number < 0)
+
+
+def PI():
+    return math.pi
+
+
+def SIN(number):
+    return math.sin(to_number(number))
+
+
+def COS(number):
+    return math.cos(to_number(number))
+
+
+def TAN(number):
+    return math.tan(to_number(number))
+
+
+# Text
+
+def LEN(text):
+    return len(to_text(text))
+
+
+def LEFT(text, count=1):
+    count = int(to_number(count)) if count is not None else 1
+    if count < 0:
+        raise FormulaError(VALUE)
+    return to_text(text)[:count]
+
+
+def RIGHT(text, count=1):
+    count = int(to_number(count)) if count is not None else 1
+    if count < 0:
+        raise FormulaError(VALUE)
+    text = to_text(text)
+    return text[len(text) - count:] if count else ""
+
+
+def MID(text, start, count):
+    start = int(to_number(start))
+    count = int(to_number(count))
+    if start < 1 or count < 0:
+        raise FormulaError(VALUE)
+    return to_text(text)[start - 1:start - 1 + count]
+
+
+def UPPER(text):
+    return to_text(text).upper()
+
+
+def LOWER(text):
+    return to_text(text).lower()
+
+
+def TRIM(text):
+    return " ".join(part for part in to_text(text).split(" ") if part)
+
+
+def CONCATENATE(*args):
+    return "".join(to_text(arg) for arg in args)
+
+
+def CONCAT(*args):
+    parts = []
+    for arg in args:
+        if arg.__class__ is Range:
+            parts.extend(to_text(v) for v in arg.values())
+        else:
+            parts.append(to_text(arg))
+    return "".join(parts)
+
+
+def SUBSTITUTE(text, old, new, instance=None):
+    text, old, new = to_text(text), to_text(old), to_text(new)
+    if not old:
+        return text
+    if instance is None:
+        return text.replace(old, new)
+    instance = int(to_number(instance))
+    if instance < 1:
+        raise FormulaError(VALUE)
+    start = -1
+    for _ in range(instance):
+        start = text.find(old, start + 1)
+        if start < 0:
+            return text
+    return text[:start] + new + text[start + len(old):]
+
+
+def VALUE_(text):
+    value = scalar(text)
+    if value.__class__ is bool:
+        raise FormulaError(VALUE)
+    return to_number(value)
+
+
+def EXACT(text1, text2):
+    return to_text(text1) == to_text(text2)
+
+
+# Functions whose names clash with error values have a trailing underscore
+FUNCTIONS = {
+    name.rstrip("_"): func for name, func in globals().items()
+    if name.isupper() and callable(func) and not isinstance(func, type)
+}
+
+
+# Functions which handle error values in their arguments themselves
+ERROR_FUNCTIONS = {"IF", "IFERROR", "IFNA", "ISERROR", "ISNA", "ISBLANK",
+                   "ISNUMBER", "ISTEXT", "COUNT", "COUNTA", "COUNTBLANK",
+                   "COUNTIF", "COUNTIFS"}
@@ -0,0 +1,246 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Parse formulae into expression trees which can be evaluated.
+
+Trees are made of tuples whose first item is the kind of node:
+
+    ("value", value)                   number, string or boolean
+    ("error", "#N/A")                  error constant
+    ("array", rows)                    array constant, rows of values
+    ("ref", sheet, min_col, min_row, max_col, max_row)
+                                       reference to a cell, range, rows or
+                                       columns with None for a missing axis;
+                                       sheet is None for the formula's own
+    ("name", sheet, name)              defined name
+    ("prefix", op, operand)            unary + or -
+    ("postfix", "%", operand)          percentage
+    ("infix", op, left, right)         binary operator
+    ("func", NAME, args)               function call, missing arguments
+                                       are ("missing",)
+"""
+
+from .tokenizer import Tokenizer, Token, TokenizerError
+from .references import _parse_range, _sheet_name
+from .translate import Translator
+
+
+class ParseError(Exception):
+    """
+    Raised when a formula cannot be parsed into an expression
+    """
+
+
+# Higher binds more tightly. Negation and percentages bind more tightly
+# than any of these.
+PRECEDENCE = {
+    ":": 6,
+    "^": 5,
+    "*": 4,
+    "/": 4,
+    "+": 3,
+    "-": 3,
+    "&": 2,
+    "=": 1,
+    "<>": 1,
+    "<": 1,
+    ">": 1,
+    "<=": 1,
+    ">=": 1,
+}
+
+# Prefixes of functions introduced in newer versions of Excel
+FUNCTION_PREFIXES = ("_xlfn._xlws.", "_xlfn.", "_xlws.")
+
+
+def _number(value):
+    number = float(value)
+    if number.is_integer() and "." not in value and "e" not in value.lower():
+        return int(value)
+    return number
+
+
+def _operand(token):
+    value = token.value
+    subtype = token.subtype
+    if subtype == Token.NUMBER:
+        return ("value", _number(value))
+    if subtype == Token.TEXT:
+        return ("value", value[1:-1].replace('""', '"'))
+    if subtype == Token.LOGICAL:
+        return ("value", value.upper() == "TRUE")
+    if subtype == Token.ERROR:
+        return ("error", value)
+
+    if value.upper().endswith("#REF!"):
+        return ("error", "#REF!")
+    ws_part, ref = Translator.strip_ws_name(value)
+    sheet = None
+    if ws_part:
+        sheet = _sheet_name(ws_part)
+        if sheet is None:
+            raise ParseError(f"References to other workbooks are not supported: {value}")
+    bounds = _parse_range(ref)
+    if bounds is None:
+        return ("name", sheet, ref)
+    return ("ref", sheet) + bounds
+
+
+class Parser:
+
+    """
+    Recursive descent parser for the tokens of a formula
+    """
+
+    def __init__(self, tokens):
+        self.tokens = [t for t in tokens if t.type != Token.WSPACE]
+        self.pos = 0
+
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+
+
+    def next(self):
+        token = self.peek()
+        if token is None:
+            raise ParseError("Unexpected end of formula")
+        self.pos += 1
+        return token
+
+
+    def parse(self):
+        node = self.expression(0)
+        if self.peek() is not None:
+            raise ParseError(f"Unexpected {self.peek().value!r}")
+        return node
+
+
+    def expression(self, min_precedence):
+        left = self.unary()
+        while True:
+            token = self.peek()
+            if token is None or token.type != Token.OP_IN:
+                return left
+            precedence = PRECEDENCE.get(token.value)
+            if precedence is None:
+                raise ParseError(f"Unsupported operator {token.value!r}")
+            if precedence < min_precedence:
+                return left
+            self.pos += 1
+            right = self.expression(precedence + 1)
+            left = ("infix", token.value, left, right)
+
+
+    def unary(self):
+        token = self.peek()
+        if token is not None and token.type == Token.OP_PRE:
+            self.pos += 1
+            return ("prefix", token.value, self.unary())
+        node = self.primary()
+        while True:
+            token = self.peek()
+            if token is None or token.type != Token.OP_POST:
+                return node
+            self.pos += 1
+            node = ("postfix", token.value, node)
+
+
+    def primary(self):
+        token = self.next()
+        if token.type == Token.OPERAND:
+            return _operand(token)
+
+        if token.type == Token.FUNC and token.subtype == Token.OPEN:
+            name = token.value[:-1].upper()
+            for prefix in FUNCTION_PREFIXES:
+                if name.startswith(prefix.upper()):
+                    name = name[len(prefix):]
+                    break
+            return ("func", name, self.arguments())
+
+        if token.type == Token.PAREN and token.subtype == Token.OPEN:
+            node = self.expression(0)
+            token = self.next()
+            if token.type != Token.PAREN or token.subtype != Token.CLOSE:
+                raise ParseError(f"Unexpected {token.value!r}")
+            return node
+
+        if token.type == Token.ARRAY and token.subtype == Token.OPEN:
+            return self.array()
+
+        raise ParseError(f"Unexpected {token.value!r}")
+
+
+    def arguments(self):
+        args = []
+        token = self.peek()
+        if token is not None and token.type == Token.FUNC and token.subtype == Token.CLOSE:
+            self.pos += 1
+            return args
+        while True:
+            token = self.peek()
+            if token is not None and (token.type == Token.SEP
+                                      or token.type == Token.FUNC
+                                      and token.subtype == Token.CLOSE):
+                args.append(("missing",))
+            else:
+                args.append(self.expression(0))
+            token = self.next()
+            if token.type == Token.FUNC and token.subtype == Token.CLOSE:
+                return args
+            if token.type != Token.SEP or token.subtype != Token.ARG:
+                raise ParseError(f"Unexpected {token.value!r}")
+
+
+    def array(self):
+        rows = [[]]
+        while True:
+            node = self.unary()
+            if node[0] == "prefix" and node[2][0] == "value":
+                value = node[2][1]
+                node = ("value", -value if node[1] == "-" else value)
+            if node[0] not in ("value", "error"):
+                raise ParseError("Arrays can only contain constants")
+            rows[-1].append(node)
+            token = self.next()
+            if token.type == Token.ARRAY and token.subtype == Token.CLOSE:
+                return ("array", rows)
+            if token.type != Token.SEP:
+                raise ParseError(f"Unexpected {token.value!r}")
+            if token.subtype == Token.ROW:
+                rows.append([])
+
+
+def parse(formula):
+    """
+    Parse a formula, including the leading "=", into an expression tree
+    """
+    try:
+        tokens = Tokenizer(formula).items
+    except TokenizerError as e:
+        raise ParseError(str(e))
+    if not tokens or tokens[0].type == Token.LITERAL:
+        raise ParseError(f"Not a formula: {formula!r}")
+    return Parser(tokens).parse()
+
+
+def references(node):
+    """
+    Yield all the "ref" and "name" nodes of an expression tree in the order
+    they appear in the formula
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        kind = node[0]
+        if kind in ("ref", "name"):
+            yield node
+        elif kind == "func":
+            stack.extend(reversed(node[2]))
+        elif kind == "infix":
+            stack.append(node[3])
+            stack.append(node[2])
+        elif kind in ("prefix", "postfix"):
+            stack.append(node[2])
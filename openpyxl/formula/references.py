@@ -0,0 +1,384 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Rewrite references in formulae when rows or columns are inserted or deleted.
+
+References follow the cells they refer to: inserting two rows above row 5
+turns "=A5" into "=A7", deleting row 5 turns it into "=#REF!" and ranges
+grow or shrink accordingly. Unlike translation, absolute references change
+in the same way as relative ones.
+"""
+
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.worksheet.formula import ArrayFormula, SharedFormula
+
+from .tokenizer import Tokenizer, Token
+from .translate import Translator
+
+
+ROW_RANGE_RE = Translator.ROW_RANGE_RE
+COL_RANGE_RE = Translator.COL_RANGE_RE
+CELL_REF_RE = Translator.CELL_REF_RE
+
+
+def _sheet_name(ws_part):
+    """
+    Name of the worksheet from the "Sheet!" part of a reference, or None for
+    references to other workbooks or to several worksheets
+    """
+    name = ws_part[:-1]
+    if name.startswith("'"):
+        name = name[1:-1].replace("''", "'")
+    if name.startswith("[") or ":" in name:
+        return
+    return name
+
+
+def _parse_range(ref):
+    """
+    Bounds (min_col, min_row, max_col, max_row) of a reference to cells,
+    rows or columns with None for a missing axis; None if it is a name
+    """
+    match = CELL_REF_RE.match(ref)
+    if match is not None:
+        col = column_index_from_string(match.group(1).lstrip("$"))
+        row = int(match.group(2).lstrip("$"))
+        return col, row, col, row
+    match = ROW_RANGE_RE.match(ref)
+    if match is not None:
+        lo, hi = (int(g.lstrip("$")) for g in match.groups())
+        return None, min(lo, hi), None, max(lo, hi)
+    match = COL_RANGE_RE.match(ref)
+    if match is not None:
+        lo, hi = (column_index_from_string(g.lstrip("$")) for g in match.groups())
+        return min(lo, hi), None, max(lo, hi), None
+    pieces = ref.split(":")
+    if len(pieces) != 2:
+        return
+    first, last = (CELL_REF_RE.match(piece) for piece in pieces)
+    if first is None or last is None:
+        return
+    cols = [column_index_from_string(m.group(1).lstrip("$")) for m in (first, last)]
+    rows = [int(m.group(2).lstrip("$")) for m in (first, last)]
+    return min(cols), min(rows), max(cols), max(rows)
+
+
+def references(formula):
+    """
+    Yield (sheet, min_col, min_row, max_col, max_row) for every reference to
+    cells, rows or columns in a formula. sheet is None for references to
+    the formula's own worksheet.
+    """
+    for token in Tokenizer(formula).items:
+        if token.type != Token.OPERAND or token.subtype != Token.RANGE:
+            continue
+        ws_part, ref = Translator.strip_ws_name(token.value)
+        sheet = None
+        if ws_part:
+            sheet = _sheet_name(ws_part)
+            if sheet is None:
+                continue
+        bounds = _parse_range(ref)
+        if bounds is not None:
+            yield (sheet,) + bounds
+
+
+def _dollar(value):
+    return "$" if value.startswith("$") else ""
+
+
+def _rewrite_range(ref, rows=None, cols=None):
+    """
+    Rewrite a reference without a worksheet. Return None if the cells it
+    refers to have been deleted.
+    """
+    match = ROW_RANGE_RE.match(ref)
+    if match is not None:
+        if not rows:
+            return ref
+        lo, hi = match.groups()
+        span = rows.span(int(lo.lstrip("$")), int(hi.lstrip("$")))
+        if span is not None:
+            return f"{_dollar(lo)}{span[0]}:{_dollar(hi)}{span[1]}"
+        return
+
+    match = COL_RANGE_RE.match(ref)
+    if match is not None:
+        if not cols:
+            return ref
+        lo, hi = match.groups()
+        span = cols.span(column_index_from_string(lo.lstrip("$")),
+                         column_index_from_string(hi.lstrip("$")))
+        if span is not None:
+            return (f"{_dollar(lo)}{get_column_letter(span[0])}:"
+                    f"{_dollar(hi)}{get_column_letter(span[1])}")
+        return
+
+    pieces = ref.split(":")
+    if len(pieces) > 2:
+        return ref
+    matches = [CELL_REF_RE.match(piece) for piece in pieces]
+    if None in matches:
+        return ref # names
+
+    col_span = sorted(column_index_from_string(m.group(1).lstrip("$")) for m in matches)
+    row_span = sorted(int(m.group(2).lstrip("$")) for m in matches)
+    if cols:
+        col_span = cols.span(col_span[0], col_span[-1])
+    if rows:
+        row_span = rows.span(row_span[0], row_span[-1])
+    if col_span is None or row_span is None:
+        return
+
+    cells = []
+    for m, col, row in zip(matches, col_span, row_span):
+        col_str, row_str = m.groups()
+        cells.append(f"{_dollar(col_str)}{get_column_letter(col)}{_dollar(row_str)}{row}")
+    return ":".join(cells)
+
+
+def rewrite_formula(formula, title, rows=None, cols=None, local=False):
+    """
+    Rewrite the references to the worksheet called `title` in a formula
+    after the edits described by `rows` and `cols`, which are
+    :class:`openpyxl.worksheet.remap.IndexMap` objects or None.
+    References without a worksheet are rewritten if `local` is True.
+
+    The original formula is returned if nothing changes.
+    """
+    tokens = Tokenizer(formula).items
+    if not tokens or tokens[0].type == Token.LITERAL:
+        return formula
+
+    title = title.lower()
+    changed = False
+    out = ["="]
+    for token in tokens:
+        value = token.value
+        if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+            ws_part, ref = Translator.strip_ws_name(value)
+            if ws_part:
+                name = _sheet_name(ws_part)
+                target = name is not None and name.lower() == title
+            else:
+                target = local
+            if target:
+                new = _rewrite_range(ref, rows, cols)
+                if new is None:
+                    new = "#REF!"
+                if new != ref:
+                    value = ws_part + new
+                    changed = True
+        out.append(value)
+
+    if changed:
+        return "".join(out)
+    return formula
+
+
+def _formula_text(cell):
+    value = cell._value
+    if isinstance(value, str):
+        return value
+    if isinstance(value, SharedFormula):
+        return cell.value
+    return getattr(value, "text", None) # array formulae
+
+
+class ReferenceIndex:
+    """
+    The formulae of a workbook by the worksheets they refer to.
+
+    For each formula the highest row and column it refers to on each
+    worksheet are kept so that when rows or columns are inserted or deleted
+    only the formulae which refer to cells at or after the edit are
+    rewritten. References to a formula's own worksheet are kept under the
+    worksheet itself; other references under the lowercase name of the
+    worksheet as it appears in the formula.
+
+    Cells register their formulae with the index when they are assigned.
+    Entries are checked when used so that it does not matter if a cell has
+    been deleted or overwritten since.
+    """
+
+    # whether the index has to be told about every change to a cell and
+    # rebuilt when cells are moved
+    tracks_cells = False
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self._names = {}
+        self.rebuild()
+
+
+    def rebuild(self):
+        """
+        Index all the formulae of the workbook again
+        """
+        self._entries = {}
+        self._extents = {}
+        for ws in self.workbook.worksheets:
+            for cell in getattr(ws, "_cells", {}).values():
+                if cell.data_type == "f":
+                    self._index_cell(cell)
+
+
+    def _index_cell(self, cell):
+        self.add(cell)
+
+
+    def changed(self, cell):
+        """
+        Update the index after the value of a cell has changed
+        """
+        if cell.data_type == "f":
+            self.add(cell)
+
+
+    def add(self, cell):
+        """
+        Index the formula of a cell replacing any previous entry
+        """
+        key = id(cell)
+        if key in self._entries:
+            self.discard(cell)
+        text = _formula_text(cell)
+        if text is None:
+            return
+
+        extents = {}
+        for sheet, min_col, min_row, max_col, max_row in self._refs(text):
+            target = cell.parent if sheet is None else sheet.lower()
+            old_row, old_col = extents.get(target, (0, 0))
+            extents[target] = max(old_row, max_row or 0), max(old_col, max_col or 0)
+        if not extents:
+            return
+
+        self._entries[key] = cell, text, extents
+        for target, extent in extents.items():
+            self._extents.setdefault(target, {})[key] = extent
+
+
+    def _refs(self, text):
+        """
+        References of a formula as (sheet, min_col, min_row, max_col, max_row)
+        """
+        return references(text)
+
+
+    def discard(self, cell):
+        """
+        Remove the formula of a cell from the index
+        """
+        entry = self._entries.pop(id(cell), None)
+        if entry is None:
+            return
+        key = id(cell)
+        for target in entry[2]:
+            formulae = self._extents[target]
+            del formulae[key]
+            if not formulae:
+                del self._extents[target]
+
+
+    def _is_current(self, cell, text, sheets):
+        ws = cell.parent
+        return (
+            ws in sheets
+            and ws._cells.get((cell.row, cell.column)) is cell
+            and cell.data_type == "f"
+            and _formula_text(cell) == text
+        )
+
+
+    def rewrite(self, ws, rows=None, cols=None):
+        """
+        Rewrite formulae and defined names which refer to a worksheet after
+        rows or columns have been inserted into or deleted from it.
+        """
+        first_row = rows.first if rows else None
+        first_col = cols.first if cols else None
+
+        affected = []
+        for target in (ws, ws.title.lower()):
+            for key, (max_row, max_col) in self._extents.get(target, {}).items():
+                if ((first_row is not None and max_row >= first_row)
+                    or (first_col is not None and max_col >= first_col)):
+                    affected.append(key)
+
+        sheets = set(self.workbook.worksheets)
+        for key in set(affected):
+            cell, text, _ = self._entries[key]
+            if not self._is_current(cell, text, sheets):
+                self.discard(cell)
+                continue
+            new = rewrite_formula(text, ws.title, rows, cols, local=cell.parent is ws)
+            if new != text:
+                if isinstance(cell._value, ArrayFormula):
+                    cell._value.text = new
+                else:
+                    cell._value = new
+                self.add(cell)
+
+        self._rewrite_names(self.workbook.defined_names, ws, rows, cols, local=False)
+        for sheet in sheets:
+            names = getattr(sheet, "defined_names", None)
+            if names:
+                self._rewrite_names(names, ws, rows, cols, local=sheet is ws)
+            self._rewrite_rules(sheet, ws, rows, cols)
+
+
+    def _rewrite_rules(self, sheet, ws, rows, cols):
+        """
+        Rewrite the formulae of the conditional formats and data validations
+        of a worksheet
+        """
+        local = sheet is ws
+
+        def rewrite(text):
+            if not text:
+                return text
+            formula = text if text.startswith("=") else "=" + text
+            new = rewrite_formula(formula, ws.title, rows, cols, local)
+            if new == formula:
+                return text
+            return new if text.startswith("=") else new[1:]
+
+        formatting = getattr(sheet, "conditional_formatting", None)
+        if formatting:
+            for rules in formatting._cf_rules.values():
+                for rule in rules:
+                    if rule.formula:
+                        rule.formula = [rewrite(text) for text in rule.formula]
+        validations = getattr(sheet, "data_validations", None)
+        if validations:
+            for dv in validations.dataValidation:
+                dv.formula1 = rewrite(dv.formula1)
+                dv.formula2 = rewrite(dv.formula2)
+
+
+    def _rewrite_names(self, names, ws, rows, cols, local):
+        title = ws.title.lower()
+        first_row = rows.first if rows else None
+        first_col = cols.first if cols else None
+        for defn in names.values():
+            text = defn.value
+            if not isinstance(text, str):
+                continue
+            formula = "=" + text
+            refs = self._names.get(formula)
+            if refs is None:
+                refs = self._names[formula] = list(references(formula))
+            for sheet, min_col, min_row, max_col, max_row in refs:
+                if sheet is None and not local:
+                    continue
+                if sheet is not None and sheet.lower() != title:
+                    continue
+                if ((first_row is not None and (max_row or 0) >= first_row)
+                    or (first_col is not None and (max_col or 0) >= first_col)):
+                    break
+            else:
+                continue
+            new = rewrite_formula(formula, ws.title, rows, cols, local)
+            if new != formula:
+                defn.value = new[1:]
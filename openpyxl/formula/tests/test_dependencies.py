@@ -0,0 +1,172 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+from openpyxl.workbook import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+
+
+@pytest.fixture
+def workbook():
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    for row in range(1, 6):
+        ws.cell(row, 1, row)
+        ws.cell(row, 2, f"=A{row}*2")
+    ws["D1"] = "=SUM(B1:B5)"
+    calc = wb.create_sheet("Calc")
+    calc["A1"] = "=Data!D1*rate"
+    calc["A2"] = "=SUM(Data!A:A)"
+    calc["B1"] = 0.5
+    wb.defined_names["rate"] = DefinedName("rate", attr_text="Calc!$B$1")
+    return wb
+
+
+def coords(cells):
+    return [f"{c.parent.title}!{c.coordinate}" for c in cells]
+
+
+def test_build(workbook):
+    from ..dependencies import DependencyIndex
+    index = workbook.build_reference_index()
+    assert isinstance(index, DependencyIndex)
+    assert workbook.build_reference_index() is index
+    assert workbook._references is index
+    ws = workbook.create_sheet()
+    ws["A1"] = "=Data!C9"
+    assert index.dependents(workbook["Data"]["C9"]) == [ws["A1"]]
+
+
+def test_shared_with_rewrite(workbook):
+    ws = workbook["Data"]
+    ws["E1"] = "=A1+Calc!B1"
+    ws.insert_rows(1, translate=True)
+    references = workbook._references
+    index = workbook.build_reference_index()
+    assert index is not references
+    ws.insert_rows(1, translate=True)
+    assert workbook._references is index
+    assert ws["E3"].value == "=A3+Calc!B1"
+    assert coords(index.dependents(ws["A3"])) == ["Data!B3", "Data!E3", "Calc!A2"]
+
+
+def test_from_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    wb = Workbook()
+    sheets = [wb.create_sheet() for i in range(8)]
+    index = wb.build_reference_index()
+
+    def populate(ws):
+        for row in range(1, 51):
+            ws.cell(row=row, column=1, value=row)
+            ws.cell(row=row, column=2, value=f"=A{row}*2")
+
+    with ThreadPoolExecutor(8) as pool:
+        for _ in pool.map(populate, sheets):
+            pass
+
+    for ws in sheets:
+        assert index.dependents(ws["A7"]) == [ws["B7"]]
+
+
+class TestPrecedents:
+
+    def test_cell(self, workbook):
+        index = workbook.build_reference_index()
+        ws = workbook["Data"]
+        assert [str(r) for r in index.precedents(ws["D1"])] == ["'Data'!B1:B5"]
+        assert index.precedents(ws["A1"]) == []
+
+
+    def test_names_and_sheets(self, workbook):
+        index = workbook.build_reference_index()
+        calc = workbook["Calc"]
+        assert [str(r) for r in index.precedents(calc["A1"])] == [
+            "'Data'!D1", "'Calc'!B1"]
+        assert [str(r) for r in index.precedents(calc["A2"])] == [
+            "'Data'!A1:A1048576"]
+
+
+    def test_recursive(self, workbook):
+        index = workbook.build_reference_index()
+        calc = workbook["Calc"]
+        precedents = index.precedents(calc["A1"], recursive=True)
+        assert sorted(str(r) for r in precedents) == sorted([
+            "'Data'!D1", "'Calc'!B1", "'Data'!B1:B5", "'Data'!A1", "'Data'!A2",
+            "'Data'!A3", "'Data'!A4", "'Data'!A5"])
+
+
+class TestDependents:
+
+    def test_cell(self, workbook):
+        index = workbook.build_reference_index()
+        ws = workbook["Data"]
+        assert coords(index.dependents(ws["A2"])) == ["Data!B2", "Calc!A2"]
+        assert coords(index.dependents(ws["B3"])) == ["Data!D1"]
+        assert index.dependents(ws["C1"]) == []
+
+
+    def test_recursive(self, workbook):
+        index = workbook.build_reference_index()
+        ws = workbook["Data"]
+        assert coords(index.dependents(ws["A2"], recursive=True)) == [
+            "Data!D1", "Data!B2", "Calc!A1", "Calc!A2"]
+
+
+    def test_range(self, workbook):
+        index = workbook.build_reference_index()
+        assert coords(index.dependents("Data!B4:D5")) == ["Data!D1"]
+        assert coords(index.dependents("Data!A1:D1")) == [
+            "Data!B1", "Data!D1", "Calc!A1", "Calc!A2"]
+        assert coords(index.dependents("'Calc'!B1")) == ["Calc!A1"]
+        with pytest.raises(ValueError):
+            index.dependents("B4:D5")
+
+
+    def test_name(self, workbook):
+        index = workbook.build_reference_index()
+        assert coords(index.dependents("rate")) == ["Calc!A1"]
+        assert index.dependents("unknown") == []
+
+
+class TestUpdates:
+
+    def test_changed(self, workbook):
+        index = workbook.build_reference_index()
+        ws = workbook["Data"]
+        ws["C1"] = "=A1+A2"
+        assert coords(index.dependents(ws["A1"])) == ["Data!B1", "Data!C1", "Calc!A2"]
+        ws["B1"] = 1
+        assert coords(index.dependents(ws["A1"])) == ["Data!C1", "Calc!A2"]
+        assert index.precedents(ws["B1"]) == []
+
+
+    def test_insert_rows(self, workbook):
+        index = workbook.build_reference_index()
+        ws = workbook["Data"]
+        ws.insert_rows(1, translate=True)
+        assert ws["B2"].value == "=A2*2"
+        assert coords(index.dependents(ws["A2"])) == ["Data!B2", "Calc!A2"]
+        assert coords(index.dependents(ws["B6"])) == ["Data!D2"]
+
+
+    def test_move_range(self, workbook):
+        index = workbook.build_reference_index()
+        ws = workbook["Data"]
+        ws.move_range("D1", cols=1)
+        assert coords(index.dependents(ws["B1"])) == ["Data!E1"]
+
+
+    def test_names(self, workbook):
+        index = workbook.build_reference_index()
+        workbook.defined_names["rate"].attr_text = "Calc!$C$1"
+        index.rebuild()
+        assert coords(index.dependents(workbook["Calc"]["C1"])) == ["Calc!A1"]
+
+
+    def test_remove_sheet(self, workbook):
+        index = workbook.build_reference_index()
+        ws = workbook["Data"]
+        workbook.remove(workbook["Calc"])
+        assert coords(index.dependents(ws["D1"])) == []
@@ -0,0 +1,255 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import datetime
+from io import BytesIO
+
+import pytest
+
+from openpyxl import load_workbook
+from openpyxl.workbook import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet.formula import ArrayFormula
+
+
+@pytest.fixture
+def Evaluator():
+    from ..evaluate import Evaluator
+    return Evaluator
+
+
+@pytest.fixture
+def workbook():
+    wb = Workbook()
+    ws = wb.active
+    for row in range(1, 11):
+        ws.cell(row, 1, row)
+        ws.cell(row, 2, "odd" if row % 2 else "even")
+        ws.cell(row, 3, f"=A{row}*2")
+    return wb
+
+
+@pytest.mark.parametrize("formula, expected",
+                         [
+                             ("=1+2*3", 7),
+                             ("=2^3^2", 64),
+                             ("=-2^2", 4),
+                             ("=10%", 0.1),
+                             ('=+"abc"', "abc"),
+                             ('=+B1', "odd"),
+                             ('="a"&1&TRUE', "a1TRUE"),
+                             ("=1/0", "#DIV/0!"),
+                             ("=1E+300*1E+300", "#NUM!"),
+                             ("=SUM(1E+300*{1,1E+300})", "#NUM!"),
+                             ("=SUM(1E+308,1E+308)", "#NUM!"),
+                             ('=1+"x"', "#VALUE!"),
+                             ("=#N/A+1", "#N/A"),
+                             ("=A1=1", True),
+                             ("=D1", 0),
+                             ("=SUM(A1:A10)", 55),
+                             ("=SUM(A:A)", 55),
+                             ("=SUM(C1:C10)", 110),
+                             ("=SUM(A1:A10*C1:C10)", 770),
+                             ("=SUM(A1:A10/(A1:A10-1))", "#DIV/0!"),
+                             ('=SUMIFS(C1:C10,B1:B10,"odd",A1:A10,">3")', 42),
+                             ('=COUNTIF(B1:B10,"e*")', 5),
+                             ("=VLOOKUP(4,A1:C10,3,FALSE)", 8),
+                             ("=INDEX(C1:C10,MATCH(7,A1:A10,0))", 14),
+                             ("=MATCH(99,A1:A10,0)", "#N/A"),
+                             ('=IFERROR(1/0,"none")', "none"),
+                             ('=IF(A2>1,"big","small")', "big"),
+                             ("=SUM({1,2;3,4})", 10),
+                             ("=NOSUCHFUNCTION(1)", "#NAME?"),
+                             ("=SUM(1", "#NAME?"),
+                             ("=Other!A1*2", "#REF!"),
+                         ]
+                         )
+def test_value(Evaluator, workbook, formula, expected):
+    wb = workbook
+    ws = wb.active
+    ws["E1"] = formula
+    evaluator = Evaluator(wb)
+    assert evaluator.value(ws["E1"]) == expected
+
+
+def test_values(Evaluator, workbook):
+    wb = workbook
+    ws = wb.active
+    ws["E1"] = datetime.date(2024, 1, 1)
+    evaluator = Evaluator(wb)
+    assert evaluator.value(ws["A3"]) == 3
+    assert evaluator.value(ws["E1"]) == 45292
+    assert evaluator.value(ws["E2"]) is None
+
+
+def test_other_sheets(Evaluator, workbook):
+    wb = workbook
+    ws = wb.active
+    other = wb.create_sheet("Other Sheet")
+    other["A1"] = "=SUM('Sheet'!C1:C3)"
+    ws["E1"] = "='other sheet'!A1+1"
+    evaluator = Evaluator(wb)
+    assert evaluator.value(ws["E1"]) == 13
+    ws["A1"] = 11
+    assert evaluator.value(ws["E1"]) == 33
+
+
+def test_defined_names(Evaluator, workbook):
+    wb = workbook
+    ws = wb.active
+    wb.defined_names["numbers"] = DefinedName("numbers", attr_text="Sheet!$A$1:$A$10")
+    ws.defined_names["rate"] = DefinedName("rate", attr_text="0.5")
+    ws["E1"] = "=SUM(numbers)*rate"
+    ws["E2"] = "=missing"
+    evaluator = Evaluator(wb)
+    assert evaluator.value(ws["E1"]) == 27.5
+    assert evaluator.value(ws["E2"]) == "#NAME?"
+    ws["A10"] = 0
+    assert evaluator.value(ws["E1"]) == 22.5
+
+
+def test_array_formula(Evaluator, workbook):
+    wb = workbook
+    ws = wb.active
+    ws["E1"] = ArrayFormula("E1", "=SUM(A1:A3*A1:A3)")
+    evaluator = Evaluator(wb)
+    assert evaluator.value(ws["E1"]) == 14
+
+
+def test_circular(Evaluator):
+    wb = Workbook()
+    ws = wb.active
+    ws["A1"] = "=B1+1"
+    ws["B1"] = "=A1+1"
+    evaluator = Evaluator(wb)
+    assert evaluator.value(ws["A1"]) == 2
+    assert evaluator.value(ws["B1"]) == 1
+
+
+def test_long_chain(Evaluator):
+    wb = Workbook()
+    ws = wb.active
+    ws["A1"] = 1
+    for row in range(2, 5001):
+        ws.cell(row, 1, f"=A{row-1}+1")
+    evaluator = Evaluator(wb)
+    assert evaluator.value(ws["A5000"]) == 5000
+
+
+class TestIncremental:
+
+    def test_recalculate(self, Evaluator, workbook):
+        wb = workbook
+        ws = wb.active
+        ws["E1"] = "=SUM(C1:C10)"
+        evaluator = Evaluator(wb)
+        assert len(evaluator._dirty) == 11
+        evaluator.recalculate()
+        assert not evaluator._dirty
+        assert evaluator.cached(ws["C4"]) == 8
+        assert evaluator.cached(ws["E1"]) == 110
+
+
+    def test_changed_value(self, Evaluator, workbook):
+        wb = workbook
+        ws = wb.active
+        ws["E1"] = "=SUM(C1:C10)"
+        ws["E2"] = "=C1"
+        evaluator = Evaluator(wb)
+        evaluator.recalculate()
+
+        ws["A4"] = 10
+        assert evaluator._dirty == {(ws, 4, 3), (ws, 1, 5)}
+        assert evaluator.cached(ws["E1"]) is None
+        assert evaluator.cached(ws["E2"]) == 2
+        assert evaluator.value(ws["E1"]) == 122
+
+
+    def test_changed_formula(self, Evaluator, workbook):
+        wb = workbook
+        ws = wb.active
+        ws["E1"] = "=SUM(C1:C10)"
+        evaluator = Evaluator(wb)
+        evaluator.recalculate()
+
+        ws["C1"] = "=A1*3"
+        assert evaluator.value(ws["E1"]) == 111
+        ws["C1"] = None
+        assert evaluator.value(ws["E1"]) == 108
+        ws["A1"] = 5
+        assert evaluator._dirty == set()
+
+
+    def test_new_cells(self, Evaluator, workbook):
+        wb = workbook
+        ws = wb.active
+        ws["E1"] = "=SUM(A:A)"
+        evaluator = Evaluator(wb)
+        assert evaluator.value(ws["E1"]) == 55
+        ws["A20"] = 5
+        assert evaluator.value(ws["E1"]) == 60
+
+
+    def test_insert_rows(self, Evaluator, workbook):
+        wb = workbook
+        ws = wb.active
+        ws["E1"] = "=SUM(C1:C10)"
+        evaluator = Evaluator(wb)
+        assert evaluator.value(ws["E1"]) == 110
+
+        ws.insert_rows(1, translate=True)
+        assert evaluator.cached(ws["E2"]) is None
+        assert evaluator.value(ws["E2"]) == 110
+        assert evaluator.value(ws["C2"]) == 2
+
+
+    def test_new_sheet(self, Evaluator, workbook):
+        wb = workbook
+        ws = wb.active
+        ws["E1"] = "=New!A1"
+        evaluator = Evaluator(wb)
+        assert evaluator.value(ws["E1"]) == "#REF!"
+        new = wb.create_sheet("New")
+        new["A1"] = 3
+        new["A2"] = "=A1*2"
+        assert evaluator.value(new["A2"]) == 6
+
+
+@pytest.mark.parametrize("formula, attrs, value",
+                         [
+                             ("=1+1", {}, "2"),
+                             ('="a"&"b"', {"t": "str"}, "ab"),
+                             ("=1=1", {"t": "b"}, "1"),
+                             ("=1/0", {"t": "e"}, "#DIV/0!"),
+                             ("=1E+300*1E+300", {"t": "e"}, "#NUM!"),
+                         ]
+                         )
+def test_write_cached_values(Evaluator, formula, attrs, value):
+    from openpyxl.cell._writer import write_cell
+    from openpyxl.xml.functions import xmlfile
+    wb = Workbook()
+    ws = wb.active
+    ws["A1"] = formula
+    evaluator = Evaluator(wb)
+    evaluator.recalculate()
+
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        write_cell(xf, ws, ws["A1"])
+    xml = out.getvalue().decode()
+    for key, attr in attrs.items():
+        assert f'{key}="{attr}"' in xml
+    assert f"<v>{value}</v>" in xml
+
+
+def test_save(Evaluator, workbook):
+    wb = workbook
+    ws = wb.active
+    ws["E1"] = '=SUMIFS(C1:C10,B1:B10,"even")'
+    Evaluator(wb).recalculate()
+    out = BytesIO()
+    wb.save(out)
+
+    wb = load_workbook(out, data_only=True)
+    ws = wb.active
+    assert ws["C3"].value == 6
+    assert ws["E1"].value == 60
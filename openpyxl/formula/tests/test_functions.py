@@ -0,0 +1,323 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import math
+
+import pytest
+
+from ..functions import (
+    Error,
+    FormulaError,
+    Range,
+    DIV0,
+    NA,
+    VALUE,
+)
+
+
+@pytest.fixture
+def functions():
+    from .. import functions
+    return functions
+
+
+@pytest.fixture
+def table():
+    return Range([
+        ["apple", 1, 10],
+        ["Banana", 2, 20],
+        ["cherry", None, 30],
+        ["banana", "3", 40],
+        [True, 5, 50],
+    ])
+
+
+def column(rng, idx):
+    return Range([[v] for v in rng.column(idx)])
+
+
+class TestRange:
+
+    def test_shape(self, table):
+        assert table.shape == (5, 3)
+        assert list(Range([[1, 2]]).values()) == [1, 2]
+
+
+    def test_error(self):
+        assert Range([[1, NA]]).error() == NA
+        assert Range([[1, "#N/A"]]).error() is None
+
+
+    def test_index(self, table):
+        names = table.column(0)
+        index = table.index(names)
+        assert index["banana"] == 1
+        assert table.index(names) is index
+
+
+@pytest.mark.parametrize("value, expected",
+                         [
+                             (None, 0),
+                             (True, 1),
+                             (" 1.5 ", 1.5),
+                             ("1e3", 1000),
+                             (Range([[4]]), 4),
+                         ]
+                         )
+def test_to_number(functions, value, expected):
+    assert functions.to_number(value) == expected
+
+
+@pytest.mark.parametrize("value, error",
+                         [
+                             ("apple", VALUE),
+                             ("inf", VALUE),
+                             (DIV0, DIV0),
+                         ]
+                         )
+def test_to_number_error(functions, value, error):
+    with pytest.raises(FormulaError) as e:
+        functions.to_number(value)
+    assert e.value.error == error
+
+
+@pytest.mark.parametrize("value, expected",
+                         [
+                             (None, ""),
+                             (True, "TRUE"),
+                             (2.0, "2"),
+                             (0.1, "0.1"),
+                             ("a", "a"),
+                         ]
+                         )
+def test_to_text(functions, value, expected):
+    assert functions.to_text(value) == expected
+
+
+@pytest.mark.parametrize("op, left, right, expected",
+                         [
+                             ("=", "A", "a", True),
+                             ("<", 5, "1", True),
+                             ("<", "z", True, True),
+                             ("=", None, 0, True),
+                             ("=", None, "", True),
+                             (">=", 2, 2.0, True),
+                             ("<>", 1, "1", True),
+                         ]
+                         )
+def test_compare(functions, op, left, right, expected):
+    assert functions.compare(op, left, right) is expected
+
+
+class TestAggregates:
+
+    def test_sum(self, functions, table):
+        assert functions.SUM(column(table, 1), "4", True) == 13
+
+
+    def test_sum_error(self, functions):
+        with pytest.raises(FormulaError):
+            functions.SUM(Range([[1, NA]]))
+
+
+    def test_count(self, functions, table):
+        assert functions.COUNT(column(table, 1), "2", "a") == 4
+        assert functions.COUNTA(table) == 14
+        assert functions.COUNTBLANK(table) == 1
+
+
+    def test_average(self, functions, table):
+        assert functions.AVERAGE(column(table, 2)) == 30
+        with pytest.raises(FormulaError):
+            functions.AVERAGE(Range([["a"]]))
+
+
+    def test_min_max(self, functions, table):
+        assert functions.MIN(column(table, 1)) == 1
+        assert functions.MAX(column(table, 1), 7) == 7
+        assert functions.MAX(Range([[None]])) == 0
+
+
+    def test_sumproduct(self, functions, table):
+        assert functions.SUMPRODUCT(column(table, 1), column(table, 2)) == 300
+
+
+@pytest.mark.parametrize("criterion, expected",
+                         [
+                             ("banana", 60),
+                             ("b*", 60),
+                             ("<>banana", 90),
+                             ("?pple", 10),
+                             (True, 50),
+                             ("", 0),
+                         ]
+                         )
+def test_sumif(functions, table, criterion, expected):
+    assert functions.SUMIF(column(table, 0), criterion, column(table, 2)) == expected
+
+
+@pytest.mark.parametrize("criterion, expected",
+                         [
+                             (">1", 2),
+                             ("<=2", 2),
+                             (2, 1),
+                             ("=", 1),
+                             ("<>", 4),
+                         ]
+                         )
+def test_countif(functions, table, criterion, expected):
+    assert functions.COUNTIF(column(table, 1), criterion) == expected
+
+
+def test_sumifs(functions, table):
+    assert functions.SUMIFS(column(table, 2),
+                            column(table, 0), "banana",
+                            column(table, 2), ">20") == 40
+    with pytest.raises(FormulaError):
+        functions.SUMIFS(column(table, 2), Range([[1]]), 1)
+
+
+def test_averageifs(functions, table):
+    assert functions.AVERAGEIFS(column(table, 2), column(table, 0), "banana") == 30
+    with pytest.raises(FormulaError) as e:
+        functions.AVERAGEIFS(column(table, 2), column(table, 0), "kiwi")
+    assert e.value.error == DIV0
+
+
+class TestLookups:
+
+    def test_vlookup(self, functions, table):
+        assert functions.VLOOKUP("BANANA", table, 3, False) == 20
+        with pytest.raises(FormulaError) as e:
+            functions.VLOOKUP("kiwi", table, 3, False)
+        assert e.value.error == NA
+
+
+    def test_vlookup_approximate(self, functions):
+        brackets = Range([[0, "low"], [10, "mid"], [100, "high"]])
+        assert functions.VLOOKUP(50, brackets, 2) == "mid"
+        assert functions.VLOOKUP(100, brackets, 2, True) == "high"
+        with pytest.raises(FormulaError):
+            functions.VLOOKUP(-1, brackets, 2)
+
+
+    def test_hlookup(self, functions):
+        rng = Range([["a", "b"], [1, 2]])
+        assert functions.HLOOKUP("b", rng, 2, False) == 2
+
+
+    def test_match(self, functions, table):
+        assert functions.MATCH("cherry", column(table, 0), 0) == 3
+        assert functions.MATCH(15, Range([[10, 20, 30]])) == 1
+        assert functions.MATCH(15, Range([[30], [20], [10]]), -1) == 2
+
+
+    def test_index(self, functions, table):
+        assert functions.INDEX(table, 2, 3) == 20
+        assert functions.INDEX(column(table, 2), 4) == 40
+        with pytest.raises(FormulaError):
+            functions.INDEX(table, 6, 1)
+
+
+class TestLogical:
+
+    def test_if(self, functions):
+        assert functions.IF(True, 1, 2) == 1
+        assert functions.IF(0, 1) is False
+        with pytest.raises(FormulaError):
+            functions.IF(NA, 1, 2)
+
+
+    def test_iferror(self, functions):
+        assert functions.IFERROR(DIV0, "x") == "x"
+        assert functions.IFNA(DIV0, "x") == DIV0
+        assert functions.IFNA(NA, "x") == "x"
+
+
+    def test_and_or(self, functions):
+        assert functions.AND(True, Range([[1, None, "a"]])) is True
+        assert functions.OR(False, 0) is False
+        with pytest.raises(FormulaError):
+            functions.AND(Range([["a"]]))
+
+
+    def test_is(self, functions):
+        assert functions.ISERROR(VALUE) is True
+        assert functions.ISNA(VALUE) is False
+        assert functions.ISNUMBER("1") is False
+        assert functions.ISTEXT("1") is True
+        assert functions.ISBLANK(None) is True
+
+
+class TestMaths:
+
+    @pytest.mark.parametrize("number, digits, expected",
+                             [
+                                 (2.5, 0, 3),
+                                 (-2.5, 0, -3),
+                                 (1.005, 2, 1.01),
+                                 (1234, -2, 1200),
+                             ]
+                             )
+    def test_round(self, functions, number, digits, expected):
+        assert functions.ROUND(number, digits) == expected
+
+
+    def test_rounding(self, functions):
+        assert functions.ROUNDUP(1.21, 1) == 1.3
+        assert functions.ROUNDDOWN(-1.29, 1) == -1.2
+        assert functions.INT(-1.5) == -2
+
+
+    def test_mod(self, functions):
+        assert functions.MOD(-3, 2) == 1
+        with pytest.raises(FormulaError) as e:
+            functions.MOD(1, 0)
+        assert e.value.error == DIV0
+
+
+    def test_power(self, functions):
+        assert functions.POWER(2, 10) == 1024
+        with pytest.raises(FormulaError):
+            functions.POWER(-8, 0.5)
+
+
+    def test_logs(self, functions):
+        assert functions.LN(math.e) == 1
+        with pytest.raises(FormulaError):
+            functions.LOG10(0)
+
+
+class TestText:
+
+    def test_slices(self, functions):
+        assert functions.LEFT("openpyxl", 4) == "open"
+        assert functions.RIGHT("openpyxl") == "l"
+        assert functions.MID("openpyxl", 5, 2) == "py"
+        assert functions.LEN(123) == 3
+
+
+    def test_trim(self, functions):
+        assert functions.TRIM("  a   b ") == "a b"
+
+
+    def test_concatenate(self, functions):
+        assert functions.CONCATENATE("a", 1, True) == "a1TRUE"
+        assert functions.CONCAT(Range([["a", None], ["b", 2.0]])) == "ab2"
+
+
+    def test_substitute(self, functions):
+        assert functions.SUBSTITUTE("a-b-c", "-", "+") == "a+b+c"
+        assert functions.SUBSTITUTE("a-b-c", "-", "+", 2) == "a-b+c"
+
+
+    def test_value(self, functions):
+        assert functions.VALUE_(" 12 ") == 12
+        with pytest.raises(FormulaError):
+            functions.VALUE_("twelve")
+
+
+def test_registry(functions):
+    assert functions.FUNCTIONS["VALUE"] is functions.VALUE_
+    assert functions.FUNCTIONS["NA"] is functions.NA_
+    assert "Range" not in functions.FUNCTIONS
+    assert isinstance(functions.NA, Error)
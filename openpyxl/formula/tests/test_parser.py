@@ -0,0 +1,99 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+
+@pytest.fixture
+def parse():
+    from ..parser import parse
+    return parse
+
+
+@pytest.mark.parametrize("formula, expected",
+                         [
+                             ("=1", ("value", 1)),
+                             ("=1.5", ("value", 1.5)),
+                             ('="a""b"', ("value", 'a"b')),
+                             ("=TRUE", ("value", True)),
+                             ("=#N/A", ("error", "#N/A")),
+                             ("=A1", ("ref", None, 1, 1, 1, 1)),
+                             ("=$B$2:A10", ("ref", None, 1, 2, 2, 10)),
+                             ("=A:C", ("ref", None, 1, None, 3, None)),
+                             ("=3:4", ("ref", None, None, 3, None, 4)),
+                             ("='My Sheet'!A1", ("ref", "My Sheet", 1, 1, 1, 1)),
+                             ("=total", ("name", None, "total")),
+                             ("=Sheet1!#REF!", ("error", "#REF!")),
+                         ]
+                         )
+def test_operands(parse, formula, expected):
+    assert parse(formula) == expected
+
+
+def test_precedence(parse):
+    tree = parse("=1+2*3^2&\"x\"=A1")
+    assert tree == (
+        "infix", "=",
+        ("infix", "&",
+         ("infix", "+",
+          ("value", 1),
+          ("infix", "*", ("value", 2), ("infix", "^", ("value", 3), ("value", 2)))),
+         ("value", "x")),
+        ("ref", None, 1, 1, 1, 1),
+    )
+
+
+def test_left_associative(parse):
+    assert parse("=8-4-2") == (
+        "infix", "-",
+        ("infix", "-", ("value", 8), ("value", 4)),
+        ("value", 2),
+    )
+
+
+def test_unary(parse):
+    assert parse("=-A1^2") == (
+        "infix", "^", ("prefix", "-", ("ref", None, 1, 1, 1, 1)), ("value", 2)
+    )
+    assert parse("=50%") == ("postfix", "%", ("value", 50))
+
+
+def test_functions(parse):
+    assert parse("=_xlfn.CONCAT(sum(A1:A2),,(1))") == (
+        "func", "CONCAT", [
+            ("func", "SUM", [("ref", None, 1, 1, 1, 2)]),
+            ("missing",),
+            ("value", 1),
+        ]
+    )
+    assert parse("=PI()") == ("func", "PI", [])
+
+
+def test_array(parse):
+    assert parse("={1,-2;\"a\",#N/A}") == (
+        "array", [[("value", 1), ("value", -2)], [("value", "a"), ("error", "#N/A")]]
+    )
+
+
+@pytest.mark.parametrize("formula",
+                         [
+                             "=",
+                             "=1+",
+                             "=SUM(1",
+                             "=[1]Sheet1!A1",
+                             "not a formula",
+                         ]
+                         )
+def test_invalid(parse, formula):
+    from ..parser import ParseError
+    with pytest.raises(ParseError):
+        parse(formula)
+
+
+def test_references(parse):
+    from ..parser import references
+    tree = parse("=SUM(A1:A3)+total*Sheet2!B2")
+    assert list(references(tree)) == [
+        ("ref", None, 1, 1, 1, 3),
+        ("name", None, "total"),
+        ("ref", "Sheet2", 2, 2, 2, 2),
+    ]
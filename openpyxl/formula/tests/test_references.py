@@ -0,0 +1,183 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+from openpyxl.workbook import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet.formula import ArrayFormula
+from openpyxl.worksheet.remap import IndexMap
+
+
+@pytest.fixture
+def rewrite_formula():
+    from ..references import rewrite_formula
+    return rewrite_formula
+
+
+@pytest.fixture
+def ReferenceIndex():
+    from ..references import ReferenceIndex
+    return ReferenceIndex
+
+
+@pytest.mark.parametrize("formula, expected",
+                         [
+                             ("=A1+A5", "=A1+A7"),
+                             ("=$A$5", "=$A$7"),
+                             ("=SUM(A1:B4)", "=SUM(A1:B6)"),
+                             ("=SUM(A3:B4)", "=SUM(A5:B6)"),
+                             ("=SUM(2:4)", "=SUM(2:6)"),
+                             ("=SUM(A:B)", "=SUM(A:B)"),
+                             ("=Sheet1!A5+Other!A5", "=Sheet1!A7+Other!A5"),
+                             ("='sheet1'!A5", "='sheet1'!A7"),
+                             ("=[1]Sheet1!A5", "=[1]Sheet1!A5"),
+                             ("=name+A5", "=name+A7"),
+                             ('="A5"', '="A5"'),
+                             ("literal A5", "literal A5"),
+                         ]
+                         )
+def test_insert_rows(rewrite_formula, formula, expected):
+    rows = IndexMap.insertion([(3, 2)])
+    assert rewrite_formula(formula, "Sheet1", rows=rows, local=True) == expected
+
+
+@pytest.mark.parametrize("formula, expected",
+                         [
+                             ("=B1+C1+D1", "=B1+#REF!+C1"),
+                             ("=SUM(A1:D1)", "=SUM(A1:C1)"),
+                             ("=SUM(C1:C9)", "=SUM(#REF!)"),
+                             ("=SUM($C:$D)", "=SUM($C:$C)"),
+                             ("=Sheet1!C1", "=Sheet1!#REF!"),
+                         ]
+                         )
+def test_delete_cols(rewrite_formula, formula, expected):
+    cols = IndexMap.deletion([3])
+    assert rewrite_formula(formula, "Sheet1", cols=cols, local=True) == expected
+
+
+def test_other_sheet(rewrite_formula):
+    rows = IndexMap.deletion([1])
+    assert rewrite_formula("=A5", "Sheet1", rows=rows) == "=A5"
+
+
+class TestReferenceIndex:
+
+
+    def test_ctor(self, ReferenceIndex):
+        wb = Workbook()
+        ws = wb.active
+        ws["A1"] = "=B2"
+        ws["A2"] = "=Other!C3+Other!D1"
+        ws["A3"] = "=NOW()"
+        idx = ReferenceIndex(wb)
+        assert len(idx._entries) == 2
+        assert idx._extents[ws] == {id(ws["A1"]): (2, 2)}
+        assert idx._extents["other"] == {id(ws["A2"]): (3, 4)}
+
+
+    def test_track(self):
+        wb = Workbook()
+        ws = wb.active
+        ws["A1"] = "=B5"
+        ws.insert_rows(1, translate=True)
+        ws["A1"] = "=B5"
+        ws["A3"] = "=B5"
+        ws["A3"] = 3
+        ws.delete_rows(2, translate=True)
+        assert ws["A1"].value == "=B4"
+        assert ws["A2"].value == 3
+        assert len(wb._references._entries) == 1
+
+
+    def test_track_from_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        wb = Workbook()
+        sheets = [wb.create_sheet() for i in range(8)]
+        wb.active.insert_rows(1, translate=True) # creates the index
+
+        def populate(ws):
+            for row in range(1, 51):
+                ws.cell(row=row, column=1, value=f"=B{row}*2")
+
+        with ThreadPoolExecutor(8) as pool:
+            for _ in pool.map(populate, sheets):
+                pass
+
+        assert len(wb._references._entries) == 400
+        for ws in sheets:
+            ws.insert_rows(1, translate=True)
+            assert ws["A8"].value == "=B8*2"
+
+
+    def test_unaffected(self, ReferenceIndex):
+        wb = Workbook()
+        ws = wb.active
+        ws["A1"] = "=B1"
+        idx = ReferenceIndex(wb)
+        ws["A1"]._value = "=C1" # not tracked so not rewritten
+        idx.rewrite(ws, rows=IndexMap.insertion([1]))
+        assert ws["A1"].value == "=C1"
+
+
+    def test_defined_names(self):
+        wb = Workbook()
+        ws = wb.active
+        wb.defined_names["total"] = DefinedName("total", attr_text="Sheet!$A$1:$A$10")
+        ws.defined_names["local"] = DefinedName("local", attr_text="$B$4")
+        ws.defined_names["fixed"] = DefinedName("fixed", attr_text="3.14")
+        ws.delete_rows_many([2, 3], translate=True)
+        assert wb.defined_names["total"].value == "Sheet!$A$1:$A$8"
+        assert ws.defined_names["local"].value == "$B$2"
+        assert ws.defined_names["fixed"].value == "3.14"
+
+
+    @pytest.mark.parametrize("edit", ["insert_rows", "insert_rows_many"])
+    def test_rules(self, edit):
+        from openpyxl.formatting.rule import Rule
+        from openpyxl.worksheet.datavalidation import DataValidation
+        wb = Workbook()
+        ws = wb.active
+        other = wb.create_sheet("Other")
+        rule = Rule(type="expression", formula=["$B2>Other!$A$1", "$C$2"])
+        ws.conditional_formatting.add("A2:A5", rule)
+        validation = DataValidation(type="whole", operator="between",
+                                    formula1="=$A$2", formula2="Sheet!$A$9")
+        other.add_data_validation(validation)
+        listed = DataValidation(type="list", formula1='"a,b,c"')
+        ws.add_data_validation(listed)
+        getattr(ws, edit)([1] if edit.endswith("many") else 1, translate=True)
+        assert rule.formula == ["$B3>Other!$A$1", "$C$3"]
+        assert validation.formula1 == "=$A$2"
+        assert validation.formula2 == "Sheet!$A$10"
+        assert listed.formula1 == '"a,b,c"'
+
+
+    def test_array_formula(self):
+        wb = Workbook()
+        ws = wb.active
+        ws["C2"] = ArrayFormula("C2:C4", "=A2:A4*B2:B4")
+        ws.insert_rows_many([1], translate=True)
+        formula = ws["C3"].value
+        assert formula.ref == "C3:C5"
+        assert formula.text == "=A3:A5*B3:B5"
+
+
+    def test_removed_sheet(self):
+        wb = Workbook()
+        ws = wb.active
+        other = wb.create_sheet("Other")
+        other["A1"] = "=Sheet!A5"
+        wb.remove(other)
+        ws.insert_rows(1, translate=True)
+        assert other["A1"].value == "=Sheet!A5"
+
+
+    def test_copied_worksheet(self):
+        wb = Workbook()
+        ws = wb.active
+        ws["A1"] = "=B5"
+        ws.insert_rows(1, translate=True)
+        copy = wb.copy_worksheet(ws)
+        copy.insert_rows(1, translate=True)
+        assert copy["A3"].value == "=B7"
+        assert ws["A2"].value == "=B6"
@@ -579,6 +579,66 @@ class TestTokenizer(object):
         tok = tokenizer.Tokenizer(formula)
         assert tok.render() == formula
 
+    @pytest.mark.parametrize('formula', [
+        '=IF(A$3<40%,"",INDEX(Pipeline!B$4:B$138,#REF!))',
+        "='Summary slices'!$C$3:'Summary slices'!D4",
+        '=TEXT(-S7/1000,"$#,##0""M""")',
+        '=IF(A$3<1.3E-8,"",TEXT(K7*1E+12,"0")&"bp")',
+        '=15E+3-1.5e-3',
+        '=+IF(A$3<>$B7,"",(MIN(IF({TRUE, FALSE;1,2},A6:B6,$S7))>=LOWER_BOUND))',
+        '=SUM(Table1[[#This Row],[Col 1]])',
+        '=name!#REF!+#N/A',
+        '=- -A1% \n+ (B2)',
+        '=A1:"text"',
+        '=1,2',
+        '=SUM(1',
+        '=SUM(1))',
+        '=SUM(1}',
+        '=A1"text"',
+        '=A1{1}',
+        '="unterminated',
+        '=#BAD',
+        '=[unmatched',
+    ])
+    def test_fast_scan(self, tokenizer, formula):
+
+        class Reference(tokenizer.Tokenizer):
+            pass # not the fast path
+
+        try:
+            expected = [(t.value, t.type, t.subtype) for t in Reference(formula).items]
+        except (tokenizer.TokenizerError, IndexError):
+            with pytest.raises(tokenizer._Unsupported):
+                tokenizer._scan(formula)
+        else:
+            assert list(tokenizer._scan(formula)) == expected
+
+
+    def test_cache(self, tokenizer):
+        tok = tokenizer.Tokenizer("=A1+1")
+        tok.items[0].value = "B2"
+        tok = tokenizer.Tokenizer("=A1+1")
+        assert tok.items[0].value == "A1"
+
+
+    def test_subclass(self, tokenizer):
+
+        class Tokenizer(tokenizer.Tokenizer):
+
+            def __init__(self, formula):
+                self.ranges = []
+                super().__init__(formula)
+
+            def save_token(self):
+                if self.token:
+                    self.ranges.append("".join(self.token))
+                super().save_token()
+
+        tokenizer.Tokenizer("=A1+B2")
+        tok = Tokenizer("=A1+B2")
+        assert tok.ranges == ["A1", "B2"]
+        assert [t.value for t in tok.items] == ["A1", "+", "B2"]
+
 
 class TestToken(object):
 
@@ -237,3 +237,20 @@ class TestTranslator(object):
         trans = Translator("='Summary slices'!C3", "A1")
         result = trans.translate_formula(row_delta=2, col_delta=3)
         assert result == "='Summary slices'!F5"
+
+
+    def test_compile(self, Translator):
+        trans = Translator("=SUM($A1:B$2)+Sheet1!C3*named", "A1")
+        assert trans._compile() == [
+            "=SUM($A", ("row", 1), ":", ("column", 2), "$2)+Sheet1!",
+            ("column", 3), ("row", 3), "*named",
+        ]
+
+
+    def test_translate_formula_repeatedly(self, Translator, TranslatorError):
+        trans = Translator("=A1+$B2:C$3", "B2")
+        assert trans.translate_formula("B3") == "=A2+$B3:C$3"
+        assert trans.translate_formula("D2") == "=C1+$B2:E$3"
+        with pytest.raises(TranslatorError):
+            trans.translate_formula("A2")
+        assert trans.translate_formula("B2") == "=A1+$B2:C$3"
@@ -6,6 +6,7 @@ http://ewbi.blogs.com/develops/2004/12/excel_formula_p.html written by Eric
 Bachtal
 """
 
+from functools import lru_cache
 import re
 
 
@@ -43,6 +44,20 @@ class Tokenizer(object):
     TOKEN_ENDERS = ',;}) +-*/^&=><%'  # Each of these characters, marks the
                                        # end of an operand token
 
+    # characters which are neither token enders nor handled by a consumer
+    PLAIN_RE = re.compile(r"""[^"'\[# \n+\-*/^&=><%{}();,]+""")
+    CONSUMERS = (
+        ('"\'', '_parse_string'),
+        ('[', '_parse_brackets'),
+        ('#', '_parse_error'),
+        (' ', '_parse_whitespace'),
+        ('\n', '_parse_whitespace'),
+        ('+-*/^&=><%', '_parse_operator'),
+        ('{(', '_parse_opener'),
+        (')}', '_parse_closer'),
+        (';,', '_parse_separator'),
+    )
+
     def __init__(self, formula):
         self.formula = formula
         self.items = []
@@ -58,38 +73,46 @@ class Tokenizer(object):
             return  # Already parsed!
         if not self.formula:
             return
-        elif self.formula[0] == '=':
-            self.offset += 1
-        else:
+        elif self.formula[0] != '=':
             self.items.append(Token(self.formula, Token.LITERAL))
             return
-        consumers = (
-            ('"\'', self._parse_string),
-            ('[', self._parse_brackets),
-            ('#', self._parse_error),
-            (' ', self._parse_whitespace),
-            ('\n', self._parse_whitespace),
-            ('+-*/^&=><%', self._parse_operator),
-            ('{(', self._parse_opener),
-            (')}', self._parse_closer),
-            (';,', self._parse_separator),
-        )
-        dispatcher = {}  # maps chars to the specific parsing function
-        for chars, consumer in consumers:
-            dispatcher.update(dict.fromkeys(chars, consumer))
-        while self.offset < len(self.formula):
-            if self.check_scientific_notation():  # May consume one character
-                continue
-            curr_char = self.formula[self.offset]
+        if type(self) is not Tokenizer:
+            self._scan() # subclasses may change how tokens are made
+            return
+        self.items = [Token(value, type_, subtype)
+                      for value, type_, subtype in _tokenize(self.formula)]
+        self.offset = len(self.formula)
+
+    @classmethod
+    def _dispatcher(cls):
+        """Map characters to the methods which consume them."""
+        dispatcher = cls.__dict__.get("_dispatch")
+        if dispatcher is None:
+            dispatcher = {}
+            for chars, name in cls.CONSUMERS:
+                dispatcher.update(dict.fromkeys(chars, getattr(cls, name)))
+            cls._dispatch = dispatcher
+        return dispatcher
+
+    def _scan(self):
+        """Scan the formula after the leading '=' into self.items."""
+        self.offset = 1
+        formula = self.formula
+        end = len(formula)
+        dispatcher = self._dispatcher()
+        while self.offset < end:
+            curr_char = formula[self.offset]
+            if curr_char in '+-' and self.check_scientific_notation():
+                continue  # Consumed one character
             if curr_char in self.TOKEN_ENDERS:
                 self.save_token()
-            if curr_char in dispatcher:
-                self.offset += dispatcher[curr_char]()
+            consumer = dispatcher.get(curr_char)
+            if consumer is not None:
+                self.offset += consumer(self)
             else:
-                # TODO: this can probably be sped up using a regex to get to
-                # the next interesting character
-                self.token.append(curr_char)
-                self.offset += 1
+                match = self.PLAIN_RE.match(formula, self.offset)
+                self.token.append(match.group())
+                self.offset = match.end()
         self.save_token()
 
     def _parse_string(self):
@@ -109,7 +132,7 @@ class Tokenizer(object):
         delim = self.formula[self.offset]
         assert delim in ('"', "'")
         regex = self.STRING_REGEXES[delim]
-        match = regex.match(self.formula[self.offset:])
+        match = regex.match(self.formula, self.offset)
         if match is None:
             subtype = "string" if delim == '"' else 'link'
             raise TokenizerError(f"Reached end of formula while parsing {subtype} in {self.formula}")
@@ -155,9 +178,8 @@ class Tokenizer(object):
         """
         self.assert_empty_token(can_follow='!')
         assert self.formula[self.offset] == '#'
-        subformula = self.formula[self.offset:]
         for err in self.ERROR_CODES:
-            if subformula.startswith(err):
+            if self.formula.startswith(err, self.offset):
                 self.items.append(Token.make_operand(''.join(self.token) + err))
                 del self.token[:]
                 return len(err)
@@ -172,7 +194,7 @@ class Tokenizer(object):
         """
         assert self.formula[self.offset] in (' ', '\n')
         self.items.append(Token(self.formula[self.offset], Token.WSPACE))
-        return self.WSPACE_RE.match(self.formula[self.offset:]).end()
+        return self.WSPACE_RE.match(self.formula, self.offset).end() - self.offset
 
     def _parse_operator(self):
         """
@@ -303,7 +325,7 @@ class Tokenizer(object):
         token transition. In this case, we raise a TokenizerError
 
         """
-        if self.token and self.token[-1] not in can_follow:
+        if self.token and self.token[-1][-1] not in can_follow:
             raise TokenizerError(f"Unexpected character at position {self.offset} in '{self.formula}'")
 
     def save_token(self):
@@ -378,6 +400,10 @@ class Token(object):
             subtype = cls.ERROR
         elif value in ('TRUE', 'FALSE'):
             subtype = cls.LOGICAL
+        elif value[:1] == '$' or value[:1].isalpha() and value[:1] not in 'iInN':
+            # not a number so don't bother trying; float() does accept
+            # inf and nan
+            subtype = cls.RANGE
         else:
             try:
                 float(value)
@@ -444,3 +470,175 @@ class Token(object):
         assert value in (',', ';')
         subtype = cls.ARG if value == ',' else cls.ROW
         return cls(value, cls.SEP, subtype)
+
+
+class _Unsupported(Exception):
+    """Raised by the fast scanner for input it leaves to the Tokenizer."""
+
+
+_LEXEME_RE = re.compile(r"""
+    (?P<plain>[^"'\[\# \n+\-*/^&=><%{}();,]+)
+  | (?P<space>[ \n]+)
+  | (?P<string>"(?:[^"]*"")*[^"]*"(?!"))
+  | (?P<link>'(?:[^']*'')*[^']*'(?!'))
+  | (?P<op>>=|<=|<>|[*/^&=><])
+  | (?P<other>.)
+""", re.VERBOSE | re.DOTALL)
+_BRACKET_RE = re.compile(r"[\[\]]")
+
+
+def _operand(value):
+    """Same as Token.make_operand but as a tuple"""
+    if value.startswith('"'):
+        subtype = Token.TEXT
+    elif value.startswith('#'):
+        subtype = Token.ERROR
+    elif value in ('TRUE', 'FALSE'):
+        subtype = Token.LOGICAL
+    elif value[:1] == '$' or value[:1].isalpha() and value[:1] not in 'iInN':
+        subtype = Token.RANGE
+    else:
+        try:
+            float(value)
+            subtype = Token.NUMBER
+        except ValueError:
+            subtype = Token.RANGE
+    return value, Token.OPERAND, subtype
+
+
+def _scan(formula):
+    """
+    Tokens of a formula as (value, type, subtype).
+
+    Equivalent to the character by character parsing of the Tokenizer, but
+    each match of a regular expression consumes a whole operand, string or
+    run of whitespace. Anything unusual, including any error, raises
+    _Unsupported so that the Tokenizer can deal with it.
+    """
+    OPERAND, OP_IN, OP_PRE, WSPACE = Token.OPERAND, Token.OP_IN, Token.OP_PRE, Token.WSPACE
+    SN_RE = Tokenizer.SN_RE
+    items = []
+    stack = []
+    token = []
+    pos = 1
+    end = len(formula)
+    match = _LEXEME_RE.match
+
+    while pos < end:
+        m = match(formula, pos)
+        kind = m.lastgroup
+        value = m.group()
+
+        if kind == "plain":
+            token.append(value)
+            pos = m.end()
+            continue
+
+        char = value[0]
+        if char in '+-' and token and SN_RE.match("".join(token)):
+            token.append(char)
+            pos += 1
+            continue
+        if token and char in Tokenizer.TOKEN_ENDERS:
+            items.append(_operand("".join(token)))
+            token = []
+        pos = m.end()
+
+        if kind == "op":
+            items.append((value, OP_IN, ""))
+        elif kind == "space":
+            items.append((char, WSPACE, ""))
+        elif kind == "string":
+            if token and token[-1][-1] != ':':
+                raise _Unsupported
+            items.append(_operand(value))
+        elif kind == "link":
+            if token and token[-1][-1] != ':':
+                raise _Unsupported
+            token.append(value)
+        elif char in '+-':
+            for prev in reversed(items):
+                if prev[1] != WSPACE:
+                    break
+            else:
+                prev = None
+            if prev is not None and (prev[2] == Token.CLOSE or prev[1] in (Token.OP_POST, OPERAND)):
+                items.append((char, OP_IN, ""))
+            else:
+                items.append((char, OP_PRE, ""))
+        elif char == '(':
+            if token:
+                opener = ("".join(token) + '(', Token.FUNC, Token.OPEN)
+                token = []
+            else:
+                opener = ('(', Token.PAREN, Token.OPEN)
+            items.append(opener)
+            stack.append(opener)
+        elif char == '{':
+            if token:
+                raise _Unsupported
+            opener = ('{', Token.ARRAY, Token.OPEN)
+            items.append(opener)
+            stack.append(opener)
+        elif char in ')}':
+            if not stack:
+                raise _Unsupported
+            type_ = stack.pop()[1]
+            closer = '}' if type_ == Token.ARRAY else ')'
+            if closer != char:
+                raise _Unsupported
+            items.append((closer, type_, Token.CLOSE))
+        elif char == ',':
+            if not stack or stack[-1][1] == Token.PAREN:
+                items.append((',', OP_IN, ""))
+            else:
+                items.append((',', Token.SEP, Token.ARG))
+        elif char == ';':
+            items.append((';', Token.SEP, Token.ROW))
+        elif char == '%':
+            items.append(('%', Token.OP_POST, ""))
+        elif char == '#':
+            if token and token[-1][-1] != '!':
+                raise _Unsupported
+            for err in Tokenizer.ERROR_CODES:
+                if formula.startswith(err, pos - 1):
+                    items.append(_operand("".join(token) + err))
+                    token = []
+                    pos += len(err) - 1
+                    break
+            else:
+                raise _Unsupported
+        elif char == '[':
+            depth = 0
+            for bracket in _BRACKET_RE.finditer(formula, pos - 1):
+                depth += 1 if bracket.group() == '[' else -1
+                if depth == 0:
+                    token.append(formula[pos-1:bracket.end()])
+                    pos = bracket.end()
+                    break
+            else:
+                raise _Unsupported
+        else:
+            raise _Unsupported # unterminated string
+
+    if token:
+        items.append(_operand("".join(token)))
+    return tuple(items)
+
+
+@lru_cache(maxsize=4096)
+def _tokenize(formula):
+    """
+    Tokens of a formula as (value, type, subtype)
+
+    Formulae are often tokenized repeatedly, for example when translating
+    shared formulae, so the most recent results are kept.
+    """
+    try:
+        return _scan(formula)
+    except _Unsupported:
+        pass
+    tokenizer = Tokenizer("")
+    tokenizer.formula = formula
+    tokenizer._scan()
+    return tuple((token.value, token.type, token.subtype) for token in tokenizer.items)
@@ -15,6 +15,10 @@ from openpyxl.utils import (
     get_column_letter
 )
 
+_ROW = "row"
+_COLUMN = "column"
+
+
 class TranslatorError(Exception):
     """
     Raised when a formula can't be translated across cells.
@@ -48,6 +52,7 @@ class Translator(object):
         # formulae stored in the workbook must be in A1 notation.
         self.row, self.col = coordinate_to_tuple(origin)
         self.tokenizer = Tokenizer(formula)
+        self._template = None
 
     def get_tokens(self):
         "Returns a list with the tokens comprising the formula."
@@ -133,20 +138,94 @@ class Translator(object):
         return (ws_part + cls.translate_col(match.group(1), cdelta)
                 + cls.translate_row(match.group(2), rdelta))
 
-    def translate_formula(self, dest=None, row_delta=0, col_delta=0):
+    @classmethod
+    def _compile_range(cls, range_str):
         """
-        Convert the formula into A1 notation, or as row and column coordinates
+        Split a range reference into literal text and the relative rows and
+        columns which change when it is translated, in the same way as
+        `translate_range`.
+        """
+        ws_part, range_str = cls.strip_ws_name(range_str)
+        parts = [ws_part]
+        match = cls.ROW_RANGE_RE.match(range_str)
+        if match is not None:
+            parts.extend(cls._compile_row(match.group(1)))
+            parts.append(":")
+            parts.extend(cls._compile_row(match.group(2)))
+            return parts
+        match = cls.COL_RANGE_RE.match(range_str)
+        if match is not None:
+            parts.extend(cls._compile_col(match.group(1)))
+            parts.append(":")
+            parts.extend(cls._compile_col(match.group(2)))
+            return parts
+        if ':' in range_str:
+            for idx, piece in enumerate(range_str.split(':')):
+                if idx:
+                    parts.append(":")
+                parts.extend(cls._compile_range(piece))
+            return parts
+        match = cls.CELL_REF_RE.match(range_str)
+        if match is None:
+            return [range_str]
+        parts.extend(cls._compile_col(match.group(1)))
+        parts.extend(cls._compile_row(match.group(2)))
+        return parts
 
-        The formula is converted into A1 assuming it is assigned to the cell
-        whose address is `dest` (no worksheet name).
+    @staticmethod
+    def _compile_row(row_str):
+        if row_str.startswith('$'):
+            return [row_str]
+        return [(_ROW, int(row_str))]
 
+    @staticmethod
+    def _compile_col(col_str):
+        if col_str.startswith('$'):
+            return [col_str]
+        return [(_COLUMN, column_index_from_string(col_str))]
+
+    def _compile(self):
+        """
+        Template of the formula: literal strings and (axis, index) pairs for
+        relative references. Literal formulae are kept as a single string.
         """
         tokens = self.get_tokens()
         if not tokens:
             return ""
         elif tokens[0].type == Token.LITERAL:
             return tokens[0].value
-        out = ['=']
+        parts = ['=']
+        for token in tokens:
+            if (token.type == Token.OPERAND
+                and token.subtype == Token.RANGE):
+                parts.extend(self._compile_range(token.value))
+            else:
+                parts.append(token.value)
+
+        template = []
+        for part in parts:
+            if (template and isinstance(part, str)
+                and isinstance(template[-1], str)):
+                template[-1] += part
+            elif part:
+                template.append(part)
+        return template
+
+    def translate_formula(self, dest=None, row_delta=0, col_delta=0):
+        """
+        Convert the formula into A1 notation, or as row and column coordinates
+
+        The formula is converted into A1 assuming it is assigned to the cell
+        whose address is `dest` (no worksheet name).
+
+        """
+        # The formula is only tokenized and parsed once: translating it is
+        # then a matter of adding the offsets to the relative references.
+        template = self._template
+        if template is None:
+            template = self._template = self._compile()
+        if isinstance(template, str):
+            return template
         # per the spec:
         # A compliant producer or consumer considers a defined name in the
         # range A1-XFD1048576 to be an error. All other names outside this
@@ -156,11 +235,18 @@ class Translator(object):
             row, col = coordinate_to_tuple(dest)
             row_delta = row - self.row
             col_delta = col - self.col
-        for token in tokens:
-            if (token.type == Token.OPERAND
-                and token.subtype == Token.RANGE):
-                out.append(self.translate_range(token.value, row_delta,
-                                                col_delta))
+        out = []
+        for part in template:
+            if part.__class__ is str:
+                out.append(part)
+            elif part[0] is _ROW:
+                new_row = part[1] + row_delta
+                if new_row <= 0:
+                    raise TranslatorError("Formula out of range")
+                out.append(str(new_row))
             else:
-                out.append(token.value)
+                try:
+                    out.append(get_column_letter(part[1] + col_delta))
+                except ValueError:
+                    raise TranslatorError("Formula out of range")
         return "".join(out)
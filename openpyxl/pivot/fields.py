@@ -15,6 +15,7 @@ from openpyxl.descriptors.excel import HexBinary
 class Index(Serialisable):
 
     tagname = "x"
+    __slots__ = ()
 
     v = Integer(allow_none=True)
 
@@ -27,6 +28,7 @@ class Index(Serialisable):
 class Tuple(Serialisable):
 
     tagname = "tpl"
+    __slots__ = ()
 
     fld = Integer(allow_none=True)
     hier = Integer(allow_none=True)
@@ -45,6 +47,7 @@ class Tuple(Serialisable):
 class TupleList(Serialisable):
 
     tagname = "tpls"
+    __slots__ = ()
 
     c = Integer(allow_none=True)
     tpl = Typed(expected_type=Tuple, )
@@ -62,6 +65,7 @@ class TupleList(Serialisable):
 class Missing(Serialisable):
 
     tagname = "m"
+    __slots__ = ()
 
     tpls = Sequence(expected_type=TupleList)
     x = Sequence(expected_type=Index)
@@ -112,6 +116,7 @@ class Missing(Serialisable):
 class Number(Serialisable):
 
     tagname = "n"
+    __slots__ = ()
 
     tpls = Sequence(expected_type=TupleList)
     x = Sequence(expected_type=Index)
@@ -165,6 +170,7 @@ class Number(Serialisable):
 class Error(Serialisable):
 
     tagname = "e"
+    __slots__ = ()
 
     tpls = Typed(expected_type=TupleList, allow_none=True)
     x = Sequence(expected_type=Index)
@@ -218,6 +224,7 @@ class Error(Serialisable):
 class Boolean(Serialisable):
 
     tagname = "b"
+    __slots__ = ()
 
     x = Sequence(expected_type=Index)
     v = Bool()
@@ -247,6 +254,7 @@ class Boolean(Serialisable):
 class Text(Serialisable):
 
     tagname = "s"
+    __slots__ = ()
 
     tpls = Sequence(expected_type=TupleList)
     x = Sequence(expected_type=Index)
@@ -300,6 +308,7 @@ class Text(Serialisable):
 class DateTimeField(Serialisable):
 
     tagname = "d"
+    __slots__ = ()
 
     x = Sequence(expected_type=Index)
     v = DateTime()
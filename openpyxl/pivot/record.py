@@ -34,6 +34,7 @@ from .fields import (
 class Record(Serialisable):
 
     tagname = "r"
+    __slots__ = ()
 
     _fields = MultiSequence()
     m = MultiSequencePart(expected_type=Missing, store="_fields")
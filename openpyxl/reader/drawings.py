@@ -6,7 +6,7 @@ from warnings import warn
 from openpyxl.xml.functions import fromstring
 from openpyxl.packaging.relationship import get_rel, get_rels_path, get_dependents
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
-from openpyxl.drawing.image import PILImage, ImageGroup
+from openpyxl.drawing.image import _pil_image, ImageGroup
 from openpyxl.chart.chartspace import ChartSpace
 from openpyxl.chart.reader import read_chart
 
@@ -57,7 +57,7 @@ def find_images(archive, path):
             chart.hidden = True
         charts.append(chart)
 
-    if not PILImage: # Pillow not installed, drop images
+    if not _pil_image(): # Pillow not installed, drop images
         return charts, images, shapes
 
     for blip in drawing._blip_rels:
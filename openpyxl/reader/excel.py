@@ -8,12 +8,11 @@ from zipfile import (
     ZipFile,
 
 )
+from contextlib import nullcontext
 from io import BytesIO
 import os.path
 import warnings
 
-from openpyxl.pivot.table import TableDefinition
-
 # Allow blanket setting of KEEP_VBA for testing
 try:
     from ..tests import KEEP_VBA
@@ -21,6 +20,7 @@ except ImportError:
     KEEP_VBA = False
 
 # package imports
+from openpyxl.descriptors.base import trusted
 from openpyxl.utils.exceptions import InvalidFileException
 from openpyxl.xml.constants import (
     ARC_CORE,
@@ -55,22 +55,12 @@ from openpyxl.packaging.relationship import (
 
 from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 from openpyxl.worksheet._reader import WorksheetReader
-from openpyxl.chartsheet import Chartsheet
 from openpyxl.worksheet.table import Table
-from openpyxl.worksheet.controls import (
-    FormControl,
-    ActiveXControl
-)
-from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
 from openpyxl.drawing.legacy import LegacyDrawing
 from openpyxl.drawing.image import Image
 
-from openpyxl.volatile.volatile_deps import VolTypesList
-from openpyxl.connection.connections import Connections
 from openpyxl.xml.functions import fromstring
 
-from .drawings import find_images
-
 
 SUPPORTED_FORMATS = ('.xlsx', '.xlsm', '.xltx', '.xltm')
 
@@ -131,7 +121,8 @@ class ExcelReader:
     """
 
     def __init__(self, fn, read_only=False, keep_vba=KEEP_VBA,
-                 data_only=False, keep_links=True, rich_text=False):
+                 data_only=False, keep_links=True, rich_text=False,
+                 validate=True, cached_values=False):
         self.archive = _validate_archive(fn)
         self.valid_files = self.archive.namelist()
         self.read_only = read_only
@@ -139,6 +130,8 @@ class ExcelReader:
         self.data_only = data_only
         self.keep_links = keep_links
         self.rich_text = rich_text
+        self.validate = validate
+        self.cached_values = cached_values
         self.shared_strings = []
         self.volatile_deps = None
 
@@ -167,6 +160,7 @@ class ExcelReader:
         wb = self.parser.wb
         wb._sheets = []
         wb._data_only = self.data_only
+        wb._cached_values = self.cached_values and not self.data_only
         wb._read_only = self.read_only
         wb.template = wb_part.ContentType in (XLTX, XLTM)
 
@@ -207,6 +201,9 @@ class ExcelReader:
         with self.archive.open(sheet_path, "r") as src:
             xml = src.read()
         node = fromstring(xml)
+        from openpyxl.chartsheet import Chartsheet
+        from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+        from .drawings import find_images
         cs = Chartsheet.from_tree(node)
         cs._parent = self.wb
         cs.title = sheet.name
@@ -242,7 +239,8 @@ class ExcelReader:
             processor.find_children((rel.target))
             ws._rels = processor.rels
 
-            ws_parser = WorksheetReader(ws, fh, self.shared_strings, self.data_only, self.rich_text)
+            ws_parser = WorksheetReader(ws, fh, self.shared_strings, self.data_only,
+                                        self.rich_text, self.cached_values)
             ws_parser.bind_all()
             ws.sheet_state = sheet.state
 
@@ -264,6 +262,7 @@ class ExcelReader:
         if ARC_VOLATILE_DEPENDENCIES in self.valid_files:
             src = self.archive.read(ARC_VOLATILE_DEPENDENCIES)
             root = fromstring(src)
+            from openpyxl.volatile.volatile_deps import VolTypesList
             self.wb._volatile_deps = VolTypesList.from_tree(root)
 
 
@@ -271,35 +270,38 @@ class ExcelReader:
         if ARC_CONNECTIONS in self.valid_files:
             src = self.archive.read(ARC_CONNECTIONS)
             root = fromstring(src)
+            from openpyxl.connection.connections import Connections
             self.wb._connections = Connections.from_tree(root)
 
 
     def read(self):
         action = "read manifest"
+        context = nullcontext() if self.validate else trusted()
         try:
-            self.read_manifest()
-            action = "read strings"
-            self.read_strings()
-            action = "read workbook"
-            self.read_workbook()
-            action = "read properties"
-            self.read_properties()
-            action = "read custom properties"
-            self.read_custom()
-            action = "read theme"
-            self.read_theme()
-            action = "read stylesheet"
-            apply_stylesheet(self.archive, self.wb)
-            action = "read worksheets"
-            self.read_worksheets()
-            action = "assign names"
-            self.parser.assign_names()
-            action = "read volatile deps"
-            self.read_volatile_deps()
-            action = "read connections"
-            self.read_connections()
-            if not self.read_only:
-                self.archive.close()
+            with context:
+                self.read_manifest()
+                action = "read strings"
+                self.read_strings()
+                action = "read workbook"
+                self.read_workbook()
+                action = "read properties"
+                self.read_properties()
+                action = "read custom properties"
+                self.read_custom()
+                action = "read theme"
+                self.read_theme()
+                action = "read stylesheet"
+                apply_stylesheet(self.archive, self.wb)
+                action = "read worksheets"
+                self.read_worksheets()
+                action = "assign names"
+                self.parser.assign_names()
+                action = "read volatile deps"
+                self.read_volatile_deps()
+                action = "read connections"
+                self.read_connections()
+                if not self.read_only:
+                    self.archive.close()
         except ValueError as e:
             raise ValueError(
                 f"Unable to read workbook: could not {action} from {self.archive.filename}.\n"
@@ -389,6 +391,10 @@ class WorksheetProcessor:
 
 
     def get_drawings(self):
+        if not self.rels.drawing:
+            return
+
+        from .drawings import find_images
         for rel in self.rels.drawing:
             charts, images, shapes = find_images(self.archive, rel.target)
             for c in charts:
@@ -400,6 +406,10 @@ class WorksheetProcessor:
 
 
     def get_pivots(self, pivot_caches):
+        if not self.rels.pivotTable:
+            return
+
+        from openpyxl.pivot.table import TableDefinition
         for rel in self.rels.pivotTable:
             pivot_path = rel.Target
             src = self.archive.read(pivot_path)
@@ -413,6 +423,10 @@ class WorksheetProcessor:
         """
         Get related objects for ctrlProps
         """
+        if not self.ws._controls:
+            return
+
+        from openpyxl.worksheet.controls import FormControl
         ctrlProps = {}
 
         for rel in self.rels.ctrlProp:
@@ -434,6 +448,10 @@ class WorksheetProcessor:
         """
         Get related objects for ActiveX Controls
         """
+        if not self.ws._controls:
+            return
+
+        from openpyxl.worksheet.controls import ActiveXControl
         active = {}
 
         for rel in self.rels.control:
@@ -463,7 +481,8 @@ class WorksheetProcessor:
 
 
 def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
-                  data_only=False, keep_links=False, rich_text=False):
+                  data_only=False, keep_links=False, rich_text=False, validate=True,
+                  cached_values=False):
     """Open the given filename and return the workbook
 
     :param filename: the path to open or a file-like object
@@ -484,6 +503,12 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
     :param rich_text: if set to True openpyxl will preserve any rich text formatting in cells. The default is False
     :type rich_text: bool
 
+    :param validate: if set to False values read from the file are converted but not validated, which makes loading faster. Only use this for files from trusted sources. The default is True
+    :type validate: bool
+
+    :param cached_values: if set to True cells with formulae also keep the value stored the last time Excel calculated them as ``cached_value``. The default is False
+    :type cached_values: bool
+
     :rtype: :class:`openpyxl.workbook.Workbook`
 
     .. note::
@@ -493,6 +518,6 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
 
     """
     reader = ExcelReader(filename, read_only, keep_vba,
-                         data_only, keep_links, rich_text)
+                         data_only, keep_links, rich_text, validate, cached_values)
     reader.read()
     return reader.wb
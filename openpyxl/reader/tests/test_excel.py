@@ -106,6 +106,18 @@ def test_style_assignment(datadir, load_workbook):
     assert len(wb._protections) == 1
 
 
+def test_load_without_validation(datadir, load_workbook):
+    datadir.chdir()
+
+    wb = load_workbook("complex-styles.xlsx", validate=False)
+    assert len(wb._fonts) == 8
+    assert len(wb._borders) == 11
+    # values are validated again after loading
+    font = wb._fonts[0]
+    with pytest.raises(TypeError):
+        font.sz = "large"
+
+
 @pytest.mark.parametrize("ro", [False, True])
 def test_close_read(datadir, load_workbook, ro):
     datadir.chdir()
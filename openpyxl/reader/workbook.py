@@ -13,8 +13,6 @@ from openpyxl.packaging.workbook import WorkbookPackage
 from openpyxl.workbook import Workbook
 from openpyxl.workbook.defined_name import DefinedNameList
 from openpyxl.workbook.external_link.external import read_external_link
-from openpyxl.pivot.cache import CacheDefinition
-from openpyxl.pivot.record import RecordList
 from openpyxl.worksheet.print_settings import PrintTitles, PrintArea
 
 from openpyxl.utils.datetime import CALENDAR_MAC_1904
@@ -124,6 +122,11 @@ class WorkbookParser:
         Get PivotCache objects
         """
         d = {}
+        if not self.caches:
+            return d
+
+        from openpyxl.pivot.cache import CacheDefinition
+        from openpyxl.pivot.record import RecordList
         for c in self.caches:
             cache = get_rel(self.archive, self.rels, id=c.id, cls=CacheDefinition)
             if cache.deps:
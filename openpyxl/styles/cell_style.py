@@ -12,6 +12,7 @@ from openpyxl.descriptors import (
 )
 from openpyxl.descriptors.excel import ExtensionList
 from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.xml.functions import localname
 
 
 from .alignment import Alignment
@@ -123,6 +124,27 @@ class CellStyle(Serialisable):
         self.protection = protection
 
 
+    _xf_attrs = frozenset(["numFmtId", "fontId", "fillId", "borderId", "xfId",
+                           "quotePrefix", "pivotButton", "applyNumberFormat",
+                           "applyFont", "applyFill", "applyBorder",
+                           "applyAlignment", "applyProtection"])
+
+    @classmethod
+    def from_tree(cls, node):
+        """
+        Specialised parser: stylesheets can contain thousands of xf elements
+        and the generic machinery is comparatively slow
+        """
+        attrib = {k:v for k, v in node.attrib.items() if k in cls._xf_attrs}
+        for el in node:
+            tag = localname(el)
+            if tag == "alignment":
+                attrib["alignment"] = Alignment.from_tree(el)
+            elif tag == "protection":
+                attrib["protection"] = Protection.from_tree(el)
+        return cls(**attrib)
+
+
     def to_array(self):
         """
         Convert to StyleArray
@@ -185,6 +207,12 @@ class CellStyleList(Serialisable):
         return self.xf[idx]
 
 
+    @classmethod
+    def from_tree(cls, node):
+        xf = [CellStyle.from_tree(el) for el in node if localname(el) == "xf"]
+        return cls(xf=xf)
+
+
     def _to_array(self):
         """
         Extract protection and alignments, convert to style array
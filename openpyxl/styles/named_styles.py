@@ -11,6 +11,7 @@ from openpyxl.descriptors import (
 )
 from openpyxl.descriptors.excel import ExtensionList
 from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.utils.indexed_list import shard_lock
 
 from .fills import PatternFill, Fill
 from .fonts import Font
@@ -189,10 +190,11 @@ class NamedStyleList(list):
     def append(self, style):
         if not isinstance(style, NamedStyle):
             raise TypeError("""Only NamedStyle instances can be added""")
-        elif style.name in self.names:
-            raise ValueError("""Style {0} exists already""".format(style.name))
-        style._set_index(len(self))
-        super(NamedStyleList, self).append(style)
+        with shard_lock(self):
+            if style.name in self.names:
+                raise ValueError("""Style {0} exists already""".format(style.name))
+            style._set_index(len(self))
+            super(NamedStyleList, self).append(style)
 
 
 class _NamedCellStyle(Serialisable):
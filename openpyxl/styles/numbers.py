@@ -1,5 +1,6 @@
 # Copyright (c) 2010-2024 openpyxl
 
+from functools import lru_cache
 import re
 
 from openpyxl.descriptors import (
@@ -8,6 +9,7 @@ from openpyxl.descriptors import (
     Integer,
 )
 from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.xml.functions import localname
 
 
 BUILTIN_FORMATS = {
@@ -93,29 +95,41 @@ FORMAT_CURRENCY_EUR_SIMPLE = '[$EUR ]#,##0.00_-'
 
 COLORS = r"\[(BLACK|BLUE|CYAN|GREEN|MAGENTA|RED|WHITE|YELLOW)\]"
 LITERAL_GROUP = r'".*?"' # anything in quotes
-LOCALE_GROUP = r'\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]' # anything in square brackets, except hours or minutes or seconds
+LOCALE_GROUP = r'\[(?!(?i:hh?|mm?|ss?)\])[^\]]*\]' # anything in square brackets, except hours or minutes or seconds
 STRIP_RE = re.compile(f"{LITERAL_GROUP}|{LOCALE_GROUP}")
+ESCAPED_RE = re.compile(r"\\.") # characters escaped with a backslash
 TIMEDELTA_RE = re.compile(r'\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?', re.I)
 
 
+DATE_RE = re.compile(r"(?<![_\\])[dmhysDMHYS]")
+DATE_TYPES = frozenset(["date", "time", "datetime", "timedelta"])
+
+
 # Spec 18.8.31 numFmts
 # +ve;-ve;zero;text
 
+# Classification is a pure function of the format code and workbooks only
+# ever use a handful of codes so the results are cached
+
+@lru_cache(maxsize=None)
 def is_date_format(fmt):
     if fmt is None:
         return False
     fmt = fmt.split(";")[0] # only look at the first format
     fmt = STRIP_RE.sub("", fmt) # ignore some formats
-    return re.search(r"(?<![_\\])[dmhysDMHYS]", fmt) is not None
+    return DATE_RE.search(fmt) is not None
 
 
+@lru_cache(maxsize=None)
 def is_timedelta_format(fmt):
     if fmt is None:
         return False
     fmt = fmt.split(";")[0] # only look at the first format
+    fmt = ESCAPED_RE.sub("", STRIP_RE.sub("", fmt)) # ignore literals
     return TIMEDELTA_RE.search(fmt) is not None
 
 
+@lru_cache(maxsize=None)
 def is_datetime(fmt):
     """
     Return date, time or datetime
@@ -137,6 +151,22 @@ def is_datetime(fmt):
     return "time"
 
 
+@lru_cache(maxsize=None)
+def number_format_type(fmt):
+    """
+    Classify a format as one of "timedelta", "datetime", "date", "time",
+    "text" or "numeric"
+    """
+    if is_timedelta_format(fmt):
+        return "timedelta"
+    typ = is_datetime(fmt)
+    if typ is not None:
+        return typ
+    if fmt is not None and fmt.split(";")[0] == FORMAT_TEXT:
+        return "text"
+    return "numeric"
+
+
 def is_builtin(fmt):
     return fmt in BUILTIN_FORMATS.values()
 
@@ -198,3 +228,13 @@ class NumberFormatList(Serialisable):
 
     def __getitem__(self, idx):
         return self.numFmt[idx]
+
+
+    @classmethod
+    def from_tree(cls, node):
+        """
+        Specialised parser that avoids the generic machinery
+        """
+        fmts = [NumberFormat(el.get("numFmtId"), el.get("formatCode"))
+                for el in node if localname(el) == "numFmt"]
+        return cls(numFmt=fmts)
@@ -12,6 +12,7 @@ from .proxy import StyleProxy
 from .cell_style import StyleArray
 from .named_styles import NamedStyle
 from .builtins import styles
+from openpyxl.utils.indexed_list import shard_lock
 
 
 class StyleDescriptor(object):
@@ -72,19 +73,21 @@ class NamedStyleDescriptor(object):
         if not getattr(instance, "_style"):
             instance._style = StyleArray()
         coll = getattr(instance.parent.parent, self.collection)
-        if isinstance(value, NamedStyle):
-            style = value
-            if style not in coll:
-                instance.parent.parent.add_named_style(style)
-        elif value not in coll.names:
-            if value in styles: # is it builtin?
-                style = styles[value]
+        # check and add atomically in case several threads use a new style
+        with shard_lock(coll):
+            if isinstance(value, NamedStyle):
+                style = value
                 if style not in coll:
                     instance.parent.parent.add_named_style(style)
+            elif value not in coll.names:
+                if value in styles: # is it builtin?
+                    style = styles[value]
+                    if style not in coll:
+                        instance.parent.parent.add_named_style(style)
+                else:
+                    raise ValueError("{0} is not a known style".format(value))
             else:
-                raise ValueError("{0} is not a known style".format(value))
-        else:
-            style = coll[value]
+                style = coll[value]
         instance._style = copy(style.as_tuple())
 
 
@@ -24,8 +24,8 @@ from .numbers import (
     BUILTIN_FORMATS,
     BUILTIN_FORMATS_MAX_SIZE,
     BUILTIN_FORMATS_REVERSE,
-    is_date_format,
-    is_timedelta_format,
+    DATE_TYPES,
+    number_format_type,
     builtin_format_code
 )
 from .named_styles import (
@@ -160,6 +160,7 @@ class Stylesheet(Serialisable):
         timedelta_formats = set()
         custom = self.custom_formats
         formats = self.number_formats
+        types = {} # many styles share a format so only classify each once
         for idx, style in enumerate(self.cell_styles):
             if style.numFmtId in custom:
                 fmt = custom[style.numFmtId]
@@ -169,10 +170,13 @@ class Stylesheet(Serialisable):
                     style.numFmtId = formats.add(fmt) + BUILTIN_FORMATS_MAX_SIZE
             else:
                 fmt = builtin_format_code(style.numFmtId)
-            if is_date_format(fmt):
+            typ = types.get(style.numFmtId)
+            if typ is None:
+                typ = types[style.numFmtId] = number_format_type(fmt)
+            if typ in DATE_TYPES:
                 # Create an index of which styles refer to datetimes
                 date_formats.add(idx)
-            if is_timedelta_format(fmt):
+            if typ == "timedelta":
                 # Create an index of which styles refer to timedeltas
                 timedelta_formats.add(idx)
         self.date_formats = date_formats
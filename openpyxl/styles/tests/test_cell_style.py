@@ -70,6 +70,25 @@ class TestCellStyle:
         )
 
 
+    def test_from_xml_protection(self, CellStyle):
+        from ..protection import Protection
+        src = """
+        <xf xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+          xmlns:x14ac="http://schemas.microsoft.com/office/spreadsheetml/2009/9/ac"
+          numFmtId="14" fontId="1" fillId="0" borderId="0" x14ac:unknown="1"
+          applyProtection="1">
+          <protection locked="0"/>
+        </xf>
+        """
+        node = fromstring(src)
+        cell_style = CellStyle.from_tree(node)
+        assert cell_style == CellStyle(
+            numFmtId=14,
+            fontId=1,
+            protection=Protection(locked=False),
+        )
+
+
     def test_to_array(self, CellStyle):
         from ..cell_style import StyleArray
         xf = CellStyle(
@@ -123,6 +123,11 @@ def test_is_date_format(format, result):
                              (r'[h]:mm;[=0]\-', True),
                              ('[>=100][Magenta].00', False),
                              ('[>=100][Magenta]General', False),
+                             ('"[h]"0', False),
+                             (r'\[h\]0', False),
+                             ('[H]:mm:ss', True),
+                             ('[HH]:MM', True),
+                             ('[MM]:SS', True),
                          ]
                          )
 def test_is_timedelta_format(format, result):
@@ -160,3 +165,24 @@ def test_is_timedelta_format(format, result):
 def test_datetime(fmt, typ):
     from ..numbers import is_datetime
     assert is_datetime(fmt) == typ
+
+
+@pytest.mark.parametrize("fmt, typ",
+                         [
+                             (None, "numeric"),
+                             ("General", "numeric"),
+                             ("0.00%", "numeric"),
+                             ('"Day" 0', "numeric"),
+                             ("@", "text"),
+                             (FORMAT_DATE_XLSX14, "date"),
+                             (FORMAT_DATE_TIME4, "time"),
+                             (FORMAT_DATE_DATETIME, "datetime"),
+                             (FORMAT_DATE_TIMEDELTA, "timedelta"),
+                             ("[mm]:ss", "timedelta"),
+                             ('"[h]"0', "numeric"),
+                             ("[H]:mm:ss", "timedelta"),
+                         ]
+                         )
+def test_number_format_type(fmt, typ):
+    from ..numbers import number_format_type
+    assert number_format_type(fmt) == typ
@@ -0,0 +1,47 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""Keep optional parts of the library out of the import of openpyxl"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import openpyxl
+
+
+def test_lazy_modules():
+    code = """
+import sys
+import openpyxl
+prefixes = ("numpy", "PIL", "openpyxl.chart.", "openpyxl.chartsheet",
+            "openpyxl.pivot", "openpyxl.worksheet.controls")
+print(sorted(m for m in sys.modules if m.startswith(prefixes)))
+"""
+    root = os.path.dirname(os.path.dirname(openpyxl.__file__))
+    out = subprocess.check_output([sys.executable, "-c", code], cwd=root, text=True)
+    assert out.strip() == "[]"
+
+
+def test_chart_access():
+    from openpyxl import chart
+    from openpyxl.chart.bar_chart import BarChart
+    from openpyxl.chart.series_factory import SeriesFactory
+    assert chart.BarChart is BarChart
+    assert chart.Series is SeriesFactory
+    assert "LineChart" in dir(chart)
+
+
+def test_chart_missing(monkeypatch):
+    from openpyxl import chart
+
+    with pytest.raises(AttributeError):
+        chart.no_such_module
+
+    def broken(name, package=None):
+        raise ModuleNotFoundError("No module named 'missing'", name="missing")
+
+    monkeypatch.setattr(chart, "import_module", broken)
+    with pytest.raises(ModuleNotFoundError):
+        chart.broken_module
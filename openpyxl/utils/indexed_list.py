@@ -1,5 +1,18 @@
 # Copyright (c) 2010-2024 openpyxl
 
+from threading import RLock
+
+# Locks are shared between instances rather than stored on them so that lists
+# can still be copied and pickled
+_LOCKS = tuple(RLock() for _ in range(32))
+
+
+def shard_lock(obj):
+    """
+    Return the lock guarding changes to `obj`
+    """
+    return _LOCKS[(id(obj) >> 4) % len(_LOCKS)]
+
 
 class IndexedList(list):
     """
@@ -7,6 +20,9 @@ class IndexedList(list):
     Based on Alex Martelli's recipe
 
     http://code.activestate.com/recipes/52303-the-auxiliary-dictionary-idiom-for-sequences-with-/
+
+    Adding values is thread-safe. Values which are already known are looked
+    up without locking.
     """
 
     _dict = {}
@@ -21,13 +37,15 @@ class IndexedList(list):
                 list.append(self, val)
 
     def _rebuild_dict(self):
-        self._dict = {}
-        idx = 0
-        for value in self:
-            if value not in self._dict:
-                self._dict[value] = idx
-                idx += 1
-        self.clean = True
+        with shard_lock(self):
+            lookup = {}
+            idx = 0
+            for value in self:
+                if value not in lookup:
+                    lookup[value] = idx
+                    idx += 1
+            self._dict = lookup
+            self.clean = True
 
     def __contains__(self, value):
         if not self.clean:
@@ -41,9 +59,16 @@ class IndexedList(list):
 
     def append(self, value):
         if value not in self._dict:
-            self._dict[value] = len(self)
-            list.append(self, value)
+            with shard_lock(self):
+                if value not in self._dict:
+                    # the value must be in the list before it can be found
+                    idx = len(self)
+                    list.append(self, value)
+                    self._dict[value] = idx
 
     def add(self, value):
-        self.append(value)
-        return self._dict[value]
+        try:
+            return self._dict[value]
+        except KeyError:
+            self.append(value)
+            return self._dict[value]
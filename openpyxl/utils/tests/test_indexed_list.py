@@ -52,3 +52,22 @@ def test_table_builder(list):
             sb.append(letter)
         assert sb.index(letter) == result[letter]
     assert sb == ['a', 'b', 'c', 'd']
+
+
+def test_add_from_threads(list):
+    from concurrent.futures import ThreadPoolExecutor
+
+    sb = list()
+    values = [str(i) for i in range(200)]
+
+    def add_all(offset):
+        return [(v, sb.add(v)) for v in values[offset:] + values[:offset]]
+
+    with ThreadPoolExecutor(8) as pool:
+        results = [r for r in pool.map(add_all, range(0, 200, 25))]
+
+    assert sorted(sb) == sorted(values)
+    for added in results:
+        for v, idx in added:
+            assert sb[idx] == v
+
@@ -61,6 +61,32 @@ class TestWorkbook:
         assert wb2._named_styles['Normal'].font.color.index == 1
 
 
+    def test_populate_from_threads(self, Workbook):
+        from concurrent.futures import ThreadPoolExecutor
+        from openpyxl.styles import Font
+
+        wb = Workbook()
+        sheets = [wb.create_sheet() for i in range(8)]
+
+        def populate(ws):
+            for row in range(1, 51):
+                c = ws.cell(row=row, column=1, value=row)
+                c.font = Font(sz=row)
+                c.number_format = f"0.{'0' * (row % 5)}"
+                c.style = "Good"
+
+        with ThreadPoolExecutor(8) as pool:
+            for _ in pool.map(populate, sheets):
+                pass
+
+        assert len(wb._fonts) == len(set(wb._fonts))
+        assert wb.named_styles.count("Good") == 1
+        for ws in sheets:
+            for row in range(1, 51):
+                c = ws.cell(row=row, column=1)
+                assert c.style == "Good"
+
+
     def test_duplicate_table_name(self, Workbook, Table):
         wb = Workbook()
         ws = wb.create_sheet()
@@ -14,7 +14,6 @@ from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.utils.datetime  import WINDOWS_EPOCH, MAC_EPOCH
 from openpyxl.utils.exceptions import ReadOnlyWorkbookException
 
-from openpyxl.writer.excel import save_workbook
 
 from openpyxl.styles.cell_style import StyleArray
 from openpyxl.styles.named_styles import NamedStyle
@@ -28,7 +27,6 @@ from openpyxl.styles.colors import COLOR_INDEX
 from openpyxl.styles.named_styles import NamedStyleList
 from openpyxl.styles.table import TableStyleList
 
-from openpyxl.chartsheet import Chartsheet
 from .defined_name import DefinedName, DefinedNameDict
 from openpyxl.packaging.core import DocumentProperties
 from openpyxl.packaging.custom import CustomPropertyList
@@ -53,6 +51,7 @@ class Workbook(object):
 
     _read_only = False
     _data_only = False
+    _cached_values = False
     template = False
     path = "/xl/workbook.xml"
 
@@ -81,6 +80,7 @@ class Workbook(object):
         self.epoch = WINDOWS_EPOCH
         self.encoding = "utf-8"
         self.iso_dates = iso_dates
+        self.share_formulae = False
 
         if not self.write_only:
             self._sheets.append(Worksheet(self))
@@ -90,6 +90,8 @@ class Workbook(object):
         self.views = [BookView()]
         self._volatile_deps = None
         self._connections = None
+        self._references = None
+        self._evaluator = None
 
 
     def _setup_styles(self):
@@ -208,8 +210,10 @@ class Workbook(object):
     def _add_sheet(self, sheet, index=None):
         """Add an worksheet (at an optional index)."""
 
-        if not isinstance(sheet, (Worksheet, WriteOnlyWorksheet, Chartsheet)):
-            raise TypeError("Cannot be added to a workbook")
+        if not isinstance(sheet, (Worksheet, WriteOnlyWorksheet)):
+            from openpyxl.chartsheet import Chartsheet
+            if not isinstance(sheet, Chartsheet):
+                raise TypeError("Cannot be added to a workbook")
 
         if sheet.parent != self:
             raise ValueError("You cannot add worksheets from another workbook.")
@@ -236,6 +240,8 @@ class Workbook(object):
         """Remove `worksheet` from this workbook."""
         idx = self._sheets.index(worksheet)
         self._sheets.remove(worksheet)
+        if self._references is not None and self._references.tracks_cells:
+            self._references.rebuild()
 
 
     @deprecated("Use wb.remove(worksheet) or del wb[sheetname]")
@@ -247,6 +253,7 @@ class Workbook(object):
     def create_chartsheet(self, title=None, index=None):
         if self.read_only:
             raise ReadOnlyWorkbookException("Cannot create new sheet in a read-only workbook")
+        from openpyxl.chartsheet import Chartsheet
         cs = Chartsheet(parent=self, title=title)
 
         self._add_sheet(cs, index)
@@ -315,6 +322,7 @@ class Workbook(object):
 
         :type: list of :class:`openpyxl.chartsheet.chartsheet.Chartsheet`
         """
+        from openpyxl.chartsheet import Chartsheet
         return [s for s in self._sheets if isinstance(s, Chartsheet)]
 
     @property
@@ -385,6 +393,7 @@ class Workbook(object):
             raise TypeError("""Workbook is read-only""")
         if self.write_only and not self.worksheets:
             self.create_sheet()
+        from openpyxl.writer.excel import save_workbook
         save_workbook(self, filename)
 
 
@@ -416,6 +425,22 @@ class Workbook(object):
         return to_worksheet
 
 
+    def build_reference_index(self):
+        """
+        Index the references between the formulae and cells of the workbook,
+        including those through defined names and to other worksheets, to
+        find the precedents and dependents of cells.
+        The index is kept up to date as cells are changed.
+
+        :rtype: :class:`openpyxl.formula.dependencies.DependencyIndex`
+        """
+        index = self._references
+        if index is None or not index.tracks_cells:
+            from openpyxl.formula.dependencies import DependencyIndex
+            index = self._references = DependencyIndex(self)
+        return index
+
+
     def close(self):
         """
         Close workbook file if open. Only affects read-only and write-only modes.
@@ -8,6 +8,7 @@ from openpyxl.cell.read_only import ReadOnlyCell, EMPTY_CELL
 from openpyxl.utils import get_column_letter
 
 from ._reader import WorkSheetParser
+from .formula import SharedFormula
 from openpyxl.workbook.defined_name import DefinedNameDict
 
 
@@ -57,10 +58,11 @@ class ReadOnlyWorksheet(object):
         return self.parent._archive.open(self._worksheet_path)
 
 
-    def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False):
+    def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False, sparse=False):
         """
         The source worksheet file may have columns or rows missing.
         Missing cells will be created.
+        Cells are not stored so iteration is always sparse.
         """
         filler = EMPTY_CELL
         if values_only:
@@ -80,7 +82,9 @@ class ReadOnlyWorksheet(object):
                                      data_only=self.parent.data_only,
                                      epoch=self.parent.epoch,
                                      date_formats=self.parent._date_formats,
-                                     timedelta_formats=self.parent._timedelta_formats)
+                                     timedelta_formats=self.parent._timedelta_formats,
+                                     expand_shared=False,
+                                     cached_values=self.parent._cached_values)
 
             for idx, row in parser.parse():
                 if max_row is not None and idx > max_row:
@@ -120,8 +124,12 @@ class ReadOnlyWorksheet(object):
             counter = cell['column']
             if min_col <= counter <= max_col:
                 idx = counter - min_col # position in list of cells returned
-                new_row[idx] = cell['value']
-                if not values_only:
+                if values_only:
+                    value = cell['value']
+                    if value.__class__ is SharedFormula:
+                        value = value.formula(cell['row'], counter)
+                    new_row[idx] = value
+                else:
                     new_row[idx] = ReadOnlyCell(self, **cell)
 
         return tuple(new_row)
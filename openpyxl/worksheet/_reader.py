@@ -21,7 +21,6 @@ from openpyxl.xml.constants import (
     EXT_TYPES,
 )
 from openpyxl.formatting.formatting import ConditionalFormatting
-from openpyxl.formula.translate import Translator
 from openpyxl.utils import (
     get_column_letter,
     coordinate_to_tuple,
@@ -30,8 +29,7 @@ from openpyxl.utils.datetime import from_excel, from_ISO8601, WINDOWS_EPOCH
 from openpyxl.descriptors.excel import ExtensionList
 from openpyxl.cell.rich_text import CellRichText
 
-from .controls import ControlList
-from .formula import DataTableFormula, ArrayFormula
+from .formula import DataTableFormula, ArrayFormula, SharedFormula
 from .filters import AutoFilter
 from .header_footer import HeaderFooter, HeaderFooterItem
 from .hyperlink import HyperlinkList
@@ -100,7 +98,8 @@ class WorkSheetParser(object):
 
     def __init__(self, src, shared_strings, data_only=False,
                  epoch=WINDOWS_EPOCH, date_formats=set(),
-                 timedelta_formats=set(), rich_text=False):
+                 timedelta_formats=set(), rich_text=False, expand_shared=True,
+                 cached_values=False):
         self.min_row = self.min_col = None
         self.epoch = epoch
         self.source = src
@@ -123,6 +122,8 @@ class WorkSheetParser(object):
         self.col_breaks = ColBreak()
         self.controls = None
         self.rich_text = rich_text
+        self.expand_shared = expand_shared
+        self.cached_values = cached_values
 
 
     def parse(self):
@@ -135,6 +136,7 @@ class WorkSheetParser(object):
             ROW_BREAK_TAG: self.parse_row_breaks,
             COL_BREAK_TAG: self.parse_col_breaks,
             CUSTOM_VIEWS_TAG: self.parse_custom_views,
+            CONTROLS_TAG: self.parse_controls,
                       }
 
         properties = {
@@ -151,7 +153,6 @@ class WorkSheetParser(object):
             TABLE_TAG: ('tables', TablePartList),
             HYPERLINK_TAG: ('hyperlinks', HyperlinkList),
             MERGE_TAG: ('merged_cells', MergeCells),
-            CONTROLS_TAG: ("controls", ControlList),
         }
 
         it = iterparse(self.source) # add a finaliser to close the source when this becomes possible
@@ -208,7 +209,11 @@ class WorkSheetParser(object):
             self.col_counter += 1
             row, column = self.row_counter, self.col_counter
 
-        if not self.data_only and element.find(FORMULA_TAG) is not None:
+        formula = None
+        if not self.data_only:
+            formula = element.find(FORMULA_TAG)
+
+        if formula is not None and not self.cached_values:
             data_type = 'f'
             value = self.parse_formula(element)
 
@@ -244,6 +249,10 @@ class WorkSheetParser(object):
                     else:
                         value = Text.from_tree(child).content
 
+        if formula is not None and self.cached_values:
+            return {'row':row, 'column':column, 'value':self.parse_formula(element),
+                    'data_type':'f', 'style_id':style_id, 'cached_value':value}
+
         return {'row':row, 'column':column, 'value':value, 'data_type':data_type, 'style_id':style_id}
 
 
@@ -264,10 +273,14 @@ class WorkSheetParser(object):
         elif formula_type == "shared":
             idx = formula.get('si')
             if idx in self.shared_formulae:
-                trans = self.shared_formulae[idx]
-                value = trans.translate_formula(coordinate)
+                value = self.shared_formulae[idx]
+                if self.expand_shared:
+                    value = value.formula(*coordinate_to_tuple(coordinate))
             elif value != "=":
-                self.shared_formulae[idx] = Translator(value, coordinate)
+                shared = SharedFormula(formula.get('ref'), value, coordinate)
+                self.shared_formulae[idx] = shared
+                if not self.expand_shared:
+                    value = shared
 
         elif formula_type == "dataTable":
             value = DataTableFormula(**formula.attrib)
@@ -354,16 +367,23 @@ class WorkSheetParser(object):
         self.col_breaks = ColBreak()
 
 
+    def parse_controls(self, element):
+        from .controls import ControlList
+        self.controls = ControlList.from_tree(element)
+
+
 class WorksheetReader(object):
     """
     Create a parser and apply it to a workbook
     """
 
-    def __init__(self, ws, xml_source, shared_strings, data_only, rich_text):
+    def __init__(self, ws, xml_source, shared_strings, data_only, rich_text,
+                 cached_values=False):
         self.ws = ws
         self.parser = WorkSheetParser(xml_source, shared_strings,
                 data_only, ws.parent.epoch, ws.parent._date_formats,
-                ws.parent._timedelta_formats, rich_text)
+                ws.parent._timedelta_formats, rich_text, expand_shared=False,
+                cached_values=cached_values)
         self.tables = []
 
 
@@ -374,6 +394,8 @@ class WorksheetReader(object):
                 c = Cell(self.ws, row=cell['row'], column=cell['column'], style_array=style)
                 c._value = cell['value']
                 c.data_type = cell['data_type']
+                if 'cached_value' in cell:
+                    c._cached_value = cell['cached_value']
                 self.ws._cells[(cell['row'], cell['column'])] = c
 
         if self.ws._cells:
@@ -432,9 +454,9 @@ class WorksheetReader(object):
         Returns the appropriate cell to which a hyperlink, which references a merged cell at the specified coordinates,
         should be bound.
         """
-        for rng in self.ws.merged_cells:
-            if coord in rng:
-                return self.ws.cell(*rng.top[0])
+        rng = self.ws.merged_cells.find(coord)
+        if rng is not None:
+            return self.ws.cell(*rng.top[0])
 
     def bind_col_dimensions(self):
         for col, cd in self.parser.column_dimensions.items():
@@ -41,6 +41,7 @@ class WriteOnlyWorksheet(_WorkbookChild):
     freeze_panes = Worksheet.freeze_panes
     print_area = Worksheet.print_area
     sheet_view = Worksheet.sheet_view
+    controls = Worksheet.controls
     _setup = Worksheet._setup
 
     def __init__(self, parent, title):
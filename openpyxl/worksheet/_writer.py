@@ -1,13 +1,16 @@
 # Copyright (c) 2010-2024 openpyxl
 
 import atexit
-from collections import defaultdict
 from io import BytesIO
+from operator import itemgetter
 import os
 from tempfile import NamedTemporaryFile
 from warnings import warn
 
 from openpyxl.xml.functions import xmlfile
+from openpyxl.formula.tokenizer import TokenizerError
+from openpyxl.formula.translate import TranslatorError
+from openpyxl.utils import get_column_letter
 from openpyxl.xml.constants import SHEET_MAIN_NS
 
 from openpyxl.comments.comment_sheet import CommentRecord
@@ -16,6 +19,8 @@ from openpyxl.packaging.relationship import Relationship, RelationshipList
 from openpyxl.styles.differential import DifferentialStyle
 
 from .dimensions import SheetDimension
+from .formula import SharedFormula
+from .cell_range import CellRange
 from .hyperlink import HyperlinkList
 from .merge import MergeCell, MergeCells
 from .related import Related
@@ -42,6 +47,49 @@ def create_temporary_file(suffix=''):
     return filename
 
 
+def _translates(shared, row, column, text):
+    try:
+        return shared._translate(row, column) == text
+    except (TokenizerError, TranslatorError):
+        return False
+
+
+def _runs(formulae, down):
+    """
+    Runs of adjacent cells down columns or along rows whose formulae are
+    translations of the first one's. Returns (shared formula, cells) pairs.
+    """
+    if down:
+        order = sorted(formulae, key=itemgetter(1, 0))
+    else:
+        order = sorted(formulae)
+
+    runs = []
+    run = []
+    shared = None
+    for row, column in order:
+        text = formulae[row, column]
+        if run:
+            last_row, last_col = run[-1]
+            if down:
+                adjacent = column == last_col and row == last_row + 1
+            else:
+                adjacent = row == last_row and column == last_col + 1
+            if adjacent and _translates(shared, row, column, text):
+                run.append((row, column))
+                continue
+            if len(run) > 1:
+                runs.append((shared, run))
+            run = []
+        # the tokenizer does not keep everything, such as repeated spaces
+        shared = SharedFormula(None, text, f"{get_column_letter(column)}{row}")
+        if _translates(shared, row, column, text):
+            run = [(row, column)]
+    if len(run) > 1:
+        runs.append((shared, run))
+    return runs
+
+
 class WorksheetWriter:
 
 
@@ -51,6 +99,7 @@ class WorksheetWriter:
         self.ws._comments = []
         self.controls = []
         self.control_images = []
+        self.shared = {}
         if out is None:
             out = create_temporary_file()
         self.out = out
@@ -108,19 +157,77 @@ class WorksheetWriter:
 
     def rows(self):
         """Return all rows, and any cells that they contain"""
-        # order cells by row
-        rows = defaultdict(list)
-        for (row, col), cell in sorted(self.ws._cells.items()):
-            rows[row].append(cell)
+        cells = self.ws._cells
+        rows = [(row, cells.row_cells(row)) for row in cells.row_indices()]
 
         # add empty rows if styling has been applied
-        for row in self.ws.row_dimensions.keys() - rows.keys():
-            rows[row] = []
+        styled = [row for row in self.ws.row_dimensions if not cells.row_count(row)]
+        if styled:
+            rows.extend((row, []) for row in styled)
+            rows.sort(key=itemgetter(0))
+
+        return rows
 
-        return sorted(rows.items())
+
+    def share_formulae(self):
+        """
+        Runs of cells down a column, and then along a row, whose formulae
+        only differ by their relative references and which can be written
+        as shared formulae. The cells themselves are not changed.
+        Returns (shared formula, cells) pairs.
+        """
+        formulae = {}
+        for coord, cell in self.ws._cells.items():
+            if cell.data_type == "f" and isinstance(cell._value, str):
+                formulae[coord] = cell._value
+
+        groups = []
+        for down in (True, False):
+            for shared, run in _runs(formulae, down):
+                groups.append((shared, run))
+                for coord in run:
+                    del formulae[coord]
+        return groups
+
+
+    def shared_formulae(self):
+        """
+        How to write the cells of each shared formula group.
+        Cells which have been edited or moved no longer belong to a loaded
+        group so the first remaining cell of each group becomes its master
+        and cells to the left of it are written in full.
+        Returns {(row, column): (attributes, formula)}
+        """
+        members = {}
+        for (row, column), cell in self.ws._cells.items():
+            value = cell._value
+            if value.__class__ is SharedFormula:
+                members.setdefault(value, []).append((row, column))
+        groups = list(members.items())
+        if getattr(self.ws.parent, "share_formulae", False):
+            groups.extend(self.share_formulae())
+
+        cells = {}
+        si = 0
+        for value, coords in groups:
+            if len(coords) < 2:
+                continue
+            row, column = min(coords)
+            max_row = max(r for r, c in coords)
+            max_col = max(c for r, c in coords if c >= column)
+            ref = CellRange(min_col=column, min_row=row, max_col=max_col,
+                            max_row=max_row)
+            for coord in coords:
+                if coord[1] >= column:
+                    cells[coord] = ({'t': "shared", 'si': f"{si}"}, None)
+            cells[row, column] = ({'t': "shared", 'ref': ref.coord, 'si': f"{si}"},
+                                  value.formula(row, column))
+            si += 1
+        return cells
 
 
     def write_rows(self):
+        self.shared = self.shared_formulae()
         xf = self.xf.send(True)
 
         with xf.element("sheetData"):
@@ -147,7 +254,7 @@ class WorksheetWriter:
                     and not cell._comment
                     ):
                     continue
-                write_cell(xf, self.ws, cell, cell.has_style)
+                write_cell(xf, self.ws, cell, cell.has_style, self.shared)
 
 
     def write_protection(self):
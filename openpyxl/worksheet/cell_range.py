@@ -9,12 +9,21 @@ from openpyxl.descriptors.sequence import UniqueSequence
 from openpyxl.descriptors.serialisable import Serialisable
 
 from openpyxl.utils import (
+    coordinate_to_tuple,
     range_boundaries,
     range_to_tuple,
     get_column_letter,
     quote_sheetname,
 )
 
+# Size of the blocks of cells used to index the ranges of a MultiCellRange
+ROW_BITS = 6
+COL_BITS = 4
+# Ranges covering more blocks than this are not indexed
+MAX_BLOCKS = 64
+# Smaller collections are searched directly
+INDEX_SIZE = 16
+
 class CellRange(Serialisable):
     """
     Represents a range in a sheet: title and coordinates.
@@ -260,8 +269,14 @@ class CellRange(Serialisable):
         """
         Check whether the range contains a particular cell coordinate
         """
-        cr = self.__class__(coord)
-        return self.__superset(cr)
+        if "!" in coord:
+            return self.__superset(CellRange(coord))
+        min_col, min_row, max_col, max_row = range_boundaries(coord)
+        return (
+            (self.min_row <= min_row <= max_row <= self.max_row)
+            and
+            (self.min_col <= min_col <= max_col <= self.max_col)
+        )
 
 
     def __gt__(self, other):
@@ -422,10 +437,133 @@ class CellRange(Serialisable):
         return [(row, self.max_col) for row in range(self.min_row, self.max_row+1)]
 
 
+class RangeIndex:
+
+    """
+    Items indexed by cell ranges. Ranges are filed under the blocks of cells
+    they cover, so that the items whose ranges contain a cell or overlap
+    another range can be found without checking all of them.
+    """
+
+    def __init__(self, entries=()):
+        self.size = 0
+        self.blocks = {}
+        self.large = []
+        for cr, item in entries:
+            self.add(cr, item)
+
+
+    @staticmethod
+    def _blocks(cr):
+        rows = range(cr.min_row >> ROW_BITS, (cr.max_row >> ROW_BITS) + 1)
+        cols = range(cr.min_col >> COL_BITS, (cr.max_col >> COL_BITS) + 1)
+        if len(rows) * len(cols) > MAX_BLOCKS:
+            return
+        return [(row, col) for row in rows for col in cols]
+
+
+    def add(self, cr, item):
+        self.size += 1
+        entry = cr, item
+        blocks = self._blocks(cr)
+        if blocks is None:
+            self.large.append(entry)
+            return
+        for key in blocks:
+            self.blocks.setdefault(key, []).append(entry)
+
+
+    def remove(self, cr, item):
+        self.size -= 1
+        entry = cr, item
+        blocks = self._blocks(cr)
+        if blocks is None:
+            self.large.remove(entry)
+            return
+        for key in blocks:
+            entries = self.blocks[key]
+            entries.remove(entry)
+            if not entries:
+                del self.blocks[key]
+
+
+    def find(self, row, col):
+        """
+        Items whose ranges contain a cell
+        """
+        block = self.blocks.get((row >> ROW_BITS, col >> COL_BITS), ())
+        for entries in (block, self.large):
+            for cr, item in entries:
+                if (cr.min_row <= row <= cr.max_row
+                    and cr.min_col <= col <= cr.max_col):
+                    yield item
+
+
+    def overlapping(self, min_col, min_row, max_col, max_row):
+        """
+        Items whose ranges overlap a range. Items may be included more than
+        once.
+        """
+        rows = range(min_row >> ROW_BITS, (max_row >> ROW_BITS) + 1)
+        cols = range(min_col >> COL_BITS, (max_col >> COL_BITS) + 1)
+        if len(rows) * len(cols) > len(self.blocks):
+            keys = [key for key in self.blocks if key[0] in rows and key[1] in cols]
+        else:
+            keys = [(row, col) for row in rows for col in cols]
+        blocks = [self.blocks.get(key, ()) for key in keys]
+        blocks.append(self.large)
+        for entries in blocks:
+            for cr, item in entries:
+                if (cr.min_row <= max_row and min_row <= cr.max_row
+                    and cr.min_col <= max_col and min_col <= cr.max_col):
+                    yield item
+
+
+    def search(self, coord):
+        """
+        Items whose ranges contain a cell, given as a coordinate such as "B2",
+        a (row, column) tuple or a cell, or which overlap a range such as
+        "A1:Z1". Each item is returned once.
+        """
+        if isinstance(coord, str):
+            min_col, min_row, max_col, max_row = range_boundaries(coord)
+            items = self.overlapping(min_col or 1, min_row or 1,
+                                     max_col or 16384, max_row or 1048576)
+        else:
+            if not isinstance(coord, tuple):
+                coord = coord.row, coord.column
+            items = self.find(*coord)
+        found = {}
+        for item in items:
+            found.setdefault(id(item), item)
+        return list(found.values())
+
+
+def _sqref_state(objs):
+    """
+    Objects with ranges, such as data validations, as an index of them was
+    built from
+    """
+    return [(obj, obj.sqref, obj.sqref._version) for obj in objs]
+
+
+def _unchanged(state, objs):
+    """
+    Whether objects and their ranges are still the same as when an index of
+    them was built. Changes to the CellRanges themselves are not noticed.
+    """
+    return len(state) == len(objs) and all(
+        obj is indexed and obj.sqref is sqref and sqref._version == version
+        for (indexed, sqref, version), obj in zip(state, objs))
+
+
 class MultiCellRange(Strict):
 
 
     ranges = UniqueSequence(expected_type=CellRange)
+    _index = None
+    _indexed = None
+    _version = 0 # changes by add() and remove()
 
 
     def __init__(self, ranges=set()):
@@ -437,12 +575,47 @@ class MultiCellRange(Strict):
     def __contains__(self, coord):
         if isinstance(coord, str):
             coord = CellRange(coord)
-        for r in self.ranges:
+        for r in self._find(coord.min_row, coord.min_col):
             if coord <= r:
                 return True
         return False
 
 
+    def find(self, coord):
+        """
+        Return the range containing a cell, given as a coordinate such as "B2"
+        or as a (row, column) tuple, or None
+        """
+        if isinstance(coord, str):
+            coord = coordinate_to_tuple(coord)
+        row, col = coord
+        for r in self._find(row, col):
+            if r.min_row <= row <= r.max_row and r.min_col <= col <= r.max_col:
+                return r
+
+
+    def _find(self, row, col):
+        """
+        Ranges which may contain a cell. Large collections are indexed when
+        they are first searched and the index is kept up to date by add()
+        and remove().
+        """
+        if len(self.ranges) <= INDEX_SIZE:
+            return self.ranges
+        index = self._current_index()
+        if index is None:
+            index = self._index = RangeIndex((cr, cr) for cr in self.ranges)
+            self._indexed = self.ranges
+        return index.find(row, col)
+
+
+    def _current_index(self):
+        index = self._index
+        if (index is not None and self._indexed is self.ranges
+            and index.size == len(self.ranges)):
+            return index
+
+
     def __repr__(self):
         ranges = " ".join([str(r) for r in self.sorted()])
         return f"<{self.__class__.__name__} [{ranges}]>"
@@ -474,7 +647,11 @@ class MultiCellRange(Strict):
         elif not isinstance(coord, CellRange):
             raise ValueError("You can only add CellRanges")
         if cr not in self:
+            index = self._current_index()
             self.ranges.add(cr)
+            self._version += 1
+            if index is not None:
+                index.add(cr, cr)
 
 
     def __iadd__(self, coord):
@@ -499,7 +676,11 @@ class MultiCellRange(Strict):
     def remove(self, coord):
         if not isinstance(coord, CellRange):
             coord = CellRange(coord)
+        index = self._current_index()
         self.ranges.remove(coord)
+        self._version += 1
+        if index is not None:
+            index.remove(coord, coord)
 
 
     def __iter__(self):
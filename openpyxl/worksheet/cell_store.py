@@ -0,0 +1,270 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Storage for the cells of a worksheet
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+class CellStore(dict):
+    """
+    Dictionary of cells keyed by (row, column)
+
+    Cells are also kept by row, in column order, and the rows themselves are
+    kept in order so that cells can be visited row by row without sorting
+    the whole worksheet. Cells are usually added in order so this is mostly
+    a matter of appending; rows filled out of order are sorted when next
+    needed.
+
+    The number of cells in each column is counted so that the bounds of the
+    worksheet are known without looking at every cell. Bounds grow as cells
+    are added; when the last cell of an outer row or column is removed they
+    are recalculated from the occupied rows and columns the next time they
+    are needed.
+    """
+
+    __slots__ = ("_rows", "_unsorted", "_order", "_cols", "_bounds")
+
+    def __init__(self, *args, **kw):
+        super().__init__()
+        self._rows = {}
+        self._unsorted = set()
+        self._order = []
+        self._cols = {}
+        self._bounds = None
+        self.update(*args, **kw)
+
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+    def _insert(self, row, col, cell):
+        """
+        Add a cell to a row
+        """
+        cells = self._rows.get(row)
+        if cells is None:
+            self._rows[row] = {col: cell}
+            order = self._order
+            if order is not None:
+                if not order or row > order[-1]:
+                    order.append(row)
+                else:
+                    self._order = None
+            bounds = self._bounds
+            if bounds is not None:
+                if row < bounds[1]:
+                    bounds[1] = row
+                elif row > bounds[3]:
+                    bounds[3] = row
+        else:
+            if col < next(reversed(cells)):
+                self._unsorted.add(row)
+            cells[col] = cell
+
+
+    def _remove(self, row, col):
+        """
+        Remove a cell from a row
+        """
+        cells = self._rows[row]
+        del cells[col]
+        if cells:
+            return
+
+        del self._rows[row]
+        self._unsorted.discard(row)
+        order = self._order
+        if order is not None:
+            if order[-1] == row:
+                order.pop()
+            else:
+                del order[bisect_left(order, row)]
+        bounds = self._bounds
+        if bounds is not None and (row == bounds[1] or row == bounds[3]):
+            self._bounds = None
+
+
+    def _row(self, row):
+        """
+        Cells of a row by column, in order
+        """
+        cells = self._rows.get(row)
+        if cells is None:
+            return {}
+        if row in self._unsorted:
+            cells = self._rows[row] = dict(sorted(cells.items()))
+            self._unsorted.discard(row)
+        return cells
+
+
+    def _add_col(self, col):
+        cols = self._cols
+        if col in cols:
+            cols[col] += 1
+        else:
+            cols[col] = 1
+            bounds = self._bounds
+            if bounds is not None:
+                if col < bounds[0]:
+                    bounds[0] = col
+                elif col > bounds[2]:
+                    bounds[2] = col
+
+
+    def _discard_col(self, col):
+        cols = self._cols
+        count = cols[col] - 1
+        if count:
+            cols[col] = count
+        else:
+            del cols[col]
+            bounds = self._bounds
+            if bounds is not None and (col == bounds[0] or col == bounds[2]):
+                self._bounds = None
+
+
+    def __setitem__(self, key, cell):
+        row, col = key
+        if key in self:
+            self._rows[row][col] = cell
+        else:
+            self._insert(row, col, cell)
+            self._add_col(col)
+        dict.__setitem__(self, key, cell)
+
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        row, col = key
+        self._remove(row, col)
+        self._discard_col(col)
+
+
+    def pop(self, key, *default):
+        if key not in self:
+            return dict.pop(self, key, *default)
+        cell = self[key]
+        del self[key]
+        return cell
+
+
+    def popitem(self):
+        key, cell = dict.popitem(self)
+        row, col = key
+        self._remove(row, col)
+        self._discard_col(col)
+        return key, cell
+
+
+    def move(self, src, dst):
+        """
+        Move the cell at src to dst replacing any cell already there
+        """
+        cell = dict.pop(self, src)
+        src_row, src_col = src
+        row, col = dst
+        if dst in self:
+            self._rows[row][col] = cell
+            self._discard_col(src_col)
+        else:
+            self._insert(row, col, cell)
+            if col != src_col:
+                self._add_col(col)
+                self._discard_col(src_col)
+        self._remove(src_row, src_col)
+        dict.__setitem__(self, dst, cell)
+
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+
+    def update(self, *args, **kw):
+        for key, cell in dict(*args, **kw).items():
+            self[key] = cell
+
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+    def clear(self):
+        dict.clear(self)
+        self._rows.clear()
+        self._unsorted.clear()
+        self._order = []
+        self._cols.clear()
+        self._bounds = None
+
+
+    def copy(self):
+        return self.__class__(self)
+
+
+    @property
+    def bounds(self):
+        """
+        (min_col, min_row, max_col, max_row) of all cells or None
+        """
+        bounds = self._bounds
+        if bounds is None:
+            if not self._rows:
+                return
+            rows = self._rows
+            cols = self._cols
+            bounds = self._bounds = [min(cols), min(rows), max(cols), max(rows)]
+        return tuple(bounds)
+
+
+    def row_count(self, row):
+        """
+        Number of cells in a row
+        """
+        return len(self._rows.get(row, ()))
+
+
+    def column_count(self, col):
+        """
+        Number of cells in a column
+        """
+        return self._cols.get(col, 0)
+
+
+    def row_indices(self, min_row=None, max_row=None):
+        """
+        Rows containing cells in order
+        """
+        order = self._order
+        if order is None:
+            order = self._order = sorted(self._rows)
+        lo = 0 if min_row is None else bisect_left(order, min_row)
+        hi = len(order) if max_row is None else bisect_right(order, max_row)
+        return order[lo:hi]
+
+
+    def row_columns(self, row, min_col=None, max_col=None):
+        """
+        Columns of a row containing cells in order
+        """
+        cols = list(self._row(row))
+        if min_col is None and max_col is None:
+            return cols
+        lo = 0 if min_col is None else bisect_left(cols, min_col)
+        hi = len(cols) if max_col is None else bisect_right(cols, max_col)
+        return cols[lo:hi]
+
+
+    def row_cells(self, row, min_col=None, max_col=None):
+        """
+        Cells of a row in column order
+        """
+        cells = self._row(row)
+        if min_col is None and max_col is None:
+            return list(cells.values())
+        return [cells[col] for col in self.row_columns(row, min_col, max_col)]
@@ -50,6 +50,8 @@ class WorksheetCopy(object):
 
             target_cell._value = source_cell._value
             target_cell.data_type = source_cell.data_type
+            target_cell._cached_value = source_cell._cached_value
+            target_cell._track_value()
 
             if source_cell.has_style:
                 target_cell._style = copy(source_cell._style)
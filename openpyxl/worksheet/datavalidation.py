@@ -68,12 +68,13 @@ def expand_cell_ranges(range_string):
     return set(chain(*cells))
 
 
-from .cell_range import MultiCellRange
+from .cell_range import MultiCellRange, RangeIndex, _sqref_state, _unchanged
 
 
 class DataValidation(Serialisable):
 
     tagname = "dataValidation"
+    __slots__ = ()
 
     sqref = Convertible(expected_type=MultiCellRange)
     cells = Alias("sqref")
@@ -165,6 +166,9 @@ class DataValidationList(Serialisable):
     __elements__ = ('dataValidation',)
     __attrs__ = ('disablePrompts', 'xWindow', 'yWindow', 'count')
 
+    _index = None
+    _indexed = None
+
     def __init__(self,
                  disablePrompts=None,
                  xWindow=None,
@@ -189,6 +193,33 @@ class DataValidationList(Serialisable):
 
     def append(self, dv):
         self.dataValidation.append(dv)
+        self._index = None
+
+
+    def validations_for(self, coord):
+        """
+        Validations which apply to a cell, given as a coordinate such as "B2",
+        a (row, column) tuple or a cell, or to any cell of a range such as
+        "A1:Z1", in the order they were added
+        """
+        return [dv for _, dv in sorted(self._validation_index().search(coord),
+                                       key=itemgetter(0))]
+
+
+    def _validation_index(self):
+        """
+        Validations by the cells they apply to. The index is built again when
+        validations have been added or removed or their ranges have changed.
+        """
+        index = self._index
+        validations = self.dataValidation
+        if index is None or not _unchanged(self._indexed, validations):
+            # one item per validation, whichever of its ranges are found
+            entries = [(cr, item) for item in enumerate(validations)
+                       for cr in item[1].sqref]
+            index = self._index = RangeIndex(entries)
+            self._indexed = _sqref_state(validations)
+        return index
 
 
     def to_tree(self, tagname=None):
@@ -1,6 +1,8 @@
 # Copyright (c) 2010-2024 openpyxl
 
 from openpyxl.compat import safe_string
+from openpyxl.formula.translate import Translator
+from openpyxl.utils.cell import coordinate_to_tuple
 
 class DataTableFormula:
 
@@ -49,3 +51,42 @@ class ArrayFormula:
             v = getattr(self, k)
             if v:
                 yield k, safe_string(v)
+
+
+class SharedFormula:
+    """
+    A formula shared by a range of cells in a worksheet.
+
+    All the cells in the range refer to the same object and their formulae
+    are translated from the first cell's when they are needed.
+    """
+
+    t = "shared"
+
+
+    def __init__(self, ref, text, origin):
+        self.ref = ref
+        self.text = text
+        self.origin = origin
+        self._translator = None
+
+
+    def formula(self, row, column):
+        """
+        The formula of the cell at row, column
+        """
+        if self._translator is None:
+            origin = coordinate_to_tuple(self.origin)
+        else:
+            origin = self._translator.row, self._translator.col
+        if (row, column) == origin:
+            return self.text # kept as it was written
+        return self._translate(row, column)
+
+
+    def _translate(self, row, column):
+        translator = self._translator
+        if translator is None:
+            translator = self._translator = Translator(self.text, self.origin)
+        return translator.translate_formula(row_delta=row - translator.row,
+                                            col_delta=column - translator.col)
@@ -9,6 +9,7 @@ from openpyxl.descriptors.excel import Relation
 class Hyperlink(Serialisable):
 
     tagname = "hyperlink"
+    __slots__ = ()
 
     ref = String()
     location = String(allow_none=True)
@@ -59,8 +59,9 @@ class MergedCellRange(CellRange):
     """
     MergedCellRange stores the border information of a merged cell in the top
     left cell of the merged cell.
-    The remaining cells in the merged cell are stored as MergedCell objects and
-    get their border information from the upper left cell.
+    The remaining cells in the merged cell are covered by the range. They are
+    only stored, as MergedCell objects, where they need a border or
+    protection from the upper left cell or when they are looked up.
     """
 
     def __init__(self, worksheet, coord):
@@ -92,18 +93,25 @@ class MergedCellRange(CellRange):
 
     def format(self):
         """
-        Each cell of the merged cell is created as MergedCell if it does not
-        already exist.
-
         The MergedCells at the edge of the merged cell gets its borders from
-        the upper left cell.
+        the upper left cell. They are created if they do not already exist.
 
          - The top MergedCells get the top border from the top left cell.
          - The bottom MergedCells get the bottom border from the top left cell.
          - The left MergedCells get the left border from the top left cell.
          - The right MergedCells get the right border from the top left cell.
+
+        If the upper left cell is not protected in the default way, each cell
+        of the merged cell is created and gets its protection.
+
+        The bottom right MergedCell is always created so that the dimensions
+        of the worksheet include the merged cell.
         """
 
+        end = self.max_row, self.max_col
+        if end not in self.ws._cells:
+            self.ws._cells[end] = MergedCell(self.ws, *end)
+
         names = ['top', 'left', 'right', 'bottom']
 
         for name in names:
@@ -119,22 +127,16 @@ class MergedCellRange(CellRange):
                     self.ws._cells[(cell.row, cell.column)] = cell
                 cell.border += border
 
-        protected = self.start_cell.protection is not None
-        if protected:
-            protection = copy.copy(self.start_cell.protection)
+        if not self.start_cell._style.protectionId:
+            return
+        protection = copy.copy(self.start_cell.protection)
         for coord in self.cells:
             cell = self.ws._cells.get(coord)
             if cell is None:
                 row, col = coord
                 cell = MergedCell(self.ws, row=row, column=col)
                 self.ws._cells[(cell.row, cell.column)] = cell
-
-            if protected:
-                cell.protection = protection
-
-
-    def __contains__(self, coord):
-        return coord in CellRange(self.coord)
+            cell.protection = protection
 
 
     def __copy__(self):
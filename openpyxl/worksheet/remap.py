@@ -0,0 +1,137 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Renumbering of rows and columns when several blocks are inserted or deleted
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+def _blocks(blocks):
+    """
+    Normalise indices or (index, amount) pairs into sorted (index, amount) pairs
+    """
+    result = []
+    for block in blocks:
+        if isinstance(block, int):
+            idx, amount = block, 1
+        else:
+            idx, amount = block
+        if idx < 1 or amount < 1:
+            raise ValueError(f"Invalid block: index {idx}, amount {amount}")
+        result.append((idx, amount))
+    result.sort()
+    return result
+
+
+class IndexMap:
+    """
+    Map row or column indices from before a set of edits to after them.
+
+    All blocks refer to the indices before any of them are applied so that
+    the result does not depend upon the order in which they are given.
+    Indices which are deleted, or pushed beyond the limit by insertions,
+    map to None.
+    """
+
+    __slots__ = ("_starts", "_ends", "_totals", "_delete", "limit")
+
+    def __init__(self, starts, ends, totals, delete, limit=None):
+        self._starts = starts
+        self._ends = ends
+        self._totals = totals
+        self._delete = delete
+        self.limit = limit
+
+
+    @classmethod
+    def insertion(cls, blocks, limit=None):
+        """
+        Insert `amount` indices before each `index`
+        """
+        starts = []
+        totals = [0]
+        for idx, amount in _blocks(blocks):
+            if starts and starts[-1] == idx:
+                totals[-1] += amount
+                continue
+            starts.append(idx)
+            totals.append(totals[-1] + amount)
+        return cls(starts, None, totals, False, limit)
+
+
+    @classmethod
+    def deletion(cls, blocks, limit=None):
+        """
+        Delete `amount` indices from each `index`. Overlapping blocks are
+        merged.
+        """
+        starts = []
+        ends = []
+        for idx, amount in _blocks(blocks):
+            end = idx + amount - 1
+            if ends and idx <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+                continue
+            starts.append(idx)
+            ends.append(end)
+        totals = [0]
+        for start, end in zip(starts, ends):
+            totals.append(totals[-1] + end - start + 1)
+        return cls(starts, ends, totals, True, limit)
+
+
+    def __bool__(self):
+        return bool(self._starts)
+
+
+    @property
+    def first(self):
+        """
+        Lowest index affected by the edits
+        """
+        if self._starts:
+            return self._starts[0]
+
+
+    def _deleted_before(self, idx):
+        """
+        Number of deleted indices lower than idx
+        """
+        k = bisect_left(self._starts, idx)
+        total = self._totals[k]
+        if k and self._ends[k-1] >= idx:
+            total -= self._ends[k-1] - idx + 1
+        return total
+
+
+    def get(self, idx):
+        """
+        New position of an index or None if it no longer exists
+        """
+        if self._delete:
+            k = bisect_right(self._starts, idx)
+            if k and self._ends[k-1] >= idx:
+                return
+            return idx - self._totals[k]
+        idx += self._totals[bisect_right(self._starts, idx)]
+        if self.limit is None or idx <= self.limit:
+            return idx
+
+
+    def span(self, lo, hi):
+        """
+        New (lo, hi) of an inclusive interval or None if nothing is left of it.
+        Intervals shrink when indices inside them are deleted and grow when
+        indices are inserted inside them.
+        """
+        if self._delete:
+            lo -= self._deleted_before(lo)
+            hi -= self._deleted_before(hi + 1)
+        else:
+            lo += self._totals[bisect_right(self._starts, lo)]
+            hi += self._totals[bisect_right(self._starts, hi)]
+            if self.limit is not None:
+                hi = min(hi, self.limit)
+        if lo <= hi:
+            return lo, hi
@@ -208,6 +208,13 @@ class TestCellRange:
         assert not "M1" in cr
 
 
+    def test_contains_range(self, CellRange):
+        cr = CellRange("A1:F10")
+        assert "B2:C3" in cr
+        assert "E9:G9" not in cr
+        assert "Sheet1!B2" in cr
+
+
     @pytest.mark.parametrize("r1, r2, expected",
                              [
                                  ("Sheet1!A1:B4", "Sheet1!D5:E5", None),
@@ -345,6 +352,29 @@ class TestMultiCellRange:
         assert "F6" not in cells
 
 
+    def test_find(self, MultiCellRange):
+        cells = MultiCellRange("A1:D5 F6")
+        assert cells.find("C3").coord == "A1:D5"
+        assert cells.find("F6").coord == "F6"
+        assert cells.find("F5") is None
+
+
+    def test_indexed(self, MultiCellRange):
+        cells = MultiCellRange()
+        for row in range(1, 200, 2):
+            cells.add(f"A{row}:B{row + 1}")
+        cells.add("C1:C10000")
+        assert cells.find("B100").coord == "A99:B100"
+        assert cells.find("C5000").coord == "C1:C10000"
+        assert "A3:A4" in cells
+        assert "A4:A5" not in cells
+
+        cells.remove("A99:B100")
+        assert cells.find("B100") is None
+        cells.add("A99:B100")
+        assert cells.find("B100").coord == "A99:B100"
+
+
     def test_eq(self, MultiCellRange):
         cells = MultiCellRange("A1:D4 E5")
         assert cells == "A1:D4 E5"
@@ -386,3 +416,36 @@ class TestMultiCellRange:
         from copy import copy
         r2 = copy(r1)
         assert list(r1)[0] is not list(r2)[0]
+
+
+@pytest.fixture
+def RangeIndex():
+    from ..cell_range import RangeIndex
+    return RangeIndex
+
+
+class TestRangeIndex:
+
+    def test_find(self, RangeIndex, CellRange):
+        index = RangeIndex([(CellRange("A1:C3"), 1), (CellRange("B2:Z2000"), 2)])
+        assert list(index.find(2, 2)) == [1, 2]
+        assert list(index.find(1000, 10)) == [2]
+        assert list(index.find(1, 26)) == []
+
+
+    def test_add_remove(self, RangeIndex, CellRange):
+        index = RangeIndex()
+        cr = CellRange("D4:E5")
+        index.add(cr, "x")
+        assert list(index.find(5, 5)) == ["x"]
+        index.remove(cr, "x")
+        assert list(index.find(5, 5)) == []
+
+
+    def test_search(self, RangeIndex, CellRange):
+        index = RangeIndex([(CellRange("A1:A5"), 1), (CellRange("C1:C5"), 1),
+                            (CellRange("E1:E5"), 2)])
+        assert index.search("A1:Z1") == [1, 2]
+        assert index.search("B:B") == []
+        assert index.search("C3") == [1]
+        assert index.search((3, 5)) == [2]
@@ -0,0 +1,182 @@
+# Copyright (c) 2010-2024 openpyxl
+
+from copy import deepcopy
+import pickle
+
+import pytest
+
+
+@pytest.fixture
+def CellStore():
+    from ..cell_store import CellStore
+    return CellStore
+
+
+class TestCellStore:
+
+    def test_ctor(self, CellStore):
+        store = CellStore({(2, 3): "C2", (5, 1): "A5"})
+        assert store == {(2, 3): "C2", (5, 1): "A5"}
+        assert store.bounds == (1, 2, 3, 5)
+
+
+    def test_empty(self, CellStore):
+        store = CellStore()
+        assert store.bounds is None
+        assert store.row_count(1) == 0
+        assert store.column_count(1) == 0
+
+
+    def test_add(self, CellStore):
+        store = CellStore()
+        store[4, 4] = "D4"
+        assert store.bounds == (4, 4, 4, 4)
+        store[2, 6] = "F2"
+        store[8, 1] = "A8"
+        assert store.bounds == (1, 2, 6, 8)
+        assert store.row_count(4) == 1
+        assert store.column_count(1) == 1
+
+
+    def test_replace(self, CellStore):
+        store = CellStore()
+        store[1, 1] = "A1"
+        store[1, 1] = "A1"
+        assert store.row_count(1) == 1
+        assert store.column_count(1) == 1
+
+
+    def test_delete_inner(self, CellStore):
+        store = CellStore({(1, 1): "A1", (2, 2): "B2", (3, 3): "C3"})
+        assert store.bounds == (1, 1, 3, 3)
+        del store[2, 2]
+        assert store._bounds is not None
+        assert store.bounds == (1, 1, 3, 3)
+        assert store.row_count(2) == 0
+
+
+    def test_delete_outer(self, CellStore):
+        store = CellStore({(1, 1): "A1", (2, 2): "B2", (3, 3): "C3"})
+        assert store.bounds == (1, 1, 3, 3)
+        del store[3, 3]
+        assert store._bounds is None
+        assert store.bounds == (1, 1, 2, 2)
+
+
+    def test_delete_shared_row(self, CellStore):
+        store = CellStore({(3, 1): "A3", (3, 3): "C3", (1, 2): "B1"})
+        del store[3, 3]
+        assert store.bounds == (1, 1, 2, 3)
+        assert store.row_count(3) == 1
+
+
+    def test_delete_all(self, CellStore):
+        store = CellStore({(1, 1): "A1"})
+        del store[1, 1]
+        assert store.bounds is None
+
+
+    def test_pop(self, CellStore):
+        store = CellStore({(1, 1): "A1", (2, 2): "B2"})
+        assert store.pop((2, 2)) == "B2"
+        assert store.pop((2, 2), None) is None
+        assert store.bounds == (1, 1, 1, 1)
+        with pytest.raises(KeyError):
+            store.pop((2, 2))
+
+
+    def test_popitem(self, CellStore):
+        store = CellStore({(1, 1): "A1"})
+        assert store.popitem() == ((1, 1), "A1")
+        assert store.bounds is None
+
+
+    def test_setdefault(self, CellStore):
+        store = CellStore()
+        assert store.setdefault((2, 2), "B2") == "B2"
+        assert store.setdefault((2, 2), "X") == "B2"
+        assert store.row_count(2) == 1
+
+
+    def test_update(self, CellStore):
+        store = CellStore()
+        store.update({(1, 1): "A1"})
+        store |= {(9, 9): "I9"}
+        assert isinstance(store, CellStore)
+        assert store.bounds == (1, 1, 9, 9)
+
+
+    def test_move(self, CellStore):
+        store = CellStore({(1, 1): "A1", (3, 2): "B3"})
+        assert store.bounds == (1, 1, 2, 3)
+        store.move((3, 2), (5, 2))
+        assert store == {(1, 1): "A1", (5, 2): "B3"}
+        assert store.bounds == (1, 1, 2, 5)
+        assert store.row_count(3) == 0
+        assert store.column_count(2) == 1
+        store.move((5, 2), (1, 1))
+        assert store == {(1, 1): "B3"}
+        assert store.bounds == (1, 1, 1, 1)
+
+
+    def test_move_column(self, CellStore):
+        store = CellStore({(1, 1): "A1", (1, 2): "B1"})
+        store.move((1, 1), (1, 4))
+        assert store.row_columns(1) == [2, 4]
+        assert store.bounds == (2, 1, 4, 1)
+
+
+    def test_row_order(self, CellStore):
+        store = CellStore()
+        for row, col in [(5, 3), (5, 1), (2, 2), (9, 1), (5, 2)]:
+            store[row, col] = (row, col)
+        assert store.row_indices() == [2, 5, 9]
+        assert store.row_indices(3) == [5, 9]
+        assert store.row_indices(max_row=5) == [2, 5]
+        assert store.row_columns(5) == [1, 2, 3]
+        assert store.row_columns(5, 2) == [2, 3]
+        assert store.row_columns(5, max_col=1) == [1]
+        assert store.row_columns(4) == []
+        assert store.row_cells(5) == [(5, 1), (5, 2), (5, 3)]
+
+
+    def test_replace_in_row(self, CellStore):
+        store = CellStore({(1, 3): "C1", (1, 1): "A1"})
+        store[1, 3] = "new"
+        assert store.row_cells(1) == ["A1", "new"]
+        assert store.row_cells(1, min_col=2) == ["new"]
+
+
+    def test_row_order_after_delete(self, CellStore):
+        store = CellStore({(1, 1): "A1", (2, 1): "A2", (3, 1): "A3"})
+        assert store.row_indices() == [1, 2, 3]
+        del store[2, 1]
+        assert store.row_indices() == [1, 3]
+        store[2, 1] = "A2"
+        assert store.row_indices() == [1, 2, 3]
+        store.popitem()
+        assert store.row_indices() == [1, 3]
+
+
+    def test_clear(self, CellStore):
+        store = CellStore({(1, 1): "A1"})
+        store.clear()
+        assert store.bounds is None
+        assert store.row_count(1) == 0
+
+
+    @pytest.mark.parametrize("duplicate",
+                             [
+                                 lambda s: s.copy(),
+                                 deepcopy,
+                                 lambda s: pickle.loads(pickle.dumps(s)),
+                             ]
+                             )
+    def test_copy(self, CellStore, duplicate):
+        store = CellStore({(1, 1): "A1", (4, 2): "B4"})
+        other = duplicate(store)
+        assert isinstance(other, CellStore)
+        assert other == store
+        assert other.bounds == (1, 1, 2, 4)
+        del other[4, 2]
+        assert store.bounds == (1, 1, 2, 4)
@@ -161,6 +161,46 @@ class TestDataValidationList:
         assert diff is None, diff
 
 
+    def test_validations_for(self, DataValidationList, DataValidation):
+        dvs = DataValidationList()
+        first = DataValidation(sqref="A1:A10")
+        second = DataValidation(sqref="A5:E5 G1")
+        dvs.append(first)
+        dvs.append(second)
+        assert dvs.validations_for("A5") == [first, second]
+        assert dvs.validations_for((1, 7)) == [second]
+        assert dvs.validations_for("B1:F4") == []
+        first.add("B2")
+        assert dvs.validations_for("B1:F4") == [first]
+
+
+    def test_validations_for_ranges(self, DataValidationList, DataValidation):
+        dvs = DataValidationList()
+        dv = DataValidation(sqref="A1 C1")
+        dvs.append(dv)
+        assert dvs.validations_for("A1:D1") == [dv]
+        dv.sqref = "E1"
+        assert dvs.validations_for("A1:D1") == []
+        assert dvs.validations_for("E1") == [dv]
+        dvs.dataValidation = []
+        assert dvs.validations_for("E1") == []
+
+
+    def test_validations_for_changes(self, DataValidationList, DataValidation):
+        dvs = DataValidationList()
+        dv = DataValidation(sqref="B3")
+        dvs.append(dv)
+        assert dvs.validations_for("B3") == [dv]
+        dv.sqref.add("E1")
+        assert dvs.validations_for("E1") == [dv]
+        dv.sqref.remove("B3")
+        assert dvs.validations_for("B3") == []
+        dvs.dataValidation.remove(dv)
+        assert dvs.validations_for("E1") == []
+        dvs.dataValidation.append(dv)
+        assert dvs.validations_for("E1") == [dv]
+
+
 COLLAPSE_TEST_DATA = [
     (
         ["A1"], "A1"
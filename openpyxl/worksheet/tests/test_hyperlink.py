@@ -33,6 +33,15 @@ class TestHyperlink:
         assert hyperlink == Hyperlink(display="http://test.com", ref="A1", id="rId1")
 
 
+    def test_pickle(self, Hyperlink):
+        import pickle
+        hyperlink = Hyperlink(target="http://test.com", ref="A1", tooltip="Go")
+        assert not hasattr(hyperlink, "__dict__")
+        cp = pickle.loads(pickle.dumps(hyperlink))
+        assert cp == hyperlink
+        assert cp.target == "http://test.com"
+
+
 @pytest.fixture
 def HyperlinkList():
     from ..hyperlink import HyperlinkList
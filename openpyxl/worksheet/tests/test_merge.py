@@ -186,6 +186,13 @@ class TestMergedCellRange:
         assert ws['E1'].protection == Protection(locked=True,hidden=True)
         assert ws['F1'].protection == Protection(locked=True,hidden=True)
 
+    def test_format_without_styles(self, MergedCellRange):
+        ws = Workbook().active
+        mcr = MergedCellRange(ws, 'A1:C3')
+        mcr.format()
+        assert sorted(ws._cells) == [(1, 1), (3, 3)]
+
+
     def test_copy(self, MergedCellRange):
         ws = Workbook().active
         mcr1 = MergedCellRange(ws, "A1:J6")
@@ -17,6 +17,7 @@ def DummyWorkbook():
         epoch = None
         _cell_styles = [StyleArray([0, 0, 0, 0, 0, 0, 0, 0, 0])]
         data_only = False
+        _cached_values = False
 
         def __init__(self):
             self.sheetnames = []
@@ -72,6 +73,26 @@ class TestReadOnlyWorksheet:
         assert cell is EMPTY_CELL
 
 
+    @pytest.mark.parametrize("values_only", [True, False])
+    def test_shared_formula(self, DummyWorkbook, ReadOnlyWorksheet, values_only):
+        src = b"""<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <sheetData>
+          <row r="1"><c r="B1"><f t="shared" ref="B1:B3" si="0">A1*2</f></c></row>
+          <row r="2"><c r="B2"><f t="shared" si="0"/></c></row>
+          <row r="3"><c r="B3"><f t="shared" si="0"/></c></row>
+        </sheetData>
+        </worksheet>
+        """
+
+        wb = DummyWorkbook
+        wb._archive.writestr("sheet2.xml", src)
+        ws = ReadOnlyWorksheet
+        ws._worksheet_path = "sheet2.xml"
+        rows = ws.iter_rows(min_col=2, max_col=2, max_row=3, values_only=values_only)
+        values = [row[0] if values_only else row[0].value for row in rows]
+        assert values == ["=A1*2", "=A2*2", "=A3*2"]
+
+
     def test_empty_cell(self, ReadOnlyWorksheet):
         row = [
             {'column':4, 'value':None, 'row':1},
@@ -228,6 +249,7 @@ def test_implementation_compatbility(ReadOnlyWorksheet, DummyWorkbook):
                     '_cells',
                     '_charts',
                     '_comments',
+                    '_controls',
                     '_current_row',
                     '_drawing',
                     '_hyperlinks',
@@ -243,7 +265,6 @@ def test_implementation_compatbility(ReadOnlyWorksheet, DummyWorkbook):
                     'auto_filter',
                     'col_breaks',
                     'column_dimensions',
-                    'controls',
                     'conditional_formatting',
                     'data_validations',
                     'legacy_drawing',
@@ -15,12 +15,11 @@ from openpyxl.utils.datetime  import CALENDAR_WINDOWS_1900, CALENDAR_MAC_1904
 from openpyxl.styles.styleable import StyleArray
 from openpyxl.styles.borders import DEFAULT_BORDER
 from openpyxl.styles.differential import DifferentialStyle
-from openpyxl.formula.translate import Translator
 from openpyxl.cell.rich_text import TextBlock, CellRichText
 from openpyxl.cell.text import InlineFont
 from openpyxl.styles.colors import Color
 
-from ..formula import DataTableFormula, ArrayFormula
+from ..formula import DataTableFormula, ArrayFormula, SharedFormula
 from ..worksheet import Worksheet
 from ..pagebreak import Break, RowBreak, ColBreak
 from ..scenario import ScenarioList, Scenario, InputCells
@@ -275,6 +274,31 @@ class TestWorksheetParser:
                         'style_id':0, 'value': 'y'}
 
 
+    @pytest.mark.parametrize("t, v, expected",
+                             [
+                                 ("n", "3", 3),
+                                 ("str", "y", "y"),
+                                 ("b", "1", True),
+                                 ("e", "#DIV/0!", "#DIV/0!"),
+                             ]
+                             )
+    def test_formula_cached_value(self, WorkSheetParser, t, v, expected):
+        parser = WorkSheetParser
+        parser.cached_values = True
+
+        src = f"""
+        <c r="A1" t="{t}" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+            <f>B1</f>
+            <v>{v}</v>
+        </c>
+        """
+        element = fromstring(src)
+
+        cell = parser.parse_cell(element)
+        assert cell == {'column': 1, 'data_type': 'f', 'row': 1,
+                        'style_id':0, 'value': '=B1', 'cached_value': expected}
+
+
     def test_number(self, WorkSheetParser):
         parser = WorkSheetParser
 
@@ -477,11 +501,41 @@ class TestWorksheetParser:
         </c>
         """
         element = fromstring(src)
-        parser.shared_formulae['0'] = Translator("=A4*B4", "A1")
+        parser.shared_formulae['0'] = SharedFormula("A1:A10", "=A4*B4", "A1")
         formula = parser.parse_formula(element)
         assert formula == "=A12*B12"
 
 
+    def test_shared_formula_group(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.expand_shared = False
+        src = """
+        <row r="1" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="C1"><f t="shared" ref="C1:C2" si="0">A1*B1</f><v>1</v></c>
+          <c r="C2"><f t="shared" si="0"/><v>4</v></c>
+        </row>
+        """
+        master, dependent = (parser.parse_formula(el) for el in fromstring(src))
+        assert master is dependent
+        assert master.ref == "C1:C2"
+        assert master.formula(2, 3) == "=A2*B2"
+
+
+    def test_shared_formula_whitespace(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.expand_shared = False
+        src = """
+        <row r="1" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="C1"><f t="shared" ref="C1:C2" si="0">SUM(A1,  A1)
++B1</f><v>1</v></c>
+          <c r="C2"><f t="shared" si="0"/><v>4</v></c>
+        </row>
+        """
+        master, dependent = (parser.parse_formula(el) for el in fromstring(src))
+        assert master.formula(1, 3) == "=SUM(A1,  A1)\n+B1"
+        assert master.formula(2, 3) == "=SUM(A2, A2)\n+B2"
+
+
     def test_array_formula(self, WorkSheetParser, datadir):
         parser = WorkSheetParser
 
@@ -930,6 +984,24 @@ class TestWorksheetReader:
         assert ws['C1'].value == 'a'
 
 
+    def test_cached_values(self, Workbook, WorksheetReader):
+        ws = Workbook.create_sheet("Sheet")
+        src = BytesIO(b"""
+        <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <sheetData>
+            <row r="1"><c r="A1"><v>2</v></c><c r="B1"><f>A1*2</f><v>4</v></c></row>
+          </sheetData>
+        </worksheet>
+        """)
+        reader = WorksheetReader(ws, src, [], data_only=False, rich_text=False,
+                                 cached_values=True)
+        reader.bind_cells()
+
+        assert ws['A1'].cached_value is None
+        assert ws['B1'].value == "=A1*2"
+        assert ws['B1'].cached_value == 4
+
+
     def test_array_formula(self, PrimedWorksheetReader):
         reader = PrimedWorksheetReader
         reader.bind_cells()
@@ -0,0 +1,69 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+
+@pytest.fixture
+def IndexMap():
+    from ..remap import IndexMap
+    return IndexMap
+
+
+class TestIndexMap:
+
+    def test_deletion(self, IndexMap):
+        idx = IndexMap.deletion([3, (5, 2), 6])
+        assert [idx.get(i) for i in range(1, 10)] == [1, 2, None, 3, None, None, 4, 5, 6]
+        assert idx.first == 3
+
+
+    def test_insertion(self, IndexMap):
+        idx = IndexMap.insertion([(3, 2), 5, 5])
+        assert [idx.get(i) for i in range(1, 7)] == [1, 2, 5, 6, 9, 10]
+
+
+    def test_insertion_limit(self, IndexMap):
+        idx = IndexMap.insertion([2], limit=5)
+        assert idx.get(4) == 5
+        assert idx.get(5) is None
+        assert idx.span(3, 5) == (4, 5)
+
+
+    @pytest.mark.parametrize("lo, hi, span",
+                             [
+                                 (1, 2, (1, 2)),
+                                 (1, 4, (1, 2)),
+                                 (3, 4, None),
+                                 (4, 8, (3, 5)),
+                                 (7, 7, (4, 4)),
+                             ]
+                             )
+    def test_deletion_span(self, IndexMap, lo, hi, span):
+        idx = IndexMap.deletion([(3, 3)])
+        assert idx.span(lo, hi) == span
+
+
+    @pytest.mark.parametrize("lo, hi, span",
+                             [
+                                 (1, 2, (1, 2)),
+                                 (2, 4, (2, 6)),
+                                 (3, 4, (5, 6)),
+                                 (1, 3, (1, 5)),
+                             ]
+                             )
+    def test_insertion_span(self, IndexMap, lo, hi, span):
+        idx = IndexMap.insertion([(3, 2)])
+        assert idx.span(lo, hi) == span
+
+
+    def test_empty(self, IndexMap):
+        idx = IndexMap.deletion([])
+        assert not idx
+        assert idx.first is None
+        assert idx.get(4) == 4
+
+
+    @pytest.mark.parametrize("blocks", [[0], [(2, 0)]])
+    def test_invalid(self, IndexMap, blocks):
+        with pytest.raises(ValueError):
+            IndexMap.deletion(blocks)
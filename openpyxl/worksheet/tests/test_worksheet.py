@@ -7,7 +7,7 @@ from itertools import islice
 
 # package imports
 from openpyxl.workbook import Workbook
-from openpyxl.cell import Cell
+from openpyxl.cell import Cell, MergedCell
 from ..cell_range import CellRange
 
 from openpyxl.worksheet.table import Table, TableList
@@ -88,6 +88,49 @@ class TestWorksheet:
             assert tuple(c.coordinate for c in row) == coord
 
 
+    def test_iter_rows_sparse(self, Worksheet):
+        from openpyxl.cell.read_only import EMPTY_CELL
+        ws = Worksheet(Workbook())
+        ws['B1'] = 1
+        ws['C3'] = 3
+
+        rows = list(ws.iter_rows(sparse=True))
+        assert rows == [
+            (EMPTY_CELL, ws['B1'], EMPTY_CELL),
+            (EMPTY_CELL, EMPTY_CELL, EMPTY_CELL),
+            (EMPTY_CELL, EMPTY_CELL, ws['C3']),
+        ]
+        assert list(ws.iter_rows(sparse=True, values_only=True)) == [
+            (None, 1, None),
+            (None, None, None),
+            (None, None, 3),
+        ]
+        assert len(ws._cells) == 2
+
+
+    def test_iter_cols_sparse(self, Worksheet):
+        from openpyxl.cell.read_only import EMPTY_CELL
+        ws = Worksheet(Workbook())
+        ws['B1'] = 1
+        ws['B2'] = 2
+
+        cols = list(ws.iter_cols(sparse=True, values_only=True))
+        assert cols == [(None, None), (1, 2)]
+        assert len(ws._cells) == 2
+
+
+    def test_iter_cells(self, Worksheet):
+        ws = Worksheet(Workbook())
+        for coord in ["D4", "A1", "C1", "B3", "A4"]:
+            ws[coord] = coord
+
+        cells = ws.iter_cells()
+        assert [c.coordinate for c in cells] == ["A1", "C1", "B3", "A4", "D4"]
+        values = ws.iter_cells(min_row=2, max_col=3, values_only=True)
+        assert list(values) == ["B3", "A4"]
+        assert len(ws._cells) == 5
+
+
     def test_cell_alternate_coordinates(self, Worksheet):
         ws = Worksheet(Workbook())
         cell = ws.cell(row=8, column=4)
@@ -369,6 +412,20 @@ class TestWorksheet:
         assert (1, 1) in ws._cells
 
 
+    def test_merge_covered_cells(self, Worksheet):
+        ws = Worksheet(Workbook())
+        ws['B2'] = 4
+        ws.merge_cells("A1:Z10000")
+        assert sorted(ws._cells) == [(1, 1), (10000, 26)]
+        assert ws.dimensions == "A1:Z10000"
+        assert isinstance(ws['B2'], MergedCell)
+        assert ws['B2'].value is None
+        assert not isinstance(ws['AA1'], MergedCell)
+
+        ws.unmerge_cells("A1:Z10000")
+        assert sorted(ws._cells) == [(1, 1), (1, 27)]
+
+
     def test_merge_coordinate(self, Worksheet):
         ws = Worksheet(Workbook())
         ws.merge_cells(start_row=1, start_column=1, end_row=4, end_column=4)
@@ -526,6 +583,19 @@ def test_max_row(Worksheet):
     assert ws.max_row == 4
 
 
+def test_bounds_after_delete(Worksheet):
+    ws = Worksheet(DummyWorkbook())
+    ws['B2'] = 1
+    ws['F8'] = 2
+    assert ws.dimensions == "B2:F8"
+    del ws['F8']
+    assert ws.max_row == 2
+    assert ws.max_column == 2
+    assert ws.dimensions == "B2:B2"
+    del ws['B2']
+    assert ws.dimensions == "A1:A1"
+
+
 def test_add_chart(Worksheet):
     from openpyxl.chart import BarChart
     ws = Worksheet(DummyWorkbook())
@@ -768,3 +838,129 @@ class TestEditableWorksheet:
         ws['G4'] = "=SUM(G1:G3)"
         ws.move_range("G4", 1, 1, True)
         assert ws['H5'].value == "=SUM(H2:H4)"
+
+
+    def test_delete_rows_many(self, dummy_worksheet):
+        ws = dummy_worksheet
+        ws.delete_rows_many([2, (4, 2)])
+        assert ws.max_row == 3
+        assert ws._current_row == 3
+        assert [c.value for c in ws['B']] == ['B1', 'B3', 'B6']
+
+
+    def test_delete_cols_many(self, dummy_worksheet):
+        ws = dummy_worksheet
+        ws.delete_cols_many([8, 1, (3, 2)])
+        assert ws.max_column == 4
+        assert [c.value for c in ws[3]] == ['B3', 'E3', 'F3', 'G3']
+
+
+    def test_insert_rows_many(self, dummy_worksheet):
+        ws = dummy_worksheet
+        ws.insert_rows_many([(2, 2), 6])
+        assert ws.max_row == 9
+        assert ws._current_row == 9
+        assert [c.value for c in ws['A']] == ['A1', None, None, 'A2', 'A3', 'A4',
+                                              'A5', None, 'A6']
+
+
+    def test_insert_cols_many(self, dummy_worksheet):
+        ws = dummy_worksheet
+        ws.insert_cols_many([1, 3])
+        assert [c.value for c in ws[1]] == [None, 'A1', 'B1', None, 'C1', 'D1',
+                                            'E1', 'F1', 'G1', 'H1']
+
+
+    def test_delete_all_rows_many(self, dummy_worksheet):
+        ws = dummy_worksheet
+        ws.delete_rows_many([(1, 6)])
+        assert ws._cells == {}
+        assert ws._current_row == 0
+
+
+    def test_remap_dimensions(self, dummy_worksheet):
+        ws = dummy_worksheet
+        ws.row_dimensions[2].height = 20
+        ws.row_dimensions[4].height = 40
+        ws.column_dimensions['C'].width = 30
+        ws.column_dimensions.group('E', 'G')
+        ws.delete_rows_many([2, 3])
+        ws.delete_cols_many([1, 6])
+        assert list(ws.row_dimensions) == [2]
+        assert ws.row_dimensions[2].height == 40
+        assert ws.column_dimensions['B'].width == 30
+        dim = ws.column_dimensions['D']
+        assert (dim.min, dim.max) == (4, 5)
+
+
+    def test_remap_merged_cells(self):
+        ws = Workbook().active
+        ws.merge_cells("B2:C4")
+        ws.merge_cells("E5:F5")
+        ws.delete_rows_many([2, 5])
+        assert ws.merged_cells == "B2:C3"
+        start = ws['B2']
+        assert not isinstance(start, MergedCell)
+        ws.insert_cols_many([3])
+        assert ws.merged_cells == "B2:D3"
+        assert isinstance(ws['C3'], MergedCell)
+
+
+    def test_remap_hyperlinks(self, dummy_worksheet):
+        ws = dummy_worksheet
+        ws['C4'].hyperlink = "http://example.com"
+        ws.insert_rows_many([1])
+        ws.delete_cols_many([2])
+        assert ws['B5'].hyperlink.ref == "B5"
+
+
+    def test_remap_data_validation(self, dummy_worksheet):
+        from ..datavalidation import DataValidation
+        ws = dummy_worksheet
+        dv1 = DataValidation(sqref="A1:A6 C3")
+        dv2 = DataValidation(sqref="B2")
+        ws.add_data_validation(dv1)
+        ws.add_data_validation(dv2)
+        ws.delete_rows_many([2, 3])
+        assert ws.data_validations.dataValidation == [dv1]
+        assert dv1.sqref == "A1:A4"
+
+
+    def test_remap_conditional_formatting(self, dummy_worksheet):
+        from openpyxl.formatting.rule import Rule
+        ws = dummy_worksheet
+        rule1 = Rule(type="expression", formula=["TRUE"])
+        rule2 = Rule(type="expression", formula=["FALSE"])
+        ws.conditional_formatting.add("B2:B5 D2", rule1)
+        ws.conditional_formatting.add("A3", rule2)
+        ws.delete_rows_many([2, 3])
+        assert [(str(cf.sqref), cf.rules) for cf in ws.conditional_formatting] == [("B2:B3", [rule1])]
+
+
+    def test_insert_rows_translate(self):
+        ws = Workbook().active
+        ws["A1"] = "=SUM(B2:B6)"
+        ws.insert_rows(3, 2, translate=True)
+        assert ws["A1"].value == "=SUM(B2:B8)"
+
+
+    @pytest.mark.parametrize("edit, args, merged, cf, dv",
+                             [
+                                 ("insert_rows", (1,), "B3:C4", "A3:A6", "D3 E12"),
+                                 ("delete_rows", (1,), "B1:C2", "A1:A4", "D1 E10"),
+                                 ("insert_cols", (1,), "C2:D3", "B2:B5", "E2 F11"),
+                                 ("delete_cols", (1,), "A2:B3", None, "C2 D11"),
+                             ]
+                             )
+    def test_single_edit_translate(self, edit, args, merged, cf, dv):
+        from openpyxl.formatting.rule import Rule
+        from openpyxl.worksheet.datavalidation import DataValidation
+        ws = Workbook().active
+        ws.merge_cells("B2:C3")
+        ws.conditional_formatting.add("A2:A5", Rule(type="expression", formula=["TRUE"]))
+        validation = DataValidation(type="whole", sqref="D2 E11")
+        ws.add_data_validation(validation)
+        getattr(ws, edit)(*args, translate=True)
+        assert [str(mcr) for mcr in ws.merged_cells] == [merged]
+        assert [str(f.sqref) for f in ws.conditional_formatting] == ([cf] if cf else [])
+        assert str(validation.sqref) == dv
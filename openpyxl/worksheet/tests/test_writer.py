@@ -602,6 +602,68 @@ class TestWorksheetWriter:
         assert diff is None, diff
 
 
+    def test_shared_formulae(self, writer):
+        from ..formula import SharedFormula
+        ws = writer.ws
+        shared = SharedFormula("C1:C4", "=A1*B1", "C1")
+        lone = SharedFormula("E1:E2", "=D1", "E1")
+        for coord in ["C1", "C2", "C3", "C4", "E1"]:
+            cell = ws[coord]
+            cell._value = lone if coord == "E1" else shared
+            cell.data_type = "f"
+        ws["C1"] = "=A1+B1"
+        ws.move_range("C4", cols=1)
+
+        assert writer.shared_formulae() == {
+            (2, 3): ({"t": "shared", "ref": "C2:C3", "si": "0"}, "=A2*B2"),
+            (3, 3): ({"t": "shared", "si": "0"}, None),
+        }
+        assert ws["D4"].value == "=A4*B4"
+
+
+    def test_share_formulae(self, writer):
+        ws = writer.ws
+        for row in range(1, 5):
+            ws.cell(row, 3, f"=A{row}*$B$1")
+        ws["C3"] = "=A3+1"
+        ws["E1"] = "=SUM(A1:A4)"
+        ws["F1"] = "=SUM(B1:B4)"
+        ws["G1"] = "=SUM(c1:c4)"
+        ws["H1"] = "=1"
+        groups = writer.share_formulae()
+
+        assert [run for shared, run in groups] == [[(1, 3), (2, 3)], [(1, 5), (1, 6)]]
+        assert groups[1][0].formula(1, 6) == "=SUM(B1:B4)"
+        assert ws["C1"]._value == "=A1*$B$1"
+        assert ws["F1"]._value == "=SUM(B1:B4)"
+
+
+    def test_write_rows_shared(self, writer):
+        ws = writer.ws
+        ws.parent.share_formulae = True
+        ws["A1"] = "=B1"
+        ws["A2"] = "=B2"
+        writer.write_rows()
+        assert ws["A2"]._value == "=B2"
+        assert not hasattr(ws, "_shared_formulae")
+
+        xml = writer.read()
+        expected = """
+        <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <sheetData>
+          <row r="1">
+            <c r="A1"><f t="shared" ref="A1:A2" si="0">B1</f><v/></c>
+          </row>
+          <row r="2">
+            <c r="A2"><f t="shared" si="0"/><v/></c>
+          </row>
+        </sheetData>
+        </worksheet>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+
+
     def test_write_rows_comment(self, writer):
 
         cell = writer.ws['F1']
@@ -5,7 +5,6 @@
 
 # Python stdlib imports
 from itertools import chain
-from operator import itemgetter
 from inspect import isgenerator
 from warnings import warn
 
@@ -22,14 +21,18 @@ from openpyxl.utils import (
     coordinate_to_tuple,
 )
 from openpyxl.cell import Cell, MergedCell
+from openpyxl.utils.indexed_list import shard_lock
+from openpyxl.cell.read_only import EMPTY_CELL
 from openpyxl.formatting.formatting import ConditionalFormattingList
 from openpyxl.packaging.relationship import RelationshipList
 from openpyxl.workbook.child import _WorkbookChild
+from openpyxl.xml.constants import MAX_COLUMN, MAX_ROW
 from openpyxl.workbook.defined_name import (
     DefinedNameDict,
 )
 
 from openpyxl.formula.translate import Translator
+from openpyxl.formula.references import ReferenceIndex
 
 from .datavalidation import DataValidationList
 from .page import (
@@ -50,20 +53,21 @@ from .views import (
     Selection,
     SheetViewList,
 )
-from .controls import ControlList
 from .cell_range import MultiCellRange, CellRange
+from .cell_store import CellStore
 from .merge import MergedCellRange
 from .properties import WorksheetProperties
 from .pagebreak import RowBreak, ColBreak
 from .scenario import ScenarioList
 from .table import TableList
-from .formula import ArrayFormula
+from .formula import ArrayFormula, SharedFormula
 from .print_settings import (
     PrintTitles,
     ColRange,
     RowRange,
     PrintArea,
 )
+from .remap import IndexMap
 
 
 class Worksheet(_WorkbookChild):
@@ -72,6 +76,13 @@ class Worksheet(_WorkbookChild):
     Do not create worksheets yourself,
     use :func:`openpyxl.workbook.Workbook.create_sheet` instead
 
+    Different worksheets of a workbook can be populated from different
+    threads but each worksheet must only be changed by one thread at a
+    time. Styles are shared by all worksheets and can be assigned from any
+    thread, as can formulae. Inserting or deleting rows or columns with
+    ``translate=True`` changes other worksheets and must not happen while
+    other threads are populating the workbook.
+
     """
 
     _rel_type = "worksheet"
@@ -114,7 +125,7 @@ class Worksheet(_WorkbookChild):
                                                  default_factory=self._add_column)
         self.row_breaks = RowBreak()
         self.col_breaks = ColBreak()
-        self._cells = {}
+        self._cells = CellStore()
         self._charts = []
         self._images = []
         self._shapes = []
@@ -144,7 +155,23 @@ class Worksheet(_WorkbookChild):
         self.sheet_properties = WorksheetProperties()
         self.sheet_format = SheetFormatProperties()
         self.scenarios = ScenarioList()
-        self.controls = ControlList()
+        self._controls = None
+
+
+    @property
+    def controls(self):
+        """
+        Form and ActiveX controls, created on first use
+        """
+        if self._controls is None:
+            from .controls import ControlList
+            self._controls = ControlList()
+        return self._controls
+
+
+    @controls.setter
+    def controls(self, value):
+        self._controls = value
 
 
     @property
@@ -168,8 +195,8 @@ class Worksheet(_WorkbookChild):
         result = {}
         for c in self._cells.values():
             if c.data_type == "f":
-                if isinstance(c.value, ArrayFormula):
-                    result[c.coordinate] = c.value.ref
+                if isinstance(c._value, ArrayFormula):
+                    result[c.coordinate] = c._value.ref
         return result
 
 
@@ -254,17 +281,30 @@ class Worksheet(_WorkbookChild):
     def _get_cell(self, row, column):
         """
         Internal method for getting a cell from a worksheet.
-        Will create a new cell if one doesn't already exist.
+        Will create a new cell if one doesn't already exist, or a MergedCell
+        if the cell is covered by a merged range.
         """
         if not 0 < row < 1048577:
             raise ValueError(f"Row numbers must be between 1 and 1048576. Row number supplied was {row}")
         coordinate = (row, column)
         if not coordinate in self._cells:
-            cell = Cell(self, row=row, column=column)
-            self._add_cell(cell)
+            if self.merged_cells and self._merged_range(row, column) is not None:
+                self._cells[coordinate] = MergedCell(self, row, column)
+            else:
+                cell = Cell(self, row=row, column=column)
+                self._add_cell(cell)
         return self._cells[coordinate]
 
 
+    def _merged_range(self, row, column):
+        """
+        The merged range covering a cell other than its top-left one
+        """
+        mcr = self.merged_cells.find((row, column))
+        if mcr is not None and (mcr.min_row != row or mcr.min_col != column):
+            return mcr
+
+
     def _add_cell(self, cell):
         """
         Internal method for adding cell objects.
@@ -336,10 +376,10 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        min_row = 1
-        if self._cells:
-            min_row = min(self._cells)[0]
-        return min_row
+        bounds = self._cells.bounds
+        if bounds is None:
+            return 1
+        return bounds[1]
 
 
     @property
@@ -348,10 +388,10 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        max_row = 1
-        if self._cells:
-            max_row = max(self._cells)[0]
-        return max_row
+        bounds = self._cells.bounds
+        if bounds is None:
+            return 1
+        return bounds[3]
 
 
     @property
@@ -360,10 +400,10 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        min_col = 1
-        if self._cells:
-            min_col = min(c[1] for c in self._cells)
-        return min_col
+        bounds = self._cells.bounds
+        if bounds is None:
+            return 1
+        return bounds[0]
 
 
     @property
@@ -372,10 +412,10 @@ class Worksheet(_WorkbookChild):
 
         :type: int
         """
-        max_col = 1
-        if self._cells:
-            max_col = max(c[1] for c in self._cells)
-        return max_col
+        bounds = self._cells.bounds
+        if bounds is None:
+            return 1
+        return bounds[2]
 
 
     def calculate_dimension(self):
@@ -383,18 +423,10 @@ class Worksheet(_WorkbookChild):
 
         :rtype: string
         """
-        if self._cells:
-            rows = set()
-            cols = set()
-            for row, col in self._cells:
-                rows.add(row)
-                cols.add(col)
-            max_row = max(rows)
-            max_col = max(cols)
-            min_col = min(cols)
-            min_row = min(rows)
-        else:
+        bounds = self._cells.bounds
+        if bounds is None:
             return "A1:A1"
+        min_col, min_row, max_col, max_row = bounds
 
         return f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}"
 
@@ -405,7 +437,7 @@ class Worksheet(_WorkbookChild):
         return self.calculate_dimension()
 
 
-    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False):
+    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False, sparse=False):
         """
         Produces cells from the worksheet, by row. Specify the iteration range
         using indices of rows and columns.
@@ -429,6 +461,9 @@ class Worksheet(_WorkbookChild):
         :param values_only: whether only cell values should be returned
         :type values_only: bool
 
+        :param sparse: whether missing cells should be returned as empty cells instead of being created
+        :type sparse: bool
+
         :rtype: generator
         """
 
@@ -441,18 +476,58 @@ class Worksheet(_WorkbookChild):
         max_col = max_col or self.max_column
         max_row = max_row or self.max_row
 
-        return self._cells_by_row(min_col, min_row, max_col, max_row, values_only)
+        return self._cells_by_row(min_col, min_row, max_col, max_row, values_only, sparse)
 
 
-    def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False):
+    def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False, sparse=False):
+        get = self._cells.get
+        columns = range(min_col, max_col + 1)
         for row in range(min_row, max_row + 1):
-            cells = (self.cell(row=row, column=column) for column in range(min_col, max_col + 1))
+            if not sparse:
+                cells = (self.cell(row=row, column=column) for column in columns)
+            elif self._cells.row_count(row):
+                cells = (get((row, column), EMPTY_CELL) for column in columns)
+            else:
+                cells = (EMPTY_CELL for column in columns)
             if values_only:
                 yield tuple(cell.value for cell in cells)
             else:
                 yield tuple(cells)
 
 
+    def iter_cells(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False):
+        """
+        Produces only the cells which exist in the worksheet, by row and then
+        column. Specify the range using indices of rows and columns.
+
+        No cells are created.
+
+        :param min_col: smallest column index (1-based index)
+        :type min_col: int
+
+        :param min_row: smallest row index (1-based index)
+        :type min_row: int
+
+        :param max_col: largest column index (1-based index)
+        :type max_col: int
+
+        :param max_row: largest row index (1-based index)
+        :type max_row: int
+
+        :param values_only: whether only cell values should be returned
+        :type values_only: bool
+
+        :rtype: generator
+        """
+        store = self._cells
+        for row in store.row_indices(min_row, max_row):
+            for cell in store.row_cells(row, min_col, max_col):
+                if values_only:
+                    yield cell.value
+                else:
+                    yield cell
+
+
     @property
     def rows(self):
         """Produces all cells in the worksheet, by row (see :func:`iter_rows`)
@@ -472,7 +547,7 @@ class Worksheet(_WorkbookChild):
             yield row
 
 
-    def iter_cols(self, min_col=None, max_col=None, min_row=None, max_row=None, values_only=False):
+    def iter_cols(self, min_col=None, max_col=None, min_row=None, max_row=None, values_only=False, sparse=False):
         """
         Produces cells from the worksheet, by column. Specify the iteration range
         using indices of rows and columns.
@@ -496,6 +571,9 @@ class Worksheet(_WorkbookChild):
         :param values_only: whether only cell values should be returned
         :type values_only: bool
 
+        :param sparse: whether missing cells should be returned as empty cells instead of being created
+        :type sparse: bool
+
         :rtype: generator
         """
 
@@ -507,16 +585,22 @@ class Worksheet(_WorkbookChild):
         max_col = max_col or self.max_column
         max_row = max_row or self.max_row
 
-        return self._cells_by_col(min_col, min_row, max_col, max_row, values_only)
+        return self._cells_by_col(min_col, min_row, max_col, max_row, values_only, sparse)
 
 
-    def _cells_by_col(self, min_col, min_row, max_col, max_row, values_only=False):
+    def _cells_by_col(self, min_col, min_row, max_col, max_row, values_only=False, sparse=False):
         """
         Get cells by column
         """
+        get = self._cells.get
+        rows = range(min_row, max_row + 1)
         for column in range(min_col, max_col+1):
-            cells = (self.cell(row=row, column=column)
-                        for row in range(min_row, max_row+1))
+            if not sparse:
+                cells = (self.cell(row=row, column=column) for row in rows)
+            elif self._cells.column_count(column):
+                cells = (get((row, column), EMPTY_CELL) for row in rows)
+            else:
+                cells = (EMPTY_CELL for row in rows)
             if values_only:
                 yield tuple(cell.value for cell in cells)
             else:
@@ -611,13 +695,23 @@ class Worksheet(_WorkbookChild):
         and recreate the lost border information.
         Borders are then applied
         """
-        cells = mcr.cells
-        next(cells) # skip first cell
-        for row, col in cells:
-            self._cells[row, col] = MergedCell(self, row, col)
+        self._remove_merged_cells(mcr)
         mcr.format()
 
 
+    def _remove_merged_cells(self, cr):
+        """
+        Remove any cells other than the top-left one in a range. Cells
+        covered by a merged range are only created where they are needed.
+        """
+        store = self._cells
+        start = cr.min_row, cr.min_col
+        for row in store.row_indices(cr.min_row, cr.max_row):
+            for col in store.row_columns(row, cr.min_col, cr.max_col):
+                if (row, col) != start:
+                    del store[row, col]
+
+
     @property
     @deprecated("Use ws.merged_cells.ranges")
     def merged_cell_ranges(self):
@@ -634,11 +728,7 @@ class Worksheet(_WorkbookChild):
             raise ValueError("Cell range {0} is not merged".format(cr.coord))
 
         self.merged_cells.remove(cr)
-
-        cells = cr.cells
-        next(cells) # skip first cell
-        for row, col in cells:
-            del self._cells[(row, col)]
+        self._remove_merged_cells(cr)
 
 
     def append(self, iterable):
@@ -701,74 +791,266 @@ class Worksheet(_WorkbookChild):
         if row_or_col == 'row':
             cells = self.iter_rows(min_row=min_row)
             row_offset = offset
-            key = 0
         else:
             cells = self.iter_cols(min_col=min_col)
             col_offset = offset
-            key = 1
         cells = list(cells)
 
-        for row, column in sorted(self._cells, key=itemgetter(key), reverse=reverse):
-            if min_row and row < min_row:
-                continue
-            elif min_col and column < min_col:
-                continue
-
-            self._move_cell(row, column, row_offset, col_offset)
-
-
-    def insert_rows(self, idx, amount=1):
+        # cells only collide with others in the same column when rows move
+        # and with others in the same row when columns move
+        store = self._cells
+        rows = store.row_indices(min_row)
+        if reverse and row_offset:
+            rows.reverse()
+        for row in rows:
+            columns = store.row_columns(row, min_col)
+            if reverse and col_offset:
+                columns.reverse()
+            for column in columns:
+                self._move_cell(row, column, row_offset, col_offset)
+
+
+    def insert_rows(self, idx, amount=1, translate=False):
         """
-        Insert row or rows before row==idx
+        Insert row or rows before row==idx.
+        If translate is True references to moved cells are updated and
+        merged cells, conditional formats and data validations are moved.
         """
+        if translate:
+            self._remap(rows=IndexMap.insertion([(idx, amount)], MAX_ROW), translate=True)
+            return
+
         self._move_cells(min_row=idx, offset=amount, row_or_col="row")
         self._current_row = self.max_row
+        self._cells_moved()
 
 
-    def insert_cols(self, idx, amount=1):
+    def insert_cols(self, idx, amount=1, translate=False):
         """
-        Insert column or columns before col==idx
+        Insert column or columns before col==idx.
+        If translate is True references to moved cells are updated and
+        merged cells, conditional formats and data validations are moved.
         """
+        if translate:
+            self._remap(cols=IndexMap.insertion([(idx, amount)], MAX_COLUMN), translate=True)
+            return
+
         self._move_cells(min_col=idx, offset=amount, row_or_col="column")
+        self._cells_moved()
 
 
-    def delete_rows(self, idx, amount=1):
+    def delete_rows(self, idx, amount=1, translate=False):
         """
-        Delete row or rows from row==idx
+        Delete row or rows from row==idx.
+        If translate is True references to moved or deleted cells are updated
+        and merged cells, conditional formats and data validations are moved.
         """
+        if translate:
+            self._remap(rows=IndexMap.deletion([(idx, amount)], MAX_ROW), translate=True)
+            return
 
         remainder = _gutter(idx, amount, self.max_row)
 
         self._move_cells(min_row=idx+amount, offset=-amount, row_or_col="row")
 
-        # calculating min and max col is an expensive operation, do it only once
         min_col = self.min_column
         max_col = self.max_column + 1
         for row in remainder:
+            if not self._cells.row_count(row):
+                continue
             for col in range(min_col, max_col):
                 if (row, col) in self._cells:
                     del self._cells[row, col]
         self._current_row = self.max_row
         if not self._cells:
             self._current_row = 0
+        self._cells_moved()
 
 
-    def delete_cols(self, idx, amount=1):
+    def delete_cols(self, idx, amount=1, translate=False):
         """
-        Delete column or columns from col==idx
+        Delete column or columns from col==idx.
+        If translate is True references to moved or deleted cells are updated
+        and merged cells, conditional formats and data validations are moved.
         """
+        if translate:
+            self._remap(cols=IndexMap.deletion([(idx, amount)], MAX_COLUMN), translate=True)
+            return
 
         remainder = _gutter(idx, amount, self.max_column)
 
         self._move_cells(min_col=idx+amount, offset=-amount, row_or_col="column")
 
-        # calculating min and max row is an expensive operation, do it only once
         min_row = self.min_row
         max_row = self.max_row + 1
         for col in remainder:
+            if not self._cells.column_count(col):
+                continue
             for row in range(min_row, max_row):
                 if (row, col) in self._cells:
                     del self._cells[row, col]
+        self._cells_moved()
+
+
+    def insert_rows_many(self, blocks, translate=False):
+        """
+        Insert several blocks of rows at once. Blocks are row indices or
+        (idx, amount) pairs and refer to the rows before any insertion.
+        If translate is True references to moved cells are updated.
+        """
+        self._remap(rows=IndexMap.insertion(blocks, MAX_ROW), translate=translate)
+
+
+    def insert_cols_many(self, blocks, translate=False):
+        """
+        Insert several blocks of columns at once. Blocks are column indices or
+        (idx, amount) pairs and refer to the columns before any insertion.
+        If translate is True references to moved cells are updated.
+        """
+        self._remap(cols=IndexMap.insertion(blocks, MAX_COLUMN), translate=translate)
+
+
+    def delete_rows_many(self, blocks, translate=False):
+        """
+        Delete several blocks of rows at once. Blocks are row indices or
+        (idx, amount) pairs and refer to the rows before any deletion.
+        If translate is True references to moved or deleted cells are updated.
+        """
+        self._remap(rows=IndexMap.deletion(blocks, MAX_ROW), translate=translate)
+
+
+    def delete_cols_many(self, blocks, translate=False):
+        """
+        Delete several blocks of columns at once. Blocks are column indices or
+        (idx, amount) pairs and refer to the columns before any deletion.
+        If translate is True references to moved or deleted cells are updated.
+        """
+        self._remap(cols=IndexMap.deletion(blocks, MAX_COLUMN), translate=translate)
+
+
+    def _rewrite_references(self, rows=None, cols=None):
+        """
+        Update formulae and defined names throughout the workbook which refer
+        to rows or columns of this worksheet that have been moved or deleted
+        """
+        wb = self.parent
+        if wb._references is None:
+            wb._references = ReferenceIndex(wb)
+        with shard_lock(wb._references):
+            wb._references.rewrite(self, rows, cols)
+
+
+    def _cells_moved(self):
+        """
+        Rebuild the workbook's index of the references between formulae and
+        cells, if there is one, after cells have been moved or deleted
+        """
+        index = getattr(self.parent, "_references", None)
+        if index is not None and index.tracks_cells:
+            with shard_lock(index):
+                index.rebuild()
+
+
+    def _remap(self, rows=None, cols=None, translate=False):
+        """
+        Renumber cells, dimensions, merged cells, hyperlinks, conditional
+        formatting and data validations in a single pass
+        """
+        if not rows and not cols:
+            return
+        get_row = rows.get if rows else None
+        get_col = cols.get if cols else None
+
+        store = self._cells
+        cells = []
+        for row in store.row_indices():
+            new_row = row
+            if get_row is not None:
+                new_row = get_row(row)
+                if new_row is None:
+                    continue
+            for cell in store.row_cells(row):
+                new_col = cell.column
+                if get_col is not None:
+                    new_col = get_col(new_col)
+                    if new_col is None:
+                        continue
+                if new_row != row or new_col != cell.column:
+                    _leave_shared_formula(cell)
+                cell.column = new_col
+                cell.row = new_row
+                if cell.hyperlink is not None:
+                    cell.hyperlink.ref = cell.coordinate
+                if cell.data_type == "f" and isinstance(cell._value, ArrayFormula):
+                    ref = CellRange(cell._value.ref)
+                    if _remap_range(ref, rows, cols):
+                        cell._value.ref = ref.coord
+                cells.append(cell)
+        store.clear()
+        for cell in cells:
+            store[cell.row, cell.column] = cell
+
+        if rows:
+            dims = []
+            for idx, dim in self.row_dimensions.items():
+                idx = get_row(idx)
+                if idx is not None:
+                    dim.index = idx
+                    dims.append((idx, dim))
+            self.row_dimensions.clear()
+            self.row_dimensions.update(dims)
+
+        if cols:
+            dims = []
+            for dim in self.column_dimensions.values():
+                dim.reindex()
+                span = cols.span(dim.min, dim.max)
+                if span is not None:
+                    dim.min, dim.max = span
+                    dim.index = get_column_letter(dim.min)
+                    dims.append((dim.index, dim))
+            self.column_dimensions.clear()
+            self.column_dimensions.update(dims)
+
+        remapped = [mcr for mcr in self.merged_cells.ranges if _remap_range(mcr, rows, cols)]
+        self.merged_cells = MultiCellRange(
+            [mcr for mcr in remapped if mcr.min_row != mcr.max_row or mcr.min_col != mcr.max_col])
+        for mcr in remapped:
+            self._remap_merge_range(mcr)
+
+        for dv in self.data_validations.dataValidation:
+            dv.sqref = MultiCellRange([cr for cr in dv.sqref if _remap_range(cr, rows, cols)])
+        self.data_validations.dataValidation = [dv for dv in self.data_validations.dataValidation if dv.sqref]
+
+        cf_rules = self.conditional_formatting._cf_rules
+        remapped = type(cf_rules)()
+        for cf, rules in cf_rules.items():
+            cf.sqref = MultiCellRange([cr for cr in cf.sqref if _remap_range(cr, rows, cols)])
+            if cf.sqref:
+                remapped.setdefault(cf, []).extend(rules)
+        self.conditional_formatting._cf_rules = remapped
+
+        self._current_row = self.max_row
+        if not self._cells:
+            self._current_row = 0
+
+        if translate:
+            self._rewrite_references(rows, cols)
+        self._cells_moved()
+
+
+    def _remap_merge_range(self, mcr):
+        """
+        Make sure that after renumbering a merged range starts with a normal
+        cell and ends with a MergedCell. Rows or columns inserted into it are
+        covered by the range.
+        """
+        store = self._cells
+        start = mcr.min_row, mcr.min_col
+        if isinstance(store.get(start), MergedCell):
+            del store[start]
+        mcr.start_cell = self.cell(*start)
+        self.cell(mcr.max_row, mcr.max_col)
 
 
     def move_range(self, cell_range, rows=0, cols=0, translate=False):
@@ -799,6 +1081,7 @@ class Worksheet(_WorkbookChild):
 
         # rebase moved range
         cell_range.shift(row_shift=rows, col_shift=cols)
+        self._cells_moved()
 
 
     def _move_cell(self, row, column, row_offset, col_offset, translate=False):
@@ -808,10 +1091,10 @@ class Worksheet(_WorkbookChild):
         Rebase coordinate
         """
         cell = self._get_cell(row, column)
+        _leave_shared_formula(cell)
         new_row = cell.row + row_offset
         new_col = cell.column + col_offset
-        self._cells[new_row, new_col] = cell
-        del self._cells[(cell.row, cell.column)]
+        self._cells.move((cell.row, cell.column), (new_row, new_col))
         cell.row = new_row
         cell.column = new_col
         if translate and cell.data_type == "f":
@@ -908,3 +1191,29 @@ def _gutter(idx, offset, max_val):
     """
     gutter = range(max(max_val+1-offset, idx), min(idx+offset, max_val)+1)
     return gutter
+
+
+def _leave_shared_formula(cell):
+    """
+    Give a cell its own copy of its formula if it belongs to a shared
+    formula group, so that it keeps it when it is moved.
+    """
+    if cell._value.__class__ is SharedFormula:
+        cell._value = cell.value
+
+
+def _remap_range(cr, rows=None, cols=None):
+    """
+    Renumber a cell range in place. Return False if none of it is left.
+    """
+    if rows:
+        span = rows.span(cr.min_row, cr.max_row)
+        if span is None:
+            return False
+        cr.min_row, cr.max_row = span
+    if cols:
+        span = cols.span(cr.min_col, cr.max_col)
+        if span is None:
+            return False
+        cr.min_col, cr.max_col = span
+    return True